@@ -82,21 +82,28 @@ def _load_agent_spec(agent_name: str, skip_local: bool = False) -> str:
   Raises:
     FileNotFoundError: If agent not found in either location
   """
+  return _agent_spec_bytes(agent_name, skip_local=skip_local).decode("utf-8")
+
+
+def _agent_spec_bytes(agent_name: str, skip_local: bool = False) -> bytes:
+  """
+  Load agent spec as raw bytes, using the same search order as _load_agent_spec.
+
+  _run_init_agent only copies the spec to disk, so it writes these bytes
+  directly instead of decoding and re-encoding the markdown.
+  """
   agent_filename = f"{agent_name}.md"
 
   # Try root agents/ first (development mode) - unless skip_local is True
   if not skip_local:
     root_agent_path = os.path.join(os.getcwd(), "agents", agent_filename)
     if os.path.isfile(root_agent_path):
-      with open(root_agent_path, "r", encoding="utf-8") as f:
+      with open(root_agent_path, "rb") as f:
         return f.read()
 
   # Fallback to packaged resources (installed mode)
   try:
-    with resources.open_text(
-      "drtrace_service.resources.agents", agent_filename, encoding="utf-8"
-    ) as f:
-      return f.read()
+    return resources.files("drtrace_service.resources.agents").joinpath(agent_filename).read_bytes()
   except FileNotFoundError as e:
     raise FileNotFoundError(
       f"Agent '{agent_name}' not found in agents/ or installed packages. "
@@ -155,7 +162,7 @@ def _run_init_agent(args: list[str]) -> None:
   # Load agent spec from root agents/ or packaged resources
   # When --force is specified, skip local agents/ to ensure we get the default spec
   try:
-    default_contents = _load_agent_spec(parsed.agent, skip_local=parsed.force)
+    default_contents = _agent_spec_bytes(parsed.agent, skip_local=parsed.force)
   except FileNotFoundError as e:
     print(f"Error: {e}", file=sys.stderr)
     sys.exit(1)
@@ -180,7 +187,7 @@ def _run_init_agent(args: list[str]) -> None:
       print(f"Existing agent file backed up to {backup_path}")
 
   # Write default contents
-  with open(target_path, "w", encoding="utf-8") as f:
+  with open(target_path, "wb") as f:
     f.write(default_contents)
 
   print(f"Default {parsed.agent} agent spec written to {target_path}")
@@ -702,11 +709,16 @@ def _run_init_project(args: list[str]) -> None:
     default=".",
     help="Project root directory (default: current directory)",
   )
+  parser.add_argument(
+    "--defaults",
+    action="store_true",
+    help="Accept the default answer for every prompt (non-interactive, e.g. CI)",
+  )
 
   parsed = parser.parse_args(args)
 
   try:
-    exit_code = run_init_project(Path(parsed.project_root))
+    exit_code = run_init_project(Path(parsed.project_root), use_defaults=parsed.defaults)
     sys.exit(exit_code)
   except Exception as e:
     print(f"Error: {e}", file=sys.stderr)
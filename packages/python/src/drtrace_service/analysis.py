@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import copy
+import json
+import logging
+import threading
+import time
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from . import storage
 from .ai_model import get_ai_model
@@ -31,7 +42,7 @@ def map_log_to_snippet(
 
 
 def map_logs_to_snippets(
-  logs: List[LogRecord],
+  logs: Iterable[LogRecord],
   context_lines: int = 5,
   roots: Optional[List[Path]] = None,
 ) -> List[LogWithSnippet]:
@@ -56,6 +67,9 @@ def map_logs_to_snippets(
   return results
 
 
+_LEVEL_PRIORITY = {"DEBUG": 0, "INFO": 1, "WARN": 2, "ERROR": 3, "CRITICAL": 4}
+
+
 def analyze_time_range(
   application_id: str,
   start_ts: float,
@@ -83,9 +97,30 @@ def analyze_time_range(
   Returns:
     List of LogRecord objects matching the criteria, ordered by timestamp descending
   """
+  records = _iter_time_range(
+    application_id=application_id,
+    start_ts=start_ts,
+    end_ts=end_ts,
+    module_name=module_name,
+    service_name=service_name,
+    limit=limit,
+  )
+  return _filter_min_level(records, min_level)
+
+
+def _iter_time_range(
+  application_id: str,
+  start_ts: float,
+  end_ts: float,
+  module_name: Optional[Union[str, List[str]]],
+  service_name: Optional[Union[str, List[str]]],
+  limit: int,
+) -> Iterable[LogRecord]:
+  """Stream the newest `limit` records in [start_ts, end_ts], before level filtering."""
   backend = storage.get_storage()
-  # Storage interface accepts single values or lists, so pass directly
-  records = backend.query_time_range(
+  # Storage interface accepts single values or lists, so pass directly.
+  # Records are streamed so rows dropped by the level filter are never held.
+  return backend.iter_time_range(
     start_ts=start_ts,
     end_ts=end_ts,
     application_id=application_id,
@@ -94,21 +129,143 @@ def analyze_time_range(
     limit=limit,
   )
 
-  # Apply additional filters that aren't in the base query
-  filtered_records: List[LogRecord] = []
-  level_priority = {"DEBUG": 0, "INFO": 1, "WARN": 2, "ERROR": 3, "CRITICAL": 4}
 
-  for record in records:
-    # Filter by minimum level if specified
-    if min_level:
-      record_level_priority = level_priority.get(record.level.upper(), -1)
-      min_level_priority = level_priority.get(min_level.upper(), -1)
-      if record_level_priority < min_level_priority:
-        continue
+def _filter_min_level(records: Iterable[LogRecord], min_level: Optional[str]) -> List[LogRecord]:
+  """Keep records at or above min_level (all records when min_level is empty)."""
+  if not min_level:
+    return list(records)
+
+  level_priority = _LEVEL_PRIORITY
+  min_level_priority = level_priority.get(min_level)
+  if min_level_priority is None:
+    min_level_priority = level_priority.get(min_level.upper(), -1)
+  # Levels normally arrive in canonical case, so only fall back to upper()
+  # for the odd record whose level is not already a table key.
+  return [
+    record for record in records
+    if (
+      level_priority[record.level] if record.level in level_priority
+      else level_priority.get(record.level.upper(), -1)
+    ) >= min_level_priority
+  ]
 
-    filtered_records.append(record)
 
-  return filtered_records
+# Wide analysis windows are split into fixed-width buckets that are queried
+# concurrently; each bucket maps onto a narrow index range in storage.
+ANALYSIS_BUCKET_SECONDS = 3600.0
+MAX_ANALYSIS_BUCKETS = 24
+# Bucket queries kept in flight ahead of the one being merged
+BUCKET_PREFETCH = 4
+
+
+def _time_buckets(start_ts: float, end_ts: float, bucket_seconds: float) -> List[tuple[float, float]]:
+  """
+  Split [start_ts, end_ts] into bucket-aligned sub-ranges, newest first.
+
+  Bucket boundaries are aligned to multiples of bucket_seconds; only the first
+  and last sub-ranges are clipped to the requested window.
+  """
+  first = int(start_ts // bucket_seconds)
+  last = int(end_ts // bucket_seconds)
+  buckets: List[tuple[float, float]] = []
+  for index in range(last, first - 1, -1):
+    lo = max(start_ts, index * bucket_seconds)
+    hi = min(end_ts, (index + 1) * bucket_seconds)
+    if lo <= hi:
+      buckets.append((lo, hi))
+  return buckets
+
+
+def analyze_time_range_bucketed(
+  application_id: str,
+  start_ts: float,
+  end_ts: float,
+  min_level: Optional[str] = None,
+  module_name: Optional[Union[str, List[str]]] = None,
+  service_name: Optional[Union[str, List[str]]] = None,
+  limit: int = 100,
+  bucket_seconds: float = ANALYSIS_BUCKET_SECONDS,
+) -> List[LogRecord]:
+  """
+  Same contract as analyze_time_range, but fans wide windows out per bucket.
+
+  Windows no wider than one bucket are delegated to analyze_time_range
+  directly. Otherwise buckets are fetched on a thread pool, BUCKET_PREFETCH
+  ahead, and merged newest bucket first, which preserves the descending
+  timestamp order without a global sort. As in the single query, `limit`
+  caps the merged rows before the level filter, so both paths return the
+  same records. The bucket width grows when needed so that at most
+  MAX_ANALYSIS_BUCKETS sub-queries are issued.
+  """
+  span = end_ts - start_ts
+  if span <= bucket_seconds:
+    return analyze_time_range(
+      application_id=application_id,
+      start_ts=start_ts,
+      end_ts=end_ts,
+      min_level=min_level,
+      module_name=module_name,
+      service_name=service_name,
+      limit=limit,
+    )
+
+  bucket_seconds = max(bucket_seconds, span / MAX_ANALYSIS_BUCKETS)
+  buckets = _time_buckets(start_ts, end_ts, bucket_seconds)
+  newest_hi = buckets[0][1]
+
+  def fetch_bucket(bounds: tuple[float, float], bucket_limit: int) -> List[LogRecord]:
+    lo, hi = bounds
+    return list(_iter_time_range(
+      application_id=application_id,
+      start_ts=lo,
+      end_ts=hi,
+      module_name=module_name,
+      service_name=service_name,
+      limit=bucket_limit,
+    ))
+
+  # The limit applies once, to the merged newest-first stream, exactly as in
+  # the single query: buckets are consumed in order and the fan-out stops as
+  # soon as `limit` rows are collected. Only a few buckets are fetched ahead.
+  collected: List[LogRecord] = []
+  upcoming = iter(buckets)
+  in_flight: "deque[tuple[tuple[float, float], Future]]" = deque()
+
+  with ThreadPoolExecutor(max_workers=min(len(buckets), BUCKET_PREFETCH)) as pool:
+    def submit_next() -> None:
+      bounds = next(upcoming, None)
+      if bounds is not None:
+        in_flight.append((bounds, pool.submit(fetch_bucket, bounds, limit)))
+
+    for _ in range(BUCKET_PREFETCH):
+      submit_next()
+
+    try:
+      while in_flight and len(collected) < limit:
+        bounds, future = in_flight.popleft()
+        submit_next()
+        records = future.result()
+        remaining = limit - len(collected)
+        bucket_limit = limit
+        while True:
+          # Storage ranges are inclusive on both ends; rows on the shared
+          # upper edge were already taken from the newer neighbouring bucket.
+          skip = 0
+          if bounds[1] != newest_hi:
+            while skip < len(records) and records[skip].ts >= bounds[1]:
+              skip += 1
+          # Stop unless the per-query limit cut the bucket short of what is
+          # still needed once edge rows are dropped; then fetch deeper.
+          if len(records) < bucket_limit or len(records) - skip >= remaining:
+            break
+          bucket_limit = skip + remaining
+          records = fetch_bucket(bounds, bucket_limit)
+        collected.extend(records[skip:skip + remaining])
+    finally:
+      for _bounds, future in in_flight:
+        future.cancel()
+
+  return _filter_min_level(collected, min_level)
 
 
 @dataclass
@@ -161,7 +318,7 @@ class AnalysisInput:
 
 
 def prepare_ai_analysis_input(
-  logs: List[LogRecord],
+  logs: Iterable[LogRecord],
   context_lines: int = 5,
   roots: Optional[List[Path]] = None,
 ) -> AnalysisInput:
@@ -173,8 +330,11 @@ def prepare_ai_analysis_input(
   2. Creates a structured format that includes both log details and code context
   3. Handles logs without file_path/line_no gracefully (includes log without snippet)
 
+  The logs are consumed in a single pass, so a streaming iterator works as
+  well as a list; the summary metadata is accumulated alongside the entries.
+
   Args:
-    logs: List of LogRecord objects to analyze
+    logs: LogRecord objects to analyze (list or iterator)
     context_lines: Number of context lines to include around target line (default: 5)
     roots: Optional source roots for file resolution (defaults to configured roots)
 
@@ -184,8 +344,19 @@ def prepare_ai_analysis_input(
   # Map logs to snippets
   log_snippets = map_logs_to_snippets(logs, context_lines=context_lines, roots=roots)
 
-  # Build structured entries
+  # Build structured entries and summary metadata in one pass
   entries: List[LogWithCodeEntry] = []
+  logs_with_code = 0
+  error_logs = 0
+  start_ts: Optional[float] = None
+  end_ts: Optional[float] = None
+  # Component breakdown for cross-module analysis. Each distinct name gets a
+  # small integer slot on first sight and counts live in unboxed arrays.
+  service_index: Dict[str, int] = {}
+  service_counts = array("I")
+  module_index: Dict[str, int] = {}
+  module_counts = array("I")
+
   for i, log_snippet in enumerate(log_snippets):
     log = log_snippet.log
     snippet = log_snippet.snippet
@@ -217,6 +388,7 @@ def prepare_ai_analysis_input(
         ],
         snippet_ok=True,
       )
+      logs_with_code += 1
     elif log.file_path and log.line_no and not snippet.ok:
       # Log has file/line but snippet retrieval failed
       code_entry = CodeSnippetEntry(
@@ -229,33 +401,40 @@ def prepare_ai_analysis_input(
 
     entries.append(LogWithCodeEntry(log=log_entry, code_snippet=code_entry))
 
-  # Build summary metadata
-  total_logs = len(logs)
-  logs_with_code = sum(1 for e in entries if e.code_snippet and e.code_snippet.snippet_ok)
-  logs_without_code = total_logs - logs_with_code
-  error_logs = sum(1 for log in logs if log.level.upper() in ("ERROR", "CRITICAL"))
-
-  # Component breakdown for cross-module analysis
-  services: Dict[str, int] = {}
-  modules: Dict[str, int] = {}
-  for log in logs:
-    if log.service_name:
-      services[log.service_name] = services.get(log.service_name, 0) + 1
-    if log.module_name:
-      modules[log.module_name] = modules.get(log.module_name, 0) + 1
-
+    if log.level.upper() in ("ERROR", "CRITICAL"):
+      error_logs += 1
+    if start_ts is None or log.ts < start_ts:
+      start_ts = log.ts
+    if end_ts is None or log.ts > end_ts:
+      end_ts = log.ts
+    svc = log.service_name
+    if svc:
+      slot = service_index.get(svc)
+      if slot is None:
+        slot = service_index[svc] = len(service_counts)
+        service_counts.append(0)
+      service_counts[slot] += 1
+    mod = log.module_name
+    if mod:
+      slot = module_index.get(mod)
+      if slot is None:
+        slot = module_index[mod] = len(module_counts)
+        module_counts.append(0)
+      module_counts[slot] += 1
+
+  total_logs = len(entries)
   summary = {
     "total_logs": total_logs,
     "logs_with_code_context": logs_with_code,
-    "logs_without_code_context": logs_without_code,
+    "logs_without_code_context": total_logs - logs_with_code,
     "error_logs": error_logs,
     "time_range": {
-      "start_ts": min(log.ts for log in logs) if logs else None,
-      "end_ts": max(log.ts for log in logs) if logs else None,
+      "start_ts": start_ts,
+      "end_ts": end_ts,
     },
     "components": {
-      "services": services,
-      "modules": modules,
+      "services": dict(zip(service_index, service_counts)),
+      "modules": dict(zip(module_index, module_counts)),
     },
   }
 
@@ -796,6 +975,232 @@ class CrossModuleAnalysisResult:
   logs_by_component: Dict[str, List[str]]  # Maps component identifiers to log IDs
 
 
+class AnalysisResultCache:
+  """
+  Small in-memory LRU cache with per-entry TTL for analysis results.
+
+  Cross-module analysis is expensive (storage scan + AI call) and dashboards
+  tend to re-issue identical requests on refresh, so results are kept for a
+  short time keyed by the full parameter tuple. Expired entries are evicted
+  lazily on read.
+  """
+
+  def __init__(self, max_size: int = 100, ttl_seconds: float = 300.0) -> None:
+    self.max_size = max_size
+    self.ttl_seconds = ttl_seconds
+    self._entries: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: tuple) -> Optional[Any]:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      expires_at, value = entry
+      if time.monotonic() >= expires_at:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+      return value
+
+  def set(self, key: tuple, value: Any) -> None:
+    with self._lock:
+      self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+
+_cross_module_cache = AnalysisResultCache(max_size=100, ttl_seconds=300.0)
+_explanation_cache = AnalysisResultCache(max_size=256, ttl_seconds=60.0)
+
+
+def clear_analysis_cache() -> None:
+  """Drop all cached cross-module results and root-cause explanations."""
+  _cross_module_cache.clear()
+  _explanation_cache.clear()
+
+
+# Cache keys round the time window down to the widest of these bucket widths
+# (seconds) that is at most a tenth of the window, so refreshes of a relative
+# window ("last 5m") share an entry while windows under 10s are keyed exactly.
+_CACHE_BUCKET_WIDTHS = (60.0, 15.0, 5.0, 1.0)
+
+
+def _cache_time_bucket(start_ts: float, end_ts: float) -> tuple:
+  span = (end_ts - start_ts) / 10.0
+  for width in _CACHE_BUCKET_WIDTHS:
+    if width <= span:
+      return (width, start_ts // width, end_ts // width)
+  return (None, start_ts, end_ts)
+
+
+def _cross_module_cache_key(
+  application_id: str,
+  start_ts: float,
+  end_ts: float,
+  min_level: Optional[str],
+  module_names: Optional[List[str]],
+  service_names: Optional[List[str]],
+  limit: int,
+  context_lines: int,
+  roots: Optional[List[Path]],
+  model: Any,
+) -> tuple:
+  return (
+    application_id,
+    _cache_time_bucket(start_ts, end_ts),
+    min_level,
+    tuple(sorted(module_names or ())),
+    tuple(sorted(service_names or ())),
+    limit,
+    context_lines,
+    tuple(str(root) for root in roots) if roots else None,
+    # Keyed by id() as in explain_logs; the entry keeps the model alive and
+    # is checked by identity on a hit
+    id(model),
+  )
+
+
+def explain_logs(records: List[LogRecord], context_lines: int = 5) -> RootCauseExplanation:
+  """
+  Prepare analysis input for records and generate a root-cause explanation.
+
+  The raw model response is cached briefly, keyed on the fully built prompt and
+  the active AI model, so rerunning the same debugging query does not call the
+  model again. Anything that changes the prompt (log fields, stacktraces, source
+  snippets on disk) or a switch via set_ai_model() produces a fresh call. The
+  response is always parsed against the current records.
+  """
+  input_data = prepare_ai_analysis_input(records, context_lines=context_lines)
+  prompt = build_analysis_prompt(input_data)
+  model = get_ai_model()
+
+  # Keyed by id() so models need not be hashable; the cached entry keeps the
+  # model alive and is checked by identity, so a reused id cannot match.
+  cache_key = (id(model), prompt)
+  cached = _explanation_cache.get(cache_key)
+  if cached is not None and cached[0] is model:
+    response = cached[1]
+  else:
+    response = model.generate_explanation(prompt)
+    _explanation_cache.set(cache_key, (model, response))
+
+  explanation = parse_model_response(response, input_data)
+  explanation.evidence_references = extract_evidence_references(explanation, input_data)
+  return explanation
+
+
+_telemetry_logger = logging.getLogger("drtrace_service.analysis.telemetry")
+
+
+class QueryTelemetry:
+  """
+  Structured timing record for a single analysis call.
+
+  Sub-phases are timed with phase() and emit() writes one JSON record to the
+  "drtrace_service.analysis.telemetry" logger at INFO level. Telemetry is off
+  unless that logger is enabled for INFO; while it is off, no request id is
+  generated and no timers run at all.
+  """
+
+  def __init__(self, operation: str, **fields: Any) -> None:
+    self.enabled = _telemetry_logger.isEnabledFor(logging.INFO)
+    self.phases_ms: Dict[str, float] = {}
+    if not self.enabled:
+      return
+    self.record: Dict[str, Any] = {"operation": operation, "request_id": uuid.uuid4().hex[:12]}
+    self.record.update(fields)
+    self._started = time.perf_counter()
+
+  @contextmanager
+  def phase(self, name: str) -> Iterator[None]:
+    if not self.enabled:
+      yield
+      return
+    started = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.phases_ms[name] = round((time.perf_counter() - started) * 1000.0, 3)
+
+  def emit(self, **fields: Any) -> None:
+    if not self.enabled:
+      return
+    self.record.update(fields)
+    self.record["phases_ms"] = self.phases_ms
+    self.record["duration_ms"] = round((time.perf_counter() - self._started) * 1000.0, 3)
+    _telemetry_logger.info("query_telemetry %s", json.dumps(self.record, default=str))
+
+
+_ENTRY_LOG = attrgetter("log")
+_COMPONENT_COLUMNS = attrgetter("service_name", "module_name", "log_id")
+
+
+def _group_log_ids_by_component(
+  entries: List[LogWithCodeEntry],
+  service_names: Optional[List[str]],
+  module_names: Optional[List[str]],
+) -> Dict[str, List[str]]:
+  """
+  Group log_ids under "service:<name>" and "module:<name>" keys.
+  """
+  # A single service + single module filter means storage only returned logs
+  # from that pair, so every log lands in both buckets.
+  if service_names and len(service_names) == 1 and module_names and len(module_names) == 1:
+    log_ids = [entry.log.log_id for entry in entries]
+    return {
+      "service:" + service_names[0]: log_ids,
+      "module:" + module_names[0]: list(log_ids),
+    }
+
+  # When the caller names the components, the key set is known up front, so
+  # seed the dict at full size instead of growing it inside the loop.
+  logs_by_component: Dict[str, List[str]] = {}
+  seeded = bool(service_names or module_names)
+  for name in service_names or ():
+    logs_by_component["service:" + name] = []
+  for name in module_names or ():
+    logs_by_component["module:" + name] = []
+
+  # Bind hot lookups to locals once; this loop runs once per returned log.
+  # The three columns are pulled per row by a single C-level attrgetter call.
+  logs_by_component_setdefault = logs_by_component.setdefault
+
+  # Records arrive in timestamp order and logs from one component cluster in
+  # time, so consecutive rows usually share a component. Track the current
+  # run and only hit the dict (and build the prefixed key) when it changes.
+  run_svc: Optional[str] = None
+  run_mod: Optional[str] = None
+  svc_ids: List[str] = []
+  mod_ids: List[str] = []
+
+  for svc, mod, lid in map(_COMPONENT_COLUMNS, map(_ENTRY_LOG, entries)):
+    if svc:
+      if svc != run_svc:
+        run_svc = svc
+        svc_ids = logs_by_component_setdefault("service:" + svc, [])
+      svc_ids.append(lid)
+
+    if mod:
+      if mod != run_mod:
+        run_mod = mod
+        mod_ids = logs_by_component_setdefault("module:" + mod, [])
+      mod_ids.append(lid)
+
+  if seeded:
+    # Seeded components that matched no logs are left out.
+    return {key: log_ids for key, log_ids in logs_by_component.items() if log_ids}
+  return logs_by_component
+
+
 def analyze_cross_module_incident(
   application_id: str,
   start_ts: float,
@@ -812,6 +1217,9 @@ def analyze_cross_module_incident(
 
   This function retrieves logs from multiple components, prepares analysis input,
   generates root-cause explanation, and returns component-level context.
+  Non-empty results are cached for a short time (see AnalysisResultCache) so
+  repeated requests for the same filters, model and time bucket (see
+  _cache_time_bucket) skip the storage query and AI call.
 
   Args:
     application_id: Required application identifier
@@ -827,18 +1235,37 @@ def analyze_cross_module_incident(
   Returns:
     CrossModuleAnalysisResult with explanation and component breakdown
   """
-  # Query logs across components
-  records = analyze_time_range(
+  telemetry = QueryTelemetry(
+    "cross_module",
     application_id=application_id,
-    start_ts=start_ts,
-    end_ts=end_ts,
-    min_level=min_level,
-    module_name=module_names,
-    service_name=service_names,
+    time_range=[start_ts, end_ts],
     limit=limit,
   )
+  model = get_ai_model()
+  cache_key = _cross_module_cache_key(
+    application_id, start_ts, end_ts, min_level, module_names, service_names, limit, context_lines, roots, model
+  )
+  cached = _cross_module_cache.get(cache_key)
+  if cached is not None and cached[0] is model:
+    telemetry.emit(cache_hit=True)
+    # Callers get their own copy, so mutating a result cannot leak into
+    # later hits
+    return copy.deepcopy(cached[1])
+
+  # Query logs across components
+  with telemetry.phase("storage_scan"):
+    records = analyze_time_range_bucketed(
+      application_id=application_id,
+      start_ts=start_ts,
+      end_ts=end_ts,
+      min_level=min_level,
+      module_name=module_names,
+      service_name=service_names,
+      limit=limit,
+    )
 
   if not records:
+    telemetry.emit(cache_hit=False, n_points_scanned=0, n_components=0)
     # Return empty result structure
     empty_explanation = RootCauseExplanation(
       summary="No logs found for the specified time range and component filters.",
@@ -851,37 +1278,27 @@ def analyze_cross_module_incident(
     )
 
   # Prepare analysis input
-  input_data = prepare_ai_analysis_input(records, context_lines=context_lines, roots=roots)
+  with telemetry.phase("prepare_input"):
+    input_data = prepare_ai_analysis_input(records, context_lines=context_lines, roots=roots)
 
   # Generate explanation
-  explanation = generate_root_cause_explanation(input_data, context_lines=context_lines, roots=roots)
-
-  # Build component breakdown
-  services: Dict[str, int] = {}
-  modules: Dict[str, int] = {}
-  logs_by_service: Dict[str, List[str]] = {}
-  logs_by_module: Dict[str, List[str]] = {}
-
-  for entry in input_data.logs:
-    log = entry.log
-    if log.service_name:
-      services[log.service_name] = services.get(log.service_name, 0) + 1
-      if log.service_name not in logs_by_service:
-        logs_by_service[log.service_name] = []
-      logs_by_service[log.service_name].append(log.log_id)
-
-    if log.module_name:
-      modules[log.module_name] = modules.get(log.module_name, 0) + 1
-      if log.module_name not in logs_by_module:
-        logs_by_module[log.module_name] = []
-      logs_by_module[log.module_name].append(log.log_id)
-
-  # Combine logs_by_component
-  logs_by_component: Dict[str, List[str]] = {}
-  for service, log_ids in logs_by_service.items():
-    logs_by_component[f"service:{service}"] = log_ids
-  for module, log_ids in logs_by_module.items():
-    logs_by_component[f"module:{module}"] = log_ids
+  with telemetry.phase("llm"):
+    explanation = generate_root_cause_explanation(input_data, context_lines=context_lines, roots=roots)
+
+  # Build component breakdown. Per-component counts were already accumulated
+  # by prepare_ai_analysis_input; only the log_id lists are grouped here.
+  services: Dict[str, int] = input_data.summary["components"]["services"]
+  modules: Dict[str, int] = input_data.summary["components"]["modules"]
+  with telemetry.phase("breakdown"):
+    logs_by_component = _group_log_ids_by_component(input_data.logs, service_names, module_names)
+
+  telemetry.emit(
+    cache_hit=False,
+    n_points_scanned=len(records),
+    n_services=len(services),
+    n_modules=len(modules),
+    n_components=len(services) + len(modules),
+  )
 
   components = {
     "services": services,
@@ -889,12 +1306,10 @@ def analyze_cross_module_incident(
     "total_components": len(services) + len(modules),
   }
 
-  return CrossModuleAnalysisResult(
+  result = CrossModuleAnalysisResult(
     explanation=explanation,
     components=components,
     logs_by_component=logs_by_component,
   )
-
-
-
-
+  _cross_module_cache.set(cache_key, (model, copy.deepcopy(result)))
+  return result
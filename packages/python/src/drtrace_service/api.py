@@ -1,28 +1,42 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import json
+import math
 import os
 import re
-from datetime import datetime, timedelta, timezone
+import struct
+import time
+from datetime import datetime, timezone
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-from fastapi import FastAPI, HTTPException, Query, status
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from . import analysis, help_agent_interface, storage
-from .models import LogBatch
+from .models import LogBatch, LogRecord
 from .status import get_status
 
-app = FastAPI(title="DrTrace Daemon", version="0.1.0")
+# orjson encodes the large record/explanation payloads much faster than stdlib json
+app = FastAPI(title="DrTrace Daemon", version="0.1.0", default_response_class=ORJSONResponse)
 
 
 # -----------------------------------------------------------------------------
 # Time Parsing Utilities (Story API-1)
 # -----------------------------------------------------------------------------
 
+_RELATIVE_TIME_RE = re.compile(r'^(\d+)([smhd])$', re.IGNORECASE)
+_UNIT_TO_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
 def parse_time_param(value: str, is_end: bool = False) -> float:
     """Parse human-readable time to Unix timestamp.
 
@@ -45,34 +59,72 @@ def parse_time_param(value: str, is_end: bool = False) -> float:
     value = value.strip()
 
     # Try relative time first (e.g., "5m", "1h", "2d", "30s")
-    relative_match = re.match(r'^(\d+)([smhd])$', value, re.IGNORECASE)
+    relative_match = _RELATIVE_TIME_RE.match(value)
     if relative_match:
         amount = int(relative_match.group(1))
         unit = relative_match.group(2).lower()
-        unit_map = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days'}
-        delta = timedelta(**{unit_map[unit]: amount})
-        return (datetime.now(timezone.utc) - delta).timestamp()
+        return time.time() - amount * _UNIT_TO_SECONDS[unit]
+
+    return _parse_absolute_time(value, is_end)
+
 
-    # Try ISO 8601 with timezone
+def _is_number(value: str) -> bool:
+    """True if value parses as a float (signed, fractional, inf or nan)."""
     try:
-        dt = datetime.fromisoformat(value)
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute_time(value: str, is_end: bool) -> float:
+    """Parse an ISO 8601 or Unix timestamp string (see parse_time_param).
+
+    The format is picked up front from the characters present instead of
+    trying each parser in turn, and results are memoized because polling
+    clients resend the same absolute bounds.
+    """
+    if "T" in value or ":" in value or (value[4:5] == "-" and value[:4].isdigit()):
+        # ISO 8601, optionally with timezone; "Z" is spelled out for < 3.11
+        iso_value = value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value
+        try:
+            dt = datetime.fromisoformat(iso_value)
+        except ValueError:
+            raise ValueError(f"Cannot parse time: {value}") from None
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.timestamp()
-    except ValueError:
-        pass
 
-    # Try Unix timestamp (integer or float)
+    # Unix timestamp (integer or float)
     try:
         ts = float(value)
-        # If integer and is_end, add 0.999999 to get end of second
-        if is_end and ts == int(ts):
-            ts += 0.999999
-        return ts
     except ValueError:
-        pass
+        raise ValueError(f"Cannot parse time: {value}") from None
+    # If integer and is_end, add 0.999999 to get end of second
+    if is_end and ts == int(ts):
+        ts += 0.999999
+    return ts
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_message_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a message_regex pattern, caching the result for repeat queries.
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    return re.compile(pattern)
 
-    raise ValueError(f"Cannot parse time: {value}")
+
+# Patterns made only of these characters mean the same thing as a regex and
+# as an ILIKE substring (no '.', '_' or '%'), so they can take the cheaper
+# message_contains path.
+_LITERAL_PATTERN_RE = re.compile(r"[A-Za-z0-9 :/-]+")
+
+# A quantified group whose body is itself quantified, e.g. "(a+)+" or "(.*)*".
+# These backtrack catastrophically on non-matching input.
+_NESTED_QUANTIFIER_RE = re.compile(r"\((?:[^()\\]|\\.)*[+*](?:[^()\\]|\\.)*\)(?:[+*]|\{\d*,)")
 
 
 # -----------------------------------------------------------------------------
@@ -89,30 +141,73 @@ LEVEL_ORDER = {
 }
 
 
+# Levels at or above each level, computed once; there are only a handful of inputs.
+_LEVELS_AT_OR_ABOVE = {
+    min_level: tuple(level for level, order in LEVEL_ORDER.items() if order >= min_order)
+    for min_level, min_order in LEVEL_ORDER.items()
+}
+
+
 def get_levels_at_or_above(min_level: str) -> List[str]:
     """Get all levels at or above the specified minimum level."""
-    min_level_upper = min_level.upper()
-    if min_level_upper not in LEVEL_ORDER:
+    levels = _LEVELS_AT_OR_ABOVE.get(min_level)
+    if levels is None:
+        levels = _LEVELS_AT_OR_ABOVE.get(min_level.upper())
+    if levels is None:
         raise ValueError(f"Unknown level: {min_level}")
+    return list(levels)
+
 
-    min_order = LEVEL_ORDER[min_level_upper]
-    return [level for level, order in LEVEL_ORDER.items() if order >= min_order]
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"})
+_INVALID_LEVEL_MESSAGE = f"min_level must be one of: {', '.join(sorted(_VALID_LEVELS))}"
+
+
+def _normalize_level(min_level: Optional[str]) -> Optional[str]:
+    """Validate an analysis endpoint's min_level and return it uppercased.
+
+    Raises:
+        HTTPException: 400 INVALID_LEVEL if the level is not recognized
+    """
+    if not min_level:
+        return None
+    if min_level in _VALID_LEVELS:
+        # Already canonical (the common case); skip allocating an uppercased copy
+        return min_level
+    level = min_level.upper()
+    if level not in _VALID_LEVELS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_LEVEL", "message": _INVALID_LEVEL_MESSAGE},
+        )
+    return level
 
 
 # -----------------------------------------------------------------------------
 # Pagination Utilities (Story API-4)
 # -----------------------------------------------------------------------------
 
+# Cursor wire format: 8-byte big-endian float ts followed by the UTF-8 id,
+# urlsafe base64 without padding. Cheaper than a JSON round trip per page.
+_CURSOR_TS = struct.Struct(">d")
+
+
 def encode_cursor(ts: float, record_id: str) -> str:
-    """Encode cursor as base64 JSON."""
-    cursor_data = {"ts": ts, "id": record_id}
-    return base64.urlsafe_b64encode(json.dumps(cursor_data).encode()).decode()
+    """Encode cursor as base64 of packed ts + id."""
+    raw = _CURSOR_TS.pack(ts) + record_id.encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
 
 
 def decode_cursor(cursor: str) -> dict:
-    """Decode cursor from base64 JSON."""
+    """Decode cursor produced by encode_cursor (or the older base64 JSON form)."""
     try:
-        return json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        if raw[:1] == b"{":
+            # Legacy base64 JSON cursor; still accepted so in-flight pagination works
+            return json.loads(raw.decode())
+        (ts,) = _CURSOR_TS.unpack_from(raw)
+        if not math.isfinite(ts):
+            raise ValueError("non-finite cursor ts")
+        return {"ts": ts, "id": raw[_CURSOR_TS.size:].decode()}
     except Exception:
         raise ValueError("Invalid cursor format")
 
@@ -133,6 +228,18 @@ app.add_middleware(
 )
 
 
+# Response serializers, built once. Dumping a whole list through one adapter
+# avoids a Python-level model_dump()/dict build per item.
+_LOG_RECORDS_ADAPTER = TypeAdapter(List[LogRecord])
+_EXPLANATION_ADAPTER = TypeAdapter(analysis.RootCauseExplanation)
+
+
+def _explanation_to_dict(explanation: analysis.RootCauseExplanation) -> Dict[str, object]:
+    """Convert a RootCauseExplanation into the response shape shared by analysis endpoints."""
+    # raw_response is the unparsed model output, kept for debugging only
+    return _EXPLANATION_ADAPTER.dump_python(explanation, exclude={"raw_response"})
+
+
 # Request/Response models for /help/guide/* endpoints
 class StartGuideRequest(BaseModel):
     """Request model for POST /help/guide/start"""
@@ -161,8 +268,52 @@ async def status_endpoint() -> Dict[str, object]:
   return get_status()
 
 
+async def get_backend() -> storage.LogStorage:
+  """
+  Dependency resolving the storage backend for request handlers.
+
+  storage.get_storage() already memoizes the backend per process; going
+  through a dependency also lets callers swap it via app.dependency_overrides.
+  Declared async so FastAPI does not hop to the threadpool to resolve it.
+  """
+  return storage.get_storage()
+
+
+_LOG_TS = attrgetter("ts")
+
+# /logs/query pages larger than this are streamed (see _stream_query_response)
+STREAM_RESPONSE_MIN_LIMIT = 200
+
+
+def _stream_query_response(records: Iterator[LogRecord], limit: int) -> Iterator[bytes]:
+  """
+  Yield a /logs/query response body incrementally.
+
+  Produces the same JSON document as the list-based path, serializing one
+  record at a time. `records` is the limit+1 row stream from storage; it is
+  consumed to the end so the backend can release its cursor.
+  """
+  yield b'{"results":['
+  count = 0
+  last = None
+  has_more = False
+  for record in records:
+    if count == limit:
+      has_more = True
+      continue
+    if count:
+      yield b","
+    yield orjson.dumps(record.model_dump())
+    last = record
+    count += 1
+
+  next_cursor = encode_cursor(last.ts, str(last.ts)) if has_more and last is not None else None
+  tail = orjson.dumps({"count": count, "has_more": has_more, "next_cursor": next_cursor})
+  yield b"]," + tail[1:]
+
+
 @app.post("/logs/ingest", status_code=status.HTTP_202_ACCEPTED)
-async def ingest_logs(batch: LogBatch) -> Dict[str, int]:
+async def ingest_logs(batch: LogBatch, backend: storage.LogStorage = Depends(get_backend)) -> Dict[str, int]:
   """
   Ingestion endpoint for batched log events.
 
@@ -170,25 +321,30 @@ async def ingest_logs(batch: LogBatch) -> Dict[str, int]:
   the storage layer.
   """
   import logging
-  import time
 
   logger = logging.getLogger(__name__)
-  now = time.time()
-
-  # Check for suspicious timestamps
-  for log in batch.logs:
-    if log.ts > now + 300:  # More than 5 minutes in future
-      logger.warning(f"Log timestamp {log.ts} is {log.ts - now:.1f}s in the future")
-    if log.ts < now - 86400:  # More than 1 day in past
-      logger.warning(f"Log timestamp {log.ts} is {now - log.ts:.1f}s in the past")
+  logs = batch.logs
 
-  # Check for identical timestamps in batch
-  timestamps = [log.ts for log in batch.logs]
-  unique_timestamps = len(set(timestamps))
-  if unique_timestamps == 1 and len(batch.logs) > 1:
-    logger.warning(f"All {len(batch.logs)} logs in batch have identical timestamp {timestamps[0]}")
+  # Suspicious-timestamp checks only produce warnings; skip the scan entirely
+  # when nobody would see them. min()/max() run in C, and the per-item counting
+  # loops only run when a bound is actually crossed.
+  if logs and logger.isEnabledFor(logging.WARNING):
+    now = time.time()
+    future_limit = now + 300  # More than 5 minutes in future
+    past_limit = now - 86400  # More than 1 day in past
+    timestamps = list(map(_LOG_TS, logs))
+    min_ts = min(timestamps)
+    max_ts = max(timestamps)
+
+    if max_ts > future_limit:
+      future = sum(1 for ts in timestamps if ts > future_limit)
+      logger.warning(f"{future} log timestamp(s) in the future, up to {max_ts - now:.1f}s ahead")
+    if min_ts < past_limit:
+      past = sum(1 for ts in timestamps if ts < past_limit)
+      logger.warning(f"{past} log timestamp(s) in the past, up to {now - min_ts:.1f}s behind")
+    if min_ts == max_ts and len(timestamps) > 1:
+      logger.warning(f"All {len(timestamps)} logs in batch have identical timestamp {min_ts}")
 
-  backend = storage.get_storage()
   backend.write_batch(batch)
   return {"accepted": len(batch.logs)}
 
@@ -225,6 +381,10 @@ async def query_logs(
     None,
     description="POSIX regex pattern for message matching (mutually exclusive with message_contains)"
   ),
+  message_invert: bool = Query(
+    False,
+    description="Return records that do NOT match message_contains/message_regex"
+  ),
   min_level: Optional[str] = Query(
     None,
     description="Minimum log level: DEBUG, INFO, WARN, ERROR, CRITICAL"
@@ -235,6 +395,7 @@ async def query_logs(
     description="Pagination cursor from previous response's next_cursor"
   ),
   limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
+  backend: storage.LogStorage = Depends(get_backend),
 ) -> Dict[str, object]:
   """
   Query logs with flexible time formats, filters, and pagination.
@@ -256,8 +417,9 @@ async def query_logs(
   **Pagination**:
   Use `cursor` from response's `next_cursor` to fetch the next page.
   Response includes `has_more` (boolean) and `next_cursor` (string or null).
+  Pages with `limit` above 200 are streamed; the JSON document is the same.
   """
-  now = datetime.now(timezone.utc).timestamp()
+  now = time.time()
 
   # Determine start time (Story API-1)
   if since:
@@ -308,9 +470,10 @@ async def query_logs(
           "message": "Pattern too long (max 500 characters)"
         }
       )
-    # Try to compile the pattern to catch syntax errors early
+    # Try to compile the pattern to catch syntax errors early. The pattern
+    # text is still what storage receives (Postgres evaluates it with ~*).
     try:
-      re.compile(message_regex)
+      _compile_message_regex(message_regex)
     except re.error as e:
       raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -319,20 +482,29 @@ async def query_logs(
           "message": f"Invalid regex pattern: {str(e)}"
         }
       )
-
-  # Validate min_level (Story API-3)
-  if min_level:
-    try:
-      get_levels_at_or_above(min_level)
-    except ValueError:
+    if _LITERAL_PATTERN_RE.fullmatch(message_regex):
+      # Plain text: a substring search gives the same matches without the regex engine
+      message_contains, message_regex = message_regex, None
+    elif _NESTED_QUANTIFIER_RE.search(message_regex):
       raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail={
-          "code": "INVALID_LEVEL",
-          "message": f"Invalid min_level '{min_level}'. Valid levels: DEBUG, INFO, WARN, ERROR, CRITICAL"
+          "code": "INVALID_PATTERN",
+          "message": "Pattern too expensive: nested quantifiers such as '(a+)+' are not allowed"
         }
       )
 
+  # Validate min_level (Story API-3); WARNING is accepted as an alias here
+  level = (min_level if min_level in _LEVELS_AT_OR_ABOVE else min_level.upper()) if min_level else None
+  if level and level not in _LEVELS_AT_OR_ABOVE:
+    raise HTTPException(
+      status_code=status.HTTP_400_BAD_REQUEST,
+      detail={
+        "code": "INVALID_LEVEL",
+        "message": f"Invalid min_level '{min_level}'. Valid levels: DEBUG, INFO, WARN, ERROR, CRITICAL"
+      }
+    )
+
   # Decode cursor (Story API-4)
   after_cursor = None
   if cursor:
@@ -345,18 +517,32 @@ async def query_logs(
       )
 
   # Fetch limit+1 to determine has_more (Story API-4)
-  backend = storage.get_storage()
-  records = backend.query_time_range(
+  query_filters = dict(
     start_ts=start,
     end_ts=end,
     application_id=application_id,
     module_name=module_name,
     message_contains=message_contains,
     message_regex=message_regex,
-    min_level=min_level.upper() if min_level else None,
+    min_level=level,
     after_cursor=after_cursor,
     limit=limit + 1,  # Fetch one extra to check has_more
   )
+  if message_invert:
+    # Only forwarded when set so backends without the filter keep working
+    query_filters["message_invert"] = True
+
+  # Large pages are streamed row by row instead of being built in memory
+  if limit > STREAM_RESPONSE_MIN_LIMIT:
+    rows = backend.iter_time_range(**query_filters)
+    # Run the query and fetch its first rows before the 200 status goes out,
+    # so a storage error fails the request as it does on the list path
+    first = next(rows, None)
+    if first is not None:
+      rows = chain((first,), rows)
+    return StreamingResponse(_stream_query_response(rows, limit), media_type="application/json")
+
+  records = backend.query_time_range(**query_filters)
 
   # Determine has_more and trim results (Story API-4)
   has_more = len(records) > limit
@@ -371,7 +557,7 @@ async def query_logs(
     next_cursor = encode_cursor(last.ts, str(last.ts))
 
   return {
-    "results": [r.model_dump() for r in records],
+    "results": _LOG_RECORDS_ADAPTER.dump_python(records),
     "count": len(records),
     "has_more": has_more,
     "next_cursor": next_cursor,
@@ -382,6 +568,7 @@ async def query_logs(
 async def clear_logs(
   application_id: str,
   environment: Optional[str] = Query(None, description="Optional environment scope (context.environment)"),
+  backend: storage.LogStorage = Depends(get_backend),
 ) -> Dict[str, int]:
   """
   Admin endpoint to clear logs scoped to a specific application_id.
@@ -392,8 +579,9 @@ async def clear_logs(
   if not application_id:
     raise HTTPException(status_code=400, detail="application_id is required")
 
-  backend = storage.get_storage()
   deleted = backend.delete_by_application(application_id, environment=environment)
+  # Cached analyses may describe the logs just deleted
+  analysis.clear_analysis_cache()
   return {"deleted": deleted}
 
 
@@ -409,7 +597,7 @@ async def analyze_time_range(
   module_name: Optional[str] = Query(None, description="Optional module_name filter"),
   service_name: Optional[str] = Query(None, description="Optional service_name filter"),
   limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
-) -> Dict[str, object]:
+) -> ORJSONResponse:
   """
   Time-range analysis endpoint for a single application.
 
@@ -430,29 +618,21 @@ async def analyze_time_range(
     )
 
   # Validate min_level if provided
-  valid_levels = {"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"}
-  if min_level and min_level.upper() not in valid_levels:
-    raise HTTPException(
-      status_code=status.HTTP_400_BAD_REQUEST,
-      detail={
-        "code": "INVALID_LEVEL",
-        "message": f"min_level must be one of: {', '.join(sorted(valid_levels))}",
-      },
-    )
+  level = _normalize_level(min_level)
 
   # Query logs
   records = analysis.analyze_time_range(
     application_id=application_id,
     start_ts=start_ts,
     end_ts=end_ts,
-    min_level=min_level.upper() if min_level else None,
+    min_level=level,
     module_name=module_name,
     service_name=service_name,
     limit=limit,
   )
 
   # Build response using standard envelope format
-  logs_data = [r.model_dump() for r in records]
+  logs_data = _LOG_RECORDS_ADAPTER.dump_python(records)
 
   meta = {
     "application_id": application_id,
@@ -471,12 +651,12 @@ async def analyze_time_range(
     meta["no_data"] = True
     meta["message"] = "No logs found for the specified time range and filters"
 
-  return {
+  return ORJSONResponse({
     "data": {
       "logs": logs_data,
     },
     "meta": meta,
-  }
+  })
 
 
 @app.get("/analysis/why")
@@ -491,7 +671,7 @@ async def analyze_why(
   module_name: Optional[str] = Query(None, description="Optional module_name filter"),
   service_name: Optional[str] = Query(None, description="Optional service_name filter"),
   limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
-) -> Dict[str, object]:
+) -> ORJSONResponse:
   """
   Root-cause analysis endpoint that generates explanations for errors.
 
@@ -514,22 +694,14 @@ async def analyze_why(
     )
 
   # Validate min_level if provided
-  valid_levels = {"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"}
-  if min_level and min_level.upper() not in valid_levels:
-    raise HTTPException(
-      status_code=status.HTTP_400_BAD_REQUEST,
-      detail={
-        "code": "INVALID_LEVEL",
-        "message": f"min_level must be one of: {', '.join(sorted(valid_levels))}",
-      },
-    )
+  level = _normalize_level(min_level)
 
   # Query logs
   records = analysis.analyze_time_range(
     application_id=application_id,
     start_ts=start_ts,
     end_ts=end_ts,
-    min_level=min_level.upper() if min_level else None,
+    min_level=level,
     module_name=module_name,
     service_name=service_name,
     limit=limit,
@@ -537,7 +709,7 @@ async def analyze_why(
 
   # Check if we have any logs
   if not records:
-    return {
+    return ORJSONResponse({
       "data": {
         "explanation": None,
         "message": "No logs found for the specified time range and filters",
@@ -549,47 +721,15 @@ async def analyze_why(
         "count": 0,
         "no_data": True,
       },
-    }
-
-  # Prepare analysis input
-  input_data = analysis.prepare_ai_analysis_input(records, context_lines=5)
+    })
 
-  # Generate root-cause explanation
-  explanation = analysis.generate_root_cause_explanation(input_data)
+  # Prepare analysis input and generate root-cause explanation
+  explanation = analysis.explain_logs(records, context_lines=5)
 
   # Convert to dict for JSON response
-  explanation_dict = {
-    "summary": explanation.summary,
-    "root_cause": explanation.root_cause,
-    "error_location": explanation.error_location,
-    "key_evidence": explanation.key_evidence,
-    "suggested_fixes": [
-      {
-        "description": fix.description,
-        "file_path": fix.file_path,
-        "line_no": fix.line_no,
-        "line_range": fix.line_range,
-        "related_log_ids": fix.related_log_ids,
-        "confidence": fix.confidence,
-        "rationale": fix.rationale,
-      }
-      for fix in explanation.suggested_fixes
-    ],
-    "confidence": explanation.confidence,
-    "has_clear_remediation": explanation.has_clear_remediation,
-    "evidence_references": [
-      {
-        "log_id": ref.log_id,
-        "reason": ref.reason,
-        "file_path": ref.file_path,
-        "line_no": ref.line_no,
-        "line_range": ref.line_range,
-      }
-      for ref in explanation.evidence_references
-    ],
-  }
+  explanation_dict = _explanation_to_dict(explanation)
 
-  return {
+  return ORJSONResponse({
     "data": {
       "explanation": explanation_dict,
     },
@@ -604,7 +744,7 @@ async def analyze_why(
         "service_name": service_name,
       },
     },
-  }
+  })
 
 
 @app.get("/queries")
@@ -749,7 +889,7 @@ async def delete_query(query_name: str) -> Dict[str, object]:
 @app.get("/analysis/query/{query_name}")
 async def analyze_with_query(
   query_name: str,
-  since: Optional[str] = Query(None, description="Override time window (e.g., '5m', '1h')"),
+  since: Optional[str] = Query(None, description="Override time window (e.g., '5m', '1h', or an ISO 8601 start time)"),
   start_ts: Optional[float] = Query(None, description="Override start time (Unix timestamp)"),
   end_ts: Optional[float] = Query(None, description="Override end time (Unix timestamp)"),
   application_id: Optional[str] = Query(None, description="Override application_id"),
@@ -757,7 +897,7 @@ async def analyze_with_query(
   module_names: Optional[List[str]] = Query(None, description="Override module names"),
   service_names: Optional[List[str]] = Query(None, description="Override service names"),
   limit: Optional[int] = Query(None, ge=1, le=1000, description="Override limit"),
-) -> Dict[str, object]:
+) -> ORJSONResponse:
   """
   Run analysis using a saved query with optional parameter overrides.
 
@@ -770,28 +910,21 @@ async def analyze_with_query(
   start_ts_override = start_ts
   end_ts_override = end_ts
   if since:
-    import time
-
-    now = time.time()
-    since_lower = since.lower().strip()
+    since_value = since.strip()
     try:
-      if since_lower.endswith("s"):
-        seconds = int(since_lower[:-1])
-      elif since_lower.endswith("m"):
-        seconds = int(since_lower[:-1]) * 60
-      elif since_lower.endswith("h"):
-        seconds = int(since_lower[:-1]) * 3600
-      elif since_lower.endswith("d"):
-        seconds = int(since_lower[:-1]) * 86400
-      else:
-        seconds = int(since_lower)
-      start_ts_override = now - seconds
-      end_ts_override = now
+      if since_value.isdigit():
+        # Bare numbers have always meant "seconds ago" here, not a Unix timestamp
+        since_value += "s"
+      elif _is_number(since_value):
+        # Negative or fractional offsets would otherwise parse as timestamps
+        raise ValueError(f"Invalid time window: {since}")
+      start_ts_override = parse_time_param(since_value, is_end=False)
     except ValueError:
       raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
-        detail={"code": "INVALID_TIME_FORMAT", "message": f"Invalid time format: {since}. Use format like '5m', '1h', '30s'"},
+        detail={"code": "INVALID_TIME_FORMAT", "message": f"Invalid time format: {since}. Use format like '5m', '1h', '30s' or an ISO 8601 time"},
       )
+    end_ts_override = time.time()
 
   # Resolve query parameters
   try:
@@ -826,38 +959,9 @@ async def analyze_with_query(
       limit=params["limit"],
     )
 
-    explanation_dict = {
-      "summary": result.explanation.summary,
-      "root_cause": result.explanation.root_cause,
-      "error_location": result.explanation.error_location,
-      "key_evidence": result.explanation.key_evidence,
-      "suggested_fixes": [
-        {
-          "description": fix.description,
-          "file_path": fix.file_path,
-          "line_no": fix.line_no,
-          "line_range": fix.line_range,
-          "related_log_ids": fix.related_log_ids,
-          "confidence": fix.confidence,
-          "rationale": fix.rationale,
-        }
-        for fix in result.explanation.suggested_fixes
-      ],
-      "confidence": result.explanation.confidence,
-      "has_clear_remediation": result.explanation.has_clear_remediation,
-      "evidence_references": [
-        {
-          "log_id": ref.log_id,
-          "reason": ref.reason,
-          "file_path": ref.file_path,
-          "line_no": ref.line_no,
-          "line_range": ref.line_range,
-        }
-        for ref in result.explanation.evidence_references
-      ],
-    }
+    explanation_dict = _explanation_to_dict(result.explanation)
 
-    return {
+    return ORJSONResponse({
       "data": {
         "explanation": explanation_dict,
         "components": result.components,
@@ -870,7 +974,7 @@ async def analyze_with_query(
         "end_ts": params["end_ts"],
         "components": result.components,
       },
-    }
+    })
   else:
     # Call why analysis
     # analyze_time_range accepts single values or lists, so pass lists directly
@@ -887,7 +991,7 @@ async def analyze_with_query(
     )
 
     if not records:
-      return {
+      return ORJSONResponse({
         "data": {
           "explanation": None,
           "message": "No logs found for the specified time range and filters",
@@ -900,43 +1004,13 @@ async def analyze_with_query(
           "count": 0,
           "no_data": True,
         },
-      }
+      })
 
-    input_data = analysis.prepare_ai_analysis_input(records, context_lines=5)
-    explanation = analysis.generate_root_cause_explanation(input_data)
+    explanation = analysis.explain_logs(records, context_lines=5)
 
-    explanation_dict = {
-      "summary": explanation.summary,
-      "root_cause": explanation.root_cause,
-      "error_location": explanation.error_location,
-      "key_evidence": explanation.key_evidence,
-      "suggested_fixes": [
-        {
-          "description": fix.description,
-          "file_path": fix.file_path,
-          "line_no": fix.line_no,
-          "line_range": fix.line_range,
-          "related_log_ids": fix.related_log_ids,
-          "confidence": fix.confidence,
-          "rationale": fix.rationale,
-        }
-        for fix in explanation.suggested_fixes
-      ],
-      "confidence": explanation.confidence,
-      "has_clear_remediation": explanation.has_clear_remediation,
-      "evidence_references": [
-        {
-          "log_id": ref.log_id,
-          "reason": ref.reason,
-          "file_path": ref.file_path,
-          "line_no": ref.line_no,
-          "line_range": ref.line_range,
-        }
-        for ref in explanation.evidence_references
-      ],
-    }
+    explanation_dict = _explanation_to_dict(explanation)
 
-    return {
+    return ORJSONResponse({
       "data": {
         "explanation": explanation_dict,
       },
@@ -947,7 +1021,7 @@ async def analyze_with_query(
         "end_ts": params["end_ts"],
         "count": len(records),
       },
-    }
+    })
 
 
 @app.get("/analysis/cross-module")
@@ -962,7 +1036,7 @@ async def analyze_cross_module(
   module_names: Optional[List[str]] = Query(None, description="Optional list of module names to include"),
   service_names: Optional[List[str]] = Query(None, description="Optional list of service names to include"),
   limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
-) -> Dict[str, object]:
+) -> ORJSONResponse:
   """
   Cross-module/service analysis endpoint for incidents spanning multiple components.
 
@@ -983,58 +1057,21 @@ async def analyze_cross_module(
     )
 
   # Validate min_level if provided
-  valid_levels = {"DEBUG", "INFO", "WARN", "ERROR", "CRITICAL"}
-  if min_level and min_level.upper() not in valid_levels:
-    raise HTTPException(
-      status_code=status.HTTP_400_BAD_REQUEST,
-      detail={
-        "code": "INVALID_LEVEL",
-        "message": f"min_level must be one of: {', '.join(sorted(valid_levels))}",
-      },
-    )
+  level = _normalize_level(min_level)
 
   # Perform cross-module analysis
   result = analysis.analyze_cross_module_incident(
     application_id=application_id,
     start_ts=start_ts,
     end_ts=end_ts,
-    min_level=min_level.upper() if min_level else None,
+    min_level=level,
     module_names=module_names,
     service_names=service_names,
     limit=limit,
   )
 
   # Convert explanation to dict
-  explanation_dict = {
-    "summary": result.explanation.summary,
-    "root_cause": result.explanation.root_cause,
-    "error_location": result.explanation.error_location,
-    "key_evidence": result.explanation.key_evidence,
-    "suggested_fixes": [
-      {
-        "description": fix.description,
-        "file_path": fix.file_path,
-        "line_no": fix.line_no,
-        "line_range": fix.line_range,
-        "related_log_ids": fix.related_log_ids,
-        "confidence": fix.confidence,
-        "rationale": fix.rationale,
-      }
-      for fix in result.explanation.suggested_fixes
-    ],
-    "confidence": result.explanation.confidence,
-    "has_clear_remediation": result.explanation.has_clear_remediation,
-    "evidence_references": [
-      {
-        "log_id": ref.log_id,
-        "reason": ref.reason,
-        "file_path": ref.file_path,
-        "line_no": ref.line_no,
-        "line_range": ref.line_range,
-      }
-      for ref in result.explanation.evidence_references
-    ],
-  }
+  explanation_dict = _explanation_to_dict(result.explanation)
 
   meta = {
     "application_id": application_id,
@@ -1048,14 +1085,14 @@ async def analyze_cross_module(
     "components": result.components,
   }
 
-  return {
+  return ORJSONResponse({
     "data": {
       "explanation": explanation_dict,
       "components": result.components,
       "logs_by_component": result.logs_by_component,
     },
     "meta": meta,
-  }
+  })
 
 
 @app.post("/help/guide/start")
@@ -1081,6 +1118,22 @@ async def start_guide(request: StartGuideRequest) -> Dict[str, object]:
         )
 
 
+# In-flight get_current_step calls keyed on project root. Concurrent requests
+# for the same project (e.g. several IDE windows polling) share a single call.
+_current_step_inflight: Dict[str, "asyncio.Future[str]"] = {}
+
+
+async def _coalesced_current_step(project_root: str) -> str:
+    """Return the current guide step, joining an identical call already running."""
+    future = _current_step_inflight.get(project_root)
+    if future is None:
+        future = asyncio.ensure_future(help_agent_interface.get_current_step(Path(project_root)))
+        _current_step_inflight[project_root] = future
+        future.add_done_callback(lambda _: _current_step_inflight.pop(project_root, None))
+    # shield: one caller disconnecting must not cancel the call the others await
+    return await asyncio.shield(future)
+
+
 @app.get("/help/guide/current")
 async def get_current_guide(project_root: str = Query(..., description="Project root directory path")) -> Dict[str, object]:
     """
@@ -1089,7 +1142,7 @@ async def get_current_guide(project_root: str = Query(..., description="Project
     Returns markdown-formatted current step information.
     """
     try:
-        content = await help_agent_interface.get_current_step(Path(project_root))
+        content = await _coalesced_current_step(project_root)
         return {
             "data": {"content": content},
             "meta": {"project_root": project_root}
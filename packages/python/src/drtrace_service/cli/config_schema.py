@@ -4,81 +4,106 @@ Configuration schema and validation for DrTrace projects.
 Defines the structure of _drtrace/config.json and provides validation helpers.
 """
 
-import json
+import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Mapping, Optional
 
+import orjson
 
-class ConfigSchema:
-    """Schema and validation for DrTrace configuration."""
 
-    # JSON Schema for config.json
-    SCHEMA = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": "DrTrace Project Configuration",
-        "type": "object",
-        "required": ["project_name", "application_id"],
-        "properties": {
-            "project_name": {
-                "type": "string",
-                "description": "Name of the project",
-                "minLength": 1,
-                "maxLength": 255
-            },
-            "application_id": {
-                "type": "string",
-                "description": "Unique application identifier",
-                "minLength": 1,
-                "maxLength": 255
-            },
-            "language": {
-                "type": "string",
-                "enum": ["python", "javascript", "cpp", "both"],
-                "default": "python"
-            },
-            "daemon_url": {
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data beside path and rename it over path.
+
+    Readers never see a half-written file; there is no per-file fsync.
+    """
+    tmp_path = path.with_suffix(f"{path.suffix}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+# JSON Schema for config.json. Read-only, since it is shared by every caller.
+_SCHEMA: Final[Mapping[str, Any]] = MappingProxyType({
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "DrTrace Project Configuration",
+    "type": "object",
+    "required": ["project_name", "application_id"],
+    "properties": {
+        "project_name": {
+            "type": "string",
+            "description": "Name of the project",
+            "minLength": 1,
+            "maxLength": 255
+        },
+        "application_id": {
+            "type": "string",
+            "description": "Unique application identifier",
+            "minLength": 1,
+            "maxLength": 255
+        },
+        "language": {
+            "type": "string",
+            "enum": ["python", "javascript", "cpp", "both"],
+            "default": "python"
+        },
+        "daemon_url": {
+            "type": "string",
+            "description": "URL of the DrTrace daemon (e.g., http://localhost:8001)",
+            "format": "uri",
+            "default": "http://localhost:8001"
+        },
+        "enabled": {
+            "type": "boolean",
+            "description": "Enable DrTrace by default",
+            "default": True
+        },
+        "environments": {
+            "type": "array",
+            "description": "List of environments to configure",
+            "items": {
                 "type": "string",
-                "description": "URL of the DrTrace daemon (e.g., http://localhost:8001)",
-                "format": "uri",
-                "default": "http://localhost:8001"
-            },
-            "enabled": {
-                "type": "boolean",
-                "description": "Enable DrTrace by default",
-                "default": True
+                "enum": ["development", "staging", "production", "ci"]
             },
-            "environments": {
-                "type": "array",
-                "description": "List of environments to configure",
-                "items": {
-                    "type": "string",
-                    "enum": ["development", "staging", "production", "ci"]
+            "default": ["development"]
+        },
+        "agent": {
+            "type": "object",
+            "description": "Agent configuration",
+            "properties": {
+                "enabled": {
+                    "type": "boolean",
+                    "description": "Enable agent interface",
+                    "default": False
                 },
-                "default": ["development"]
-            },
-            "agent": {
-                "type": "object",
-                "description": "Agent configuration",
-                "properties": {
-                    "enabled": {
-                        "type": "boolean",
-                        "description": "Enable agent interface",
-                        "default": False
-                    },
-                    "framework": {
-                        "type": "string",
-                        "enum": ["bmad", "langchain", "other"],
-                        "default": "bmad"
-                    }
+                "framework": {
+                    "type": "string",
+                    "enum": ["bmad", "langchain", "other"],
+                    "default": "bmad"
                 }
-            },
-            "created_at": {
-                "type": "string",
-                "description": "ISO 8601 timestamp of config creation"
             }
         },
-        "additionalProperties": False
-    }
+        "created_at": {
+            "type": "string",
+            "description": "ISO 8601 timestamp of config creation"
+        }
+    },
+    "additionalProperties": False
+})
+
+_DEFAULT_ENVIRONMENTS = ("development",)
+
+# What validate() checks, worked out once at import. validate() checks only
+# these fields; SCHEMA also documents keys and values that are not enforced.
+_REQUIRED_FIELDS = ("project_name", "application_id")
+_VALID_ENVIRONMENTS = frozenset(_SCHEMA["properties"]["environments"]["items"]["enum"])
+
+
+class ConfigSchema:
+    """Schema and validation for DrTrace configuration."""
+
+    # JSON Schema for config.json
+    SCHEMA = _SCHEMA
 
     @staticmethod
     def get_default_config(
@@ -92,15 +117,13 @@ class ConfigSchema:
         agent_framework: str = "bmad"
     ) -> Dict[str, Any]:
         """Generate a default configuration dictionary."""
-        from datetime import datetime, timezone
-
         return {
             "project_name": project_name,
             "application_id": application_id,
             "language": language,
             "daemon_url": daemon_url,
             "enabled": enabled,
-            "environments": environments or ["development"],
+            "environments": environments or list(_DEFAULT_ENVIRONMENTS),
             "agent": {
                 "enabled": agent_enabled,
                 "framework": agent_framework
@@ -116,9 +139,7 @@ class ConfigSchema:
         Returns:
             True if valid, raises ValueError if invalid.
         """
-        # Basic validation (full JSON schema validation requires jsonschema library)
-        required = ["project_name", "application_id"]
-        for field in required:
+        for field in _REQUIRED_FIELDS:
             if field not in config:
                 raise ValueError(f"Missing required field: {field}")
             if not isinstance(config[field], str) or not config[field]:
@@ -130,18 +151,22 @@ class ConfigSchema:
         if "environments" in config:
             if not isinstance(config["environments"], list):
                 raise ValueError("Field 'environments' must be a list")
-            valid_envs = {"development", "staging", "production", "ci"}
             for env in config["environments"]:
-                if env not in valid_envs:
+                if env not in _VALID_ENVIRONMENTS:
                     raise ValueError(f"Invalid environment: {env}")
 
         return True
 
     @staticmethod
-    def save(config: Dict[str, Any], path: Path) -> None:
-        """Save configuration to file."""
+    def dumps(config: Dict[str, Any]) -> bytes:
+        """Validate configuration and serialize it as it is written to disk."""
         ConfigSchema.validate(config)
-        path.write_text(json.dumps(config, indent=2))
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    @staticmethod
+    def save(config: Dict[str, Any], path: Path) -> None:
+        """Save configuration to file (atomically, see _write_bytes_atomic)."""
+        _write_bytes_atomic(path, ConfigSchema.dumps(config))
 
     @staticmethod
     def load(path: Path) -> Dict[str, Any]:
@@ -149,6 +174,7 @@ class ConfigSchema:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        config = json.loads(path.read_text())
+        config = orjson.loads(path.read_bytes())
         ConfigSchema.validate(config)
         return config
+
@@ -1,39 +1,70 @@
 """Grep command implementation for searching logs with POSIX regex."""
 
 import argparse
+import atexit
+import functools
+import io
 import os
 import re
 import sys
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import httpx
+import orjson
 
 from drtrace_service.daemon_health import check_daemon_alive
 from drtrace_service.storage import get_default_log_path
 
-# Cache for recent log reads to avoid repeated disk scans
-_log_cache: dict = {}
-_cache_ttl: float = 30.0  # 30 seconds
+# Compiled once at import; these run for every log line
+_DURATION_RE = re.compile(r'^(\d+)([mhd])$')
+_LOG_LINE_RE = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] \[([^\]]+)\] \[([^\]]+)\] (.*)$')
 
+# Pattern constructs that can see past a line's edges (string anchors and
+# lookarounds); patterns using them are searched line by line instead.
+_LINE_CONTEXT_TOKENS = ('\\A', '\\Z', '(?=', '(?!', '(?<')
 
-def _get_cached_log(log_path: Path) -> Optional[List[str]]:
-    """Get log from cache if fresh."""
-    now = time.time()
-    if log_path in _log_cache:
-        content, timestamp = _log_cache[log_path]
-        if now - timestamp < _cache_ttl:
-            return content
-        else:
-            del _log_cache[log_path]
-    return None
+# Patterns with no regex metacharacters (and no newline) are plain substrings
+_LITERAL_PATTERN_RE = re.compile(r'[^\\.^$*+?{}\[\]|()\n]+')
+
+# Shared HTTP client for daemon queries, created on first use so a run that
+# never reaches the daemon opens no connection pool.
+_http_client: Optional[httpx.Client] = None
 
+# Recently read log files, keyed on (path, st_mtime_ns, st_size) so an
+# unchanged file is served from memory and any write produces a new key.
+# Bounded LRU: the least recently used file is evicted first.
+_LOG_CACHE_MAX_ENTRIES = 8
+_log_cache: "OrderedDict[Tuple[Path, int, int], str]" = OrderedDict()
 
-def _cache_log(log_path: Path, lines: List[str]) -> None:
-    """Cache log file lines."""
-    _log_cache[log_path] = (lines, time.time())
+
+def _log_cache_key(log_path: Path) -> Tuple[Path, int, int]:
+    """Build the cache key for log_path from a single stat() call.
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = os.stat(log_path)
+    return (log_path, st.st_mtime_ns, st.st_size)
+
+
+def _get_cached_log(key: Tuple[Path, int, int]) -> Optional[str]:
+    """Get log file contents from cache if the file is unchanged."""
+    content = _log_cache.get(key)
+    if content is not None:
+        _log_cache.move_to_end(key)
+    return content
+
+
+def _cache_log(key: Tuple[Path, int, int], content: str) -> None:
+    """Cache log file contents, evicting the least recently used file if full."""
+    _log_cache[key] = content
+    _log_cache.move_to_end(key)
+    while len(_log_cache) > _LOG_CACHE_MAX_ENTRIES:
+        _log_cache.popitem(last=False)
 
 
 def _parse_time_duration(duration_str: str) -> Optional[timedelta]:
@@ -42,8 +73,7 @@ def _parse_time_duration(duration_str: str) -> Optional[timedelta]:
     Returns:
         timedelta object or None if invalid
     """
-    import re
-    match = re.match(r'^(\d+)([mhd])$', duration_str.strip().lower())
+    match = _DURATION_RE.match(duration_str.strip().lower())
     if not match:
         return None
 
@@ -65,9 +95,7 @@ def _parse_log_line(line: str) -> Optional[Tuple[datetime, str, str, str]]:
     Returns:
         Tuple of (datetime, service, level, message) or None if parse fails
     """
-    import re
-    pattern = r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] \[([^\]]+)\] \[([^\]]+)\] (.*)$'
-    match = re.match(pattern, line)
+    match = _LOG_LINE_RE.match(line)
     if not match:
         return None
 
@@ -78,13 +106,65 @@ def _parse_log_line(line: str) -> Optional[Tuple[datetime, str, str, str]]:
         return None
 
 
+def _get_http_client() -> httpx.Client:
+    """Return the shared keep-alive client used for daemon queries."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_epoch_second(second: int) -> str:
+    """Format a whole epoch second as local time; records often share a second."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+
+
+def _format_daemon_record(record: dict, line_number: bool) -> str:
+    """Format a /logs/query result dict as a grep output line."""
+    second = int(record['ts'])
+    service_str = f"[{record['service_name']}]" if record.get('service_name') else ""
+    msg = f"[{_format_epoch_second(second)}] {service_str} [{record['level']}] {record['message']}"
+    if line_number:
+        # Use timestamp as pseudo line number for daemon results
+        return f"{second}:{msg}"
+    return msg
+
+
+@functools.lru_cache(maxsize=8)
+def _format_cutoff(cutoff: datetime) -> str:
+    """Render a --since cutoff in the log line timestamp format."""
+    return cutoff.strftime('%Y-%m-%d %H:%M:%S')
+
+
+@functools.lru_cache(maxsize=64)
+def _is_literal_pattern(pattern: str) -> bool:
+    """Return True if pattern has no regex metacharacters (a plain substring)."""
+    return _LITERAL_PATTERN_RE.fullmatch(pattern) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str, flags: int) -> "re.Pattern[str]":
+    """Compile a user-supplied grep pattern once per (pattern, flags).
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    return re.compile(pattern, flags)
+
+
 def _should_include_line(
     line: str,
     pattern: str,
     ignore_case: bool,
     invert_match: bool,
     extended_regex: bool,
-    since: Optional[timedelta] = None
+    since: Optional[timedelta] = None,
+    cutoff: Optional[datetime] = None
 ) -> bool:
     """Determine if a line should be included based on filters.
 
@@ -95,38 +175,104 @@ def _should_include_line(
         invert_match: If True, invert match (include non-matching)
         extended_regex: If True, use POSIX extended regex
         since: If provided, only include lines after this duration
+        cutoff: Precomputed ``datetime.now() - since``; callers testing many
+            lines pass it so the clock is read once rather than per line
 
     Returns:
         True if line should be included, False otherwise
     """
     # Parse line if time filtering needed
-    parsed = None
-    if since:
-        parsed = _parse_log_line(line)
-        if parsed:
-            timestamp, _, _, _ = parsed
-            cutoff = datetime.now() - since
-            if timestamp < cutoff:
-                return False
-
-    # Pattern matching
-    flags = re.IGNORECASE if ignore_case else 0
-    try:
-        if extended_regex:
-            # Python's re module supports extended regex
-            match = re.search(pattern, line, flags)
-        else:
-            # Basic regex (just search, not extended)
-            match = re.search(pattern, line, flags)
-    except re.error:
-        # Invalid regex pattern
-        return False
+    # Pattern matching first: it is cheaper than parsing the timestamp, and a
+    # line the pattern rules out never needs its timestamp parsed at all.
+    # Plain substrings skip the regex engine (Python's re covers both basic
+    # and extended regex for the rest).
+    if not ignore_case and _is_literal_pattern(pattern):
+        match = pattern in line
+    else:
+        flags = re.IGNORECASE if ignore_case else 0
+        try:
+            match = _compile_pattern(pattern, flags).search(line)
+        except re.error:
+            # Invalid regex pattern
+            return False
 
     # Apply invert logic
-    if invert_match:
-        return not match
-    else:
-        return bool(match)
+    if bool(match) == invert_match:
+        return False
+
+    # Time filtering. The fixed-width timestamp text sorts like the time it
+    # names, so only lines at or before the cutoff's second pay for strptime.
+    if cutoff is None and since:
+        cutoff = datetime.now() - since
+    if cutoff is not None:
+        match = _LOG_LINE_RE.match(line)
+        if match and match.group(1) <= _format_cutoff(cutoff):
+            parsed = _parse_log_line(line)
+            if parsed:
+                timestamp, _, _, _ = parsed
+                if timestamp < cutoff:
+                    return False
+
+    return True
+
+
+def _iter_matching_lines(regex: "re.Pattern[str]", data: str) -> Iterator[Tuple[int, str]]:
+    """Yield (line_number, line) for each line of data that regex matches.
+
+    The regex engine scans the whole buffer, so Python code only runs once per
+    matching line rather than once per line. regex must be compiled with
+    re.MULTILINE so ^ and $ anchor at line boundaries, as they do when each
+    line is searched on its own.
+    """
+    size = len(data)
+    pos = 0
+    line_no = 1
+    counted = 0
+    while pos <= size:
+        match = regex.search(data, pos)
+        if match is None:
+            break
+        hit = match.start()
+        start = data.rfind('\n', 0, hit) + 1
+        if start == size and (size == 0 or data[-1] == '\n'):
+            # Empty match past the final newline; there is no line here
+            break
+        end = data.find('\n', hit)
+        if end == -1:
+            end = size
+        line = data[start:end]
+        pos = end + 1
+        if (match.end() > end or hit == start == end) and regex.search(line) is None:
+            # The match ran across a newline (or is an empty-line edge case);
+            # the line on its own doesn't match
+            continue
+        line_no += data.count('\n', counted, start)
+        counted = start
+        yield line_no, line
+
+
+def _iter_literal_lines(needle: str, data: str) -> Iterator[Tuple[int, str]]:
+    """Yield (line_number, line) for each line of data containing needle.
+
+    Same contract as _iter_matching_lines for a plain, non-empty substring
+    without newlines, but uses str.find instead of the regex engine.
+    """
+    size = len(data)
+    pos = 0
+    line_no = 1
+    counted = 0
+    while True:
+        hit = data.find(needle, pos)
+        if hit == -1:
+            break
+        start = data.rfind('\n', 0, hit) + 1
+        end = data.find('\n', hit + len(needle))
+        if end == -1:
+            end = size
+        line_no += data.count('\n', counted, start)
+        counted = start
+        yield line_no, data[start:end]
+        pos = end + 1
 
 
 def grep_command(args: Optional[List[str]] = None) -> int:
@@ -194,52 +340,31 @@ def grep_command(args: Optional[List[str]] = None) -> int:
                 params["message_regex"] = parsed_args.pattern
             else:
                 params["message_contains"] = parsed_args.pattern
+            if parsed_args.invert_match:
+                params["message_invert"] = "true"
 
             # Query daemon using httpx
             try:
-                response = httpx.get(daemon_url, params=params, timeout=5.0)
+                response = _get_http_client().get(daemon_url, params=params)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
             except (httpx.RequestError, httpx.HTTPStatusError):
                 # Daemon query failed, fall back to local file
                 raise
             else:
-                # Process daemon results
-                from drtrace_service.models import LogRecord
-
-                results = []
-                for record_dict in data.get("results", []):
-                    record = LogRecord(**record_dict)
-
-                    # Apply additional filters that weren't sent to API (invert_match, line_number)
-                    if parsed_args.invert_match:
-                        if parsed_args.extended_regex:
-                            flags = re.IGNORECASE if parsed_args.ignore_case else 0
-                            if re.search(parsed_args.pattern, record.message, flags):
-                                continue
-                        else:
-                            pattern_lower = parsed_args.pattern.lower() if parsed_args.ignore_case else parsed_args.pattern
-                            message_lower = record.message.lower() if parsed_args.ignore_case else record.message
-                            if pattern_lower in message_lower:
-                                continue
-
-                    # Format output
-                    ts_str = datetime.fromtimestamp(record.ts).strftime('%Y-%m-%d %H:%M:%S')
-                    service_str = f"[{record.service_name}]" if record.service_name else ""
-                    msg = f"[{ts_str}] {service_str} [{record.level}] {record.message}"
-
-                    if parsed_args.line_number:
-                        # Use timestamp as pseudo line number for daemon results
-                        results.append(f"{int(record.ts)}:{msg}")
-                    else:
-                        results.append(msg)
+                # The daemon already applied the pattern (and -v), so records are
+                # formatted straight from the JSON without building LogRecords
+                results = [
+                    _format_daemon_record(record, parsed_args.line_number)
+                    for record in data.get("results", [])
+                ]
 
                 # Output results
                 if parsed_args.count:
                     print(len(results))
                 elif results:
-                    for result in results:
-                        print(result)
+                    # One write for the whole result set instead of one per line
+                    print("\n".join(results))
                 else:
                     return 1
 
@@ -254,40 +379,69 @@ def grep_command(args: Optional[List[str]] = None) -> int:
         print(f"Error: Log file not found at {log_path}", file=sys.stderr)
         return 2
 
-    # Check cache first
-    lines = _get_cached_log(log_path)
-    if lines is None:
-        try:
-            with open(log_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            _cache_log(log_path, lines)
-        except (IOError, OSError) as e:
-            print(f"Error: Could not read log file: {e}", file=sys.stderr)
-            return 2
+    # Check cache first. The key is taken before reading, so a write that
+    # lands mid-read changes the key and the next run reads the file again.
+    try:
+        cache_key = _log_cache_key(log_path)
+        data = _get_cached_log(cache_key)
+        if data is None:
+            data = log_path.read_text(encoding='utf-8')
+            _cache_log(cache_key, data)
+    except (IOError, OSError) as e:
+        print(f"Error: Could not read log file: {e}", file=sys.stderr)
+        return 2
 
     # Apply filters
     matches = []
-    for line_num, line in enumerate(lines, start=1):
-        line = line.rstrip('\n')
-        if _should_include_line(
-            line,
-            parsed_args.pattern,
-            parsed_args.ignore_case,
-            parsed_args.invert_match,
-            parsed_args.extended_regex,
-            since_td
-        ):
+    pattern = parsed_args.pattern
+    buffer_scan = (
+        not parsed_args.invert_match
+        and not since_td
+        and not any(token in pattern for token in _LINE_CONTEXT_TOKENS)
+    )
+    if buffer_scan:
+        # Plain search: walk the whole buffer in C, with str.find for
+        # literal patterns and the regex engine otherwise
+        if not parsed_args.ignore_case and _is_literal_pattern(pattern):
+            hits = _iter_literal_lines(pattern, data)
+        else:
+            flags = re.MULTILINE | (re.IGNORECASE if parsed_args.ignore_case else 0)
+            try:
+                hits = _iter_matching_lines(_compile_pattern(pattern, flags), data)
+            except re.error:
+                # Invalid regex pattern matches nothing
+                hits = iter(())
+        for line_num, line in hits:
             if parsed_args.line_number:
                 matches.append(f"{line_num}:{line}")
             else:
                 matches.append(line)
+    else:
+        # The --since cutoff is fixed for the whole run
+        cutoff = datetime.now() - since_td if since_td else None
+        # StringIO hands out one line at a time (split in C on '\n' only, like
+        # the file read), so no list of every line is built
+        for line_num, line in enumerate(io.StringIO(data), start=1):
+            line = line.rstrip('\n')
+            if _should_include_line(
+                line,
+                parsed_args.pattern,
+                parsed_args.ignore_case,
+                parsed_args.invert_match,
+                parsed_args.extended_regex,
+                cutoff=cutoff
+            ):
+                if parsed_args.line_number:
+                    matches.append(f"{line_num}:{line}")
+                else:
+                    matches.append(line)
 
     # Output results
     if parsed_args.count:
         print(len(matches))
     elif matches:
-        for match in matches:
-            print(match)
+        # One write for the whole result set instead of one per line
+        print("\n".join(matches))
     else:
         # No matches - empty output, exit code 1
         return 1
@@ -6,25 +6,168 @@ to set up project configuration, agents, and environment files.
 """
 
 import asyncio
+import contextlib
+import functools
 import os
+import shutil
 import sys
+import time
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
 from pathlib import Path
 from typing import Optional
 
-from .config_schema import ConfigSchema
+import orjson
+
+from .config_schema import ConfigSchema, _write_bytes_atomic
+
+# Worker threads for copying agent files; copies wait on I/O, not the GIL
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Accepted answers for yes/no prompts (compared lowercased)
+_YES_ANSWERS = frozenset({"y", "yes", "true", "1"})
+_NO_ANSWERS = frozenset({"n", "no", "false", "0"})
+
+
+def _render_menu(choices: list) -> str:
+    """Numbered menu lines for prompt_choice/prompt_multi_select."""
+    return "\n".join(f"  {i}. {choice}" for i, choice in enumerate(choices, 1))
+
+
+@functools.lru_cache(maxsize=None)
+def _npm_root(cwd: str) -> Optional[Path]:
+    """Return `npm root` for cwd, or None if npm is unavailable or fails.
+
+    Cached per directory (including failures), so repeated lookups in one
+    process fork npm at most once; skipped entirely when npm is not on PATH.
+    """
+    if shutil.which("npm") is None:
+        return None
+    try:
+        import subprocess
+        npm_root_result = subprocess.run(
+            ["npm", "root"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            cwd=cwd,
+        )
+        if npm_root_result.returncode == 0:
+            return Path(npm_root_result.stdout.strip())
+    except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
+        # npm not available or command failed
+        pass
+    return None
+
+
+def _line_start(text: str, line_number: int) -> int:
+    """Offset where 1-based line_number starts in text, or len(text) past the end."""
+    offset = 0
+    for _ in range(line_number - 1):
+        newline = text.find("\n", offset)
+        if newline == -1:
+            return len(text)
+        offset = newline + 1
+    return offset
+
+
+def _keys_sorted(value) -> bool:
+    """True if every object nested in a parsed JSON value has sorted keys."""
+    if isinstance(value, dict):
+        keys = list(value)
+        return keys == sorted(keys) and all(_keys_sorted(item) for item in value.values())
+    if isinstance(value, list):
+        return all(_keys_sorted(item) for item in value)
+    return True
+
+
+def _list_markdown_stems(directory: Path) -> list:
+    """Names (without .md) of the markdown files in directory, in one scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.name[:-len(".md")] for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 class ProjectInitializer:
     """Interactive project initialization."""
 
-    def __init__(self, project_root: Optional[Path] = None):
-        """Initialize with optional project root."""
+    def __init__(self, project_root: Optional[Path] = None, use_defaults: bool = False):
+        """Initialize with optional project root.
+
+        With use_defaults, every prompt returns its default without reading input.
+        """
         self.project_root = project_root or Path.cwd()
+        self.use_defaults = use_defaults
+        # Checked once: piped/CI stdin is read line by line without input()
+        self._interactive = sys.stdin.isatty()
         self.drtrace_dir = self.project_root / "_drtrace"
         self.config_path = self.drtrace_dir / "config.json"
         # Track copied agent files for summary display
         self.copied_agent_files: list = []
+        # Every file written by _copy_agents_recursive this run, mapped to
+        # its source, so later steps (framework guides) do not copy the same
+        # source file again
+        self._copied_sources: dict = {}
+        # Files already backed up this run; later edits keep that first backup
+        self._backed_up: set = set()
+        # package.json as left by _apply_js_setup_suggestions, reused when verifying
+        self._package_json_cache: Optional[dict] = None
+        # Keeps the packaged agents/ directory materialized (see
+        # _packaged_agents_dir) until this initializer is discarded
+        self._resource_stack = contextlib.ExitStack()
+        weakref.finalize(self, self._resource_stack.close)
+
+    @functools.cached_property
+    def _packaged_agents_dir(self) -> Optional[Path]:
+        """Filesystem path of the packaged agents/ resources, or None.
+
+        Resolved once per initializer: importlib.resources first, then
+        pkg_resources (Python 3.8), so later lookups skip the failing probes.
+        """
+        try:
+            agents_path = resources.files("drtrace_service").joinpath("resources/agents")
+            if agents_path.is_dir():
+                # as_file() gives a real directory even for zipped installs
+                return Path(self._resource_stack.enter_context(resources.as_file(agents_path)))
+        except (AttributeError, FileNotFoundError, TypeError):
+            # TypeError can occur if as_file() doesn't work with directories
+            pass
+
+        try:
+            import pkg_resources
+            agents_dir = Path(pkg_resources.resource_filename('drtrace_service.resources', 'agents'))
+            if agents_dir.is_dir():
+                return agents_dir
+        except Exception:
+            pass
+
+        return None
+
+    def _read_response(self, prompt: str) -> Optional[str]:
+        """Show prompt and return the stripped reply.
+
+        Returns None when there is nothing to read (use_defaults, or end of a
+        piped stdin); callers then fall back to the prompt's default.
+        """
+        if self.use_defaults:
+            return None
+        if self._interactive:
+            return input(prompt).strip()
+
+        print(prompt, end="", flush=True)
+        line = sys.stdin.readline()
+        if not line:
+            print()
+            return None
+        return line.strip()
 
     def prompt_text(self, prompt: str, default: Optional[str] = None) -> str:
         """Prompt for text input."""
@@ -33,30 +176,30 @@ class ProjectInitializer:
         else:
             full_prompt = f"{prompt}: "
 
-        result = input(full_prompt).strip()
+        result = self._read_response(full_prompt)
         return result if result else default or ""
 
     def prompt_yes_no(self, prompt: str, default: bool = True) -> bool:
         """Prompt for yes/no input."""
         default_str = "Y/n" if default else "y/N"
-        response = input(f"{prompt} ({default_str}): ").strip().lower()
+        response = (self._read_response(f"{prompt} ({default_str}): ") or "").lower()
 
-        if response in ("y", "yes"):
+        if response in _YES_ANSWERS:
             return True
-        elif response in ("n", "no"):
+        elif response in _NO_ANSWERS:
             return False
         else:
             return default
 
     def prompt_choice(self, prompt: str, choices: list, default: Optional[str] = None) -> str:
         """Prompt for choice selection."""
-        print(f"\n{prompt}")
-        for i, choice in enumerate(choices, 1):
-            print(f"  {i}. {choice}")
+        print(f"\n{prompt}\n{_render_menu(choices)}")
 
         while True:
             try:
-                response = input("Select option: ").strip()
+                response = self._read_response("Select option: ")
+                if response is None:
+                    return default if default is not None else choices[0]
                 idx = int(response) - 1
                 if 0 <= idx < len(choices):
                     return choices[idx]
@@ -69,12 +212,11 @@ class ProjectInitializer:
         """Prompt for multiple selections."""
         print(f"\n{prompt}")
         print("(Enter numbers separated by commas, e.g., '1,3')")
-        for i, choice in enumerate(choices, 1):
-            print(f"  {i}. {choice}")
+        print(_render_menu(choices))
 
         while True:
             try:
-                response = input("Select options: ").strip()
+                response = self._read_response("Select options: ")
                 if not response:
                     return []
                 indices = [int(x.strip()) - 1 for x in response.split(",")]
@@ -181,11 +323,13 @@ class ProjectInitializer:
             agent_framework=agent_framework
         )
 
-        ConfigSchema.save(config, self.config_path)
+        # Validated and serialized once; the environment configs reuse the bytes
+        config_json = ConfigSchema.dumps(config)
+        _write_bytes_atomic(self.config_path, config_json)
         print(f"\n✓ Main config created: {self.config_path}")
 
         # Generate environment-specific configs
-        self._generate_environment_configs(config)
+        self._generate_environment_configs(config, config_json)
 
         # Copy default agent spec(s)
         if agent_enabled:
@@ -235,14 +379,22 @@ class ProjectInitializer:
 
     def _create_directory_structure(self) -> None:
         """Create _drtrace directory structure."""
-        (self.drtrace_dir / "agents").mkdir(parents=True, exist_ok=True)
+        # Creating the deepest directory creates _drtrace/ and agents/ with it
         (self.drtrace_dir / "agents" / "integration-guides").mkdir(parents=True, exist_ok=True)
         print(f"✓ Created directory: {self.drtrace_dir}")
 
-    def _generate_environment_configs(self, base_config: dict) -> None:
-        """Generate environment-specific config files."""
+    def _generate_environment_configs(self, base_config: dict, base_json: Optional[bytes] = None) -> None:
+        """Generate environment-specific config files.
+
+        base_json is ConfigSchema.dumps(base_config) when the caller already has it.
+        """
         environments = base_config.get("environments", ["development"])
 
+        # Serialize once; only environments whose overrides actually change
+        # the config are validated and dumped again
+        if base_json is None:
+            base_json = ConfigSchema.dumps(base_config)
+
         for env in environments:
             env_config = base_config.copy()
             env_config_path = self.drtrace_dir / f"config.{env}.json"
@@ -251,7 +403,8 @@ class ProjectInitializer:
             if env == "production":
                 env_config["enabled"] = base_config.get("enabled", False)
 
-            ConfigSchema.save(env_config, env_config_path)
+            rendered = base_json if env_config == base_config else ConfigSchema.dumps(env_config)
+            _write_bytes_atomic(env_config_path, rendered)
             print(f"✓ Generated: {env_config_path}")
 
     def _copy_agent_spec(self) -> None:
@@ -262,56 +415,39 @@ class ProjectInitializer:
         - Integration guides (integration-guides/*.md)
         - Any other files (README.md, CONTRIBUTING.md, etc.)
         """
-        from pathlib import Path
-
-        import pkg_resources
-
-        # Try to copy all files from agents/ directory
         try:
-            # Method 1: Try Python 3.9+ style (resources.files)
-            try:
-                if sys.version_info >= (3, 9):
-                    agents_path = resources.files("drtrace_service").joinpath("resources/agents")
-                    if hasattr(agents_path, 'exists') and agents_path.exists():
-                        # Convert Traversable to Path for easier handling
-                        # Use as_file() context manager to get actual file path
-                        with resources.as_file(agents_path) as agents_dir_path:
-                            copied = self._copy_agents_recursive(Path(agents_dir_path), self.drtrace_dir / "agents")
-                            self.copied_agent_files.extend(copied)
-                        return
-            except (AttributeError, FileNotFoundError, TypeError):
-                # TypeError can occur if as_file() doesn't work with directories
-                pass
-
-            # Method 2: Fallback to pkg_resources (Python 3.8)
-            try:
-                agents_dir = pkg_resources.resource_filename('drtrace_service.resources', 'agents')
-                copied = self._copy_agents_recursive(Path(agents_dir), self.drtrace_dir / "agents")
-                self.copied_agent_files.extend(copied)
-                return
-            except Exception:
-                pass
-
-            # Method 3: Try development mode (monorepo)
-            root_agents_dir = Path(os.getcwd()) / "agents"
-            if root_agents_dir.exists():
-                copied = self._copy_agents_recursive(root_agents_dir, self.drtrace_dir / "agents")
-                self.copied_agent_files.extend(copied)
+            # Packaged resources first, then development mode (monorepo)
+            agents_dir = self._packaged_agents_dir
+            if agents_dir is None:
+                root_agents_dir = Path(os.getcwd()) / "agents"
+                if root_agents_dir.exists():
+                    agents_dir = root_agents_dir
+
+            if agents_dir is None:
+                print("⚠️  Could not find agents directory in package or development mode")
                 return
 
-            print("⚠️  Could not find agents directory in package or development mode")
+            copied = self._copy_agents_recursive(agents_dir, self.drtrace_dir / "agents")
+            self.copied_agent_files.extend(copied)
 
         except Exception as e:
             print(f"⚠️  Could not copy agent files: {e}")
 
     def _copy_agents_from_traversable(self, source_traversable, target_dir: Path) -> None:
         """Copy files from importlib.resources Traversable to target directory."""
+        # Packages installed on disk hand out plain Paths; those take the
+        # os.walk/copyfile route instead of per-item Traversable calls
+        if isinstance(source_traversable, Path) and source_traversable.is_dir():
+            self._copy_agents_recursive(source_traversable, target_dir)
+            return
+
         target_dir.mkdir(parents=True, exist_ok=True)
         copied_count = 0
 
         try:
+            # is_file()/is_dir() are part of the Traversable protocol
             for item in source_traversable.iterdir():
-                if hasattr(item, 'is_file') and item.is_file():
+                if item.is_file():
                     # It's a file
                     item_name = item.name
                     target_name = item_name
@@ -324,7 +460,7 @@ class ProjectInitializer:
                         print(f"✓ Copied {item_name} -> {target_name}")
                     else:
                         print(f"✓ Copied {item_name}")
-                elif hasattr(item, 'is_dir') and item.is_dir():
+                elif item.is_dir():
                     # It's a directory - recurse
                     sub_target = target_dir / item.name
                     self._copy_agents_from_traversable(item, sub_target)
@@ -342,24 +478,35 @@ class ProjectInitializer:
         """
         target_dir.mkdir(parents=True, exist_ok=True)
 
+        # Walk once with os.walk, which splits files from directories using the
+        # cached scandir entry types (no stat per entry). Each target directory
+        # is created once; the files are then copied concurrently, since
+        # per-file cost is syscall latency, which threads overlap.
         copied_files = []
-        for source_file in source_dir.rglob("*"):
-            # Skip directories
-            if source_file.is_dir():
-                continue
-
-            # Calculate relative path from source_dir
-            relative_path = source_file.relative_to(source_dir)
-
-            # Determine target file (no renaming needed - files are already named correctly)
-            target_file = target_dir / relative_path
-
-            # Create parent directories if needed
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file
-            target_file.write_bytes(source_file.read_bytes())
-            copied_files.append(str(relative_path))
+        sources = []
+        targets = []
+        for dirpath, _dirnames, filenames in os.walk(source_dir):
+            rel_dir = os.path.relpath(dirpath, source_dir)
+            if rel_dir == os.curdir:
+                # target_dir itself was created above
+                target_subdir = target_dir
+            else:
+                target_subdir = target_dir / rel_dir
+                if filenames:
+                    target_subdir.mkdir(parents=True, exist_ok=True)
+            for filename in filenames:
+                # Relative path from source_dir (files keep their names)
+                relative_path = filename if rel_dir == os.curdir else os.path.join(rel_dir, filename)
+                copied_files.append(relative_path)
+                sources.append(os.path.join(dirpath, filename))
+                targets.append(target_subdir / filename)
+
+        # Copy files (in-kernel where the OS supports it)
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            list(executor.map(shutil.copyfile, sources, targets))
+        self._copied_sources.update(zip(targets, map(os.path.abspath, sources)))
+
+        for relative_path in copied_files:
             print(f"✓ Copied {relative_path}")
 
         if copied_files:
@@ -383,37 +530,34 @@ class ProjectInitializer:
         Raises:
             FileNotFoundError: If agent spec not found
         """
+        return self._agent_spec_bytes(agent_name).decode("utf-8")
+
+    def _agent_spec_bytes(self, agent_name: str) -> bytes:
+        """Load agent spec as raw bytes, using the same search order as _load_agent_spec.
+
+        Callers that only persist the spec can write these bytes directly
+        instead of decoding and re-encoding the markdown.
+        """
 
         agent_filename = f"{agent_name}.md"
 
         # Try root agents/ first (development mode)
-        root_agent_path = os.path.join(os.getcwd(), "agents", agent_filename)
-        if os.path.isfile(root_agent_path):
-            with open(root_agent_path, "r", encoding="utf-8") as f:
-                return f.read()
+        root_agent_path = Path(os.getcwd()) / "agents" / agent_filename
+        if root_agent_path.is_file():
+            return root_agent_path.read_bytes()
 
         # Fallback to packaged resources (installed mode)
-        try:
-            # Python 3.9+ style
-            content = resources.files("drtrace_service").joinpath(
-                f"resources/agents/{agent_filename}"
-            ).read_text()
-            return content
-        except (AttributeError, FileNotFoundError):
-            # Fallback for older Python versions
-            try:
-                with resources.open_text(
-                    "drtrace_service.resources.agents",
-                    agent_filename,
-                    encoding="utf-8"
-                ) as f:
-                    return f.read()
-            except FileNotFoundError:
-                # Use minimal default if resource not found
-                if agent_name == "log-it":
-                    return self._get_default_log_it_spec()
-                else:
-                    return self._get_default_agent_spec()
+        packaged_dir = self._packaged_agents_dir
+        if packaged_dir is not None:
+            packaged_path = packaged_dir / agent_filename
+            if packaged_path.is_file():
+                return packaged_path.read_bytes()
+
+        # Use minimal default if resource not found
+        if agent_name == "log-it":
+            return self._get_default_log_it_spec().encode("utf-8")
+        else:
+            return self._get_default_agent_spec().encode("utf-8")
 
     def _get_default_agent_spec(self) -> str:
         """Get a minimal default log-analysis agent spec."""
@@ -545,91 +689,57 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
         Dynamically discovers all .md files in agents/integration-guides/ directory.
         Guides are stored in agents folder so agents can access them on client side.
         """
-        from pathlib import Path
-
         # Create integration-guides directory in agents folder
         integration_guides_dir = self.drtrace_dir / "agents" / "integration-guides"
         integration_guides_dir.mkdir(parents=True, exist_ok=True)
 
-        # Dynamically discover framework guides from agents/integration-guides/ directory
+        # Dynamically discover framework guides from agents/integration-guides/:
+        # root directory first (development mode), then packaged resources
         root_guides_dir = Path(os.getcwd()) / "agents" / "integration-guides"
-        framework_guides = []
-
-        # Try root agents/integration-guides/ first (development mode)
-        if root_guides_dir.exists() and root_guides_dir.is_dir():
-            guide_files = list(root_guides_dir.glob("*.md"))
-            framework_guides = [
-                f.stem for f in guide_files
-                if f.is_file()
-            ]
-
-        # If no guides found in development mode, try packaged resources (installed mode)
-        if not framework_guides:
-            try:
-                # Python 3.9+ style - list all files in resources directory
-                resources_path = resources.files("drtrace_service").joinpath(
-                    "resources/agents/integration-guides"
-                )
-                if resources_path.exists():
-                    framework_guides = [
-                        f.stem for f in resources_path.iterdir()
-                        if f.is_file() and f.suffix == ".md"
-                    ]
-            except (AttributeError, FileNotFoundError):
-                # Fallback for older Python versions - use pkg_resources
-                try:
-                    import pkg_resources
-                    files = pkg_resources.resource_listdir(
-                        'drtrace_service.resources.agents',
-                        'integration-guides'
-                    )
-                    framework_guides = [
-                        Path(f).stem for f in files
-                        if Path(f).suffix == ".md"
-                    ]
-                except Exception:
-                    # If this fails, we'll just skip gracefully
-                    pass
-
-        # Copy each discovered guide
-        for guide_name in framework_guides:
-            try:
-                guide_filename = f"{guide_name}.md"
-                guide_path = integration_guides_dir / guide_filename
-
-                # Try root agents/integration-guides/ first (development mode)
-                root_guide_path = root_guides_dir / guide_filename
-                if root_guide_path.exists() and root_guide_path.is_file():
-                    content = root_guide_path.read_text(encoding="utf-8")
-                else:
-                    # Fallback to packaged resources (installed mode)
-                    try:
-                        # Python 3.9+ style
-                        content = resources.files("drtrace_service").joinpath(
-                            f"resources/agents/integration-guides/{guide_filename}"
-                        ).read_text()
-                    except (AttributeError, FileNotFoundError):
-                        # Fallback for older Python versions - use pkg_resources
-                        try:
-                            import pkg_resources
-                            # Get the directory path, then read the file
-                            guides_dir = pkg_resources.resource_filename(
-                                'drtrace_service.resources.agents',
-                                'integration-guides'
-                            )
-                            guide_file_path = Path(guides_dir) / guide_filename
-                            if guide_file_path.exists():
-                                content = guide_file_path.read_text(encoding="utf-8")
-                            else:
-                                continue
-                        except Exception:
-                            # Skip if guide not found
-                            continue
-
-                guide_path.write_text(content)
-                print(f"✓ Copied framework guide: {guide_path}")
-            except Exception as e:
-                print(f"⚠️  Could not copy {guide_name} framework guide: {e}")
+        packaged_dir = self._packaged_agents_dir
+        packaged_guides_dir = packaged_dir / "integration-guides" if packaged_dir is not None else None
+
+        framework_guides = _list_markdown_stems(root_guides_dir)
+        if not framework_guides and packaged_guides_dir is not None:
+            framework_guides = _list_markdown_stems(packaged_guides_dir)
+
+        # Copy the discovered guides concurrently; each copy is I/O bound.
+        # Messages are printed afterwards so they keep the discovery order.
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            messages = list(executor.map(
+                lambda guide_name: self._copy_framework_guide(
+                    guide_name, (root_guides_dir, packaged_guides_dir), integration_guides_dir
+                ),
+                framework_guides,
+            ))
+        for message in messages:
+            if message:
+                print(message)
+
+    def _copy_framework_guide(
+        self, guide_name: str, source_dirs: tuple, integration_guides_dir: Path
+    ) -> Optional[str]:
+        """Copy one framework guide from the first source dir that has it.
+
+        Returns the status line to print, or None if no source has the guide.
+        """
+        guide_filename = f"{guide_name}.md"
+        guide_path = integration_guides_dir / guide_filename
+        try:
+            for source_dir in source_dirs:
+                if source_dir is None:
+                    continue
+                source_path = source_dir / guide_filename
+                if source_path.is_file():
+                    if self._copied_sources.get(guide_path) == os.path.abspath(source_path):
+                        # Already copied from this source with the agents/ tree
+                        return None
+                    # Guides are copied byte for byte; there is nothing to decode
+                    shutil.copyfile(source_path, guide_path)
+                    return f"✓ Copied framework guide: {guide_path}"
+            return None
+        except Exception as e:
+            return f"⚠️  Could not copy {guide_name} framework guide: {e}"
 
     def _copy_cpp_header(self) -> None:
         """Copy drtrace_sink.hpp to third_party/drtrace/ for C++ projects.
@@ -640,8 +750,6 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
           - CMake links only spdlog::spdlog and CURL::libcurl.
           - Note: third_party/drtrace/ should be committed to git (unlike _drtrace/ which is gitignored)
         """
-        import shutil
-
         source_path = self._find_cpp_header_source()
         if not source_path or not source_path.exists():
             print(
@@ -655,7 +763,9 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest_path = dest_dir / "drtrace_sink.hpp"
         try:
-            shutil.copy2(source_path, dest_path)
+            # Contents only: a vendored header does not need the source's
+            # timestamps/permissions, and copyfile takes the OS fast path
+            shutil.copyfile(source_path, dest_path)
             print(f"✓ Copied C++ header: {dest_path}")
             print("  Note: third_party/drtrace/ should be committed to git")
         except Exception as e:  # pragma: no cover - defensive
@@ -702,29 +812,18 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
             repo_root = repo_root.parent
 
         # 3. Check npm package location (if available)
-        try:
-            import subprocess
-            npm_root_result = subprocess.run(
-                ["npm", "root"],
-                capture_output=True,
-                text=True,
-                timeout=2,
+        npm_root = _npm_root(os.getcwd())
+        if npm_root is not None:
+            npm_header_path = (
+                npm_root
+                / "drtrace"
+                / "dist"
+                / "resources"
+                / "cpp"
+                / "drtrace_sink.hpp"
             )
-            if npm_root_result.returncode == 0:
-                npm_root = Path(npm_root_result.stdout.strip())
-                npm_header_path = (
-                    npm_root
-                    / "drtrace"
-                    / "dist"
-                    / "resources"
-                    / "cpp"
-                    / "drtrace_sink.hpp"
-                )
-                if npm_header_path.exists():
-                    return npm_header_path
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            # npm not available or command failed - continue
-            pass
+            if npm_header_path.exists():
+                return npm_header_path
 
         return None
 
@@ -812,39 +911,58 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
 
     # --- Python setup application helpers ---------------------------------
 
+    @functools.cached_property
+    def _backup_timestamp(self) -> str:
+        """UTC suffix shared by every backup made during this run."""
+        return time.strftime("%Y%m%d%H%M%S", time.gmtime())
+
     def _backup_file(self, path: Path) -> None:
-        """Create a timestamped backup of a file if it exists."""
-        if not path.exists():
+        """Create a timestamped backup of a file if it exists.
+
+        Each file is backed up at most once per run, so the backup holds the
+        content from before any suggestion touched it.
+        """
+        if path in self._backed_up or not path.exists():
             return
-        import shutil
-        from datetime import datetime
+        self._backed_up.add(path)
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        backup_path = path.with_suffix(f"{path.suffix}.backup.{timestamp}")
-        shutil.copy2(path, backup_path)
+        backup_path = path.with_suffix(f"{path.suffix}.backup.{self._backup_timestamp}")
+        shutil.copyfile(path, backup_path)
         print(f"   • Backup created: {backup_path}")
 
     def _apply_python_setup_suggestions(self, suggestion) -> None:
         """Apply Python integration and config changes based on suggestions."""
-        # Integration points: insert setup_logging code into entry files
+        # Integration points: insert setup_logging code into entry files.
+        # Points are grouped per file so each file is backed up, read and
+        # written once however many points target it.
+        points_by_file = defaultdict(list)
         for point in getattr(suggestion, "integration_points", []):
-            file_path = point.file_path
-            line_number = max(point.line_number, 1)
+            points_by_file[point.file_path].append(point)
+
+        for file_path, points in points_by_file.items():
             self._backup_file(file_path)
 
             try:
-                lines = file_path.read_text(encoding="utf-8").splitlines()
+                text = file_path.read_text(encoding="utf-8")
             except FileNotFoundError:
                 # If the file doesn't exist, create it with the suggested code
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(point.suggested_code + "\n", encoding="utf-8")
+                file_path.write_text(
+                    "\n\n".join(point.suggested_code for point in points) + "\n", encoding="utf-8"
+                )
                 print(f"   • Created {file_path} with DrTrace setup code")
                 continue
 
-            idx = min(line_number - 1, len(lines))
-            new_lines = lines[:idx] + ["", point.suggested_code, ""] + lines[idx:]
-            file_path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-            print(f"   • Inserted Python setup code into {file_path} at line {line_number}")
+            # Splice bottom-up so earlier line numbers still refer to the original file
+            for point in sorted(points, key=lambda p: max(p.line_number, 1), reverse=True):
+                offset = _line_start(text, max(point.line_number, 1))
+                block = "\n" + point.suggested_code + "\n\n"
+                if offset == len(text) and text and not text.endswith("\n"):
+                    block = "\n" + block
+                text = text[:offset] + block + text[offset:]
+            file_path.write_text(text, encoding="utf-8")
+            for point in points:
+                print(f"   • Inserted Python setup code into {file_path} at line {max(point.line_number, 1)}")
 
         # Config changes: apply .env / requirements.txt / pyproject.toml updates
         for change in getattr(suggestion, "config_changes", []):
@@ -891,54 +1009,57 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
         if not isinstance(suggestion, CppSetupSuggestion):
             return
 
+        # Group per file: each CMakeLists.txt is read once, and backed up and
+        # written only when a block is actually missing
+        changes_by_file = defaultdict(list)
         for change in getattr(suggestion, "cmake_changes", []):
-            cmake_file = change.file_path
-            if not cmake_file.exists():
-                # Skip silently; analysis may have been optimistic
-                continue
-
-            self._backup_file(cmake_file)
+            changes_by_file[change.file_path].append(change)
 
+        for cmake_file, changes in changes_by_file.items():
             try:
                 content = cmake_file.read_text(encoding="utf-8")
             except Exception:
+                # Skip silently; analysis may have been optimistic
                 continue
 
-            if change.suggested_code.strip() in content:
-                # Already applied
-                print(f"   • CMake FetchContent block already present in {cmake_file}")
-                continue
+            lines = None
+            inserted = []
+            for change in changes:
+                code = change.suggested_code.strip()
+                if code in content or any(code in block for block in inserted):
+                    # Already applied
+                    print(f"   • CMake FetchContent block already present in {cmake_file}")
+                    continue
 
-            lines = content.splitlines()
-            insert_idx = len(lines)
-
-            # Determine insertion index based on insertion_point hint
-            hint = (change.insertion_point or "").lower()
-            if "include(fetchcontent)" in hint:
-                for i, line in enumerate(lines):
-                    if "include(FetchContent)" in line:
-                        insert_idx = i + 1
-                        break
-            elif "project()" in hint:
-                for i, line in enumerate(lines):
-                    if line.strip().startswith("project("):
-                        insert_idx = i + 1
-                        break
-
-            new_lines = (
-                lines[:insert_idx]
-                + ["", change.suggested_code, ""]
-                + lines[insert_idx:]
-            )
-            cmake_file.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-            print(f"   • Inserted CMake FetchContent block into {cmake_file}")
+                if lines is None:
+                    self._backup_file(cmake_file)
+                    lines = content.splitlines()
+                insert_idx = len(lines)
+
+                # Determine insertion index based on insertion_point hint
+                hint = (change.insertion_point or "").lower()
+                if "include(fetchcontent)" in hint:
+                    for i, line in enumerate(lines):
+                        if "include(FetchContent)" in line:
+                            insert_idx = i + 1
+                            break
+                elif "project()" in hint:
+                    for i, line in enumerate(lines):
+                        if line.strip().startswith("project("):
+                            insert_idx = i + 1
+                            break
+
+                lines[insert_idx:insert_idx] = ["", change.suggested_code, ""]
+                inserted.append(change.suggested_code)
+                print(f"   • Inserted CMake FetchContent block into {cmake_file}")
+
+            if lines is not None:
+                cmake_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
     # --- JavaScript/TypeScript setup application helpers ------------------
 
     def _apply_js_setup_suggestions(self, suggestion) -> None:
         """Apply JS/TS suggestions: add drtrace dependency and init snippets."""
-        import json
-
         from drtrace_service.setup_suggestions import JsSetupSuggestion  # type: ignore
 
         if not isinstance(suggestion, JsSetupSuggestion):
@@ -947,51 +1068,67 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
         # 1. Update package.json dependencies with drtrace
         package_json = self.project_root / "package.json"
         if package_json.exists():
-            self._backup_file(package_json)
             try:
-                data = json.loads(package_json.read_text(encoding="utf-8"))
+                data = orjson.loads(package_json.read_bytes())
             except Exception:
                 data = {}
 
             deps = data.get("dependencies") or {}
             if "drtrace" not in deps:
+                # Keep the file's key order; only re-sort files that were sorted
+                options = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                if _keys_sorted(data):
+                    options |= orjson.OPT_SORT_KEYS
                 deps["drtrace"] = "^0.2.0"
                 data["dependencies"] = deps
-                package_json.write_text(
-                    json.dumps(data, indent=2, sort_keys=True) + "\n",
-                    encoding="utf-8",
-                )
+                self._backup_file(package_json)
+                package_json.write_bytes(orjson.dumps(data, option=options))
                 print(f"   • Added drtrace dependency to {package_json}")
             else:
+                # Nothing to change, so no backup and no write
                 print(f"   • drtrace dependency already present in {package_json}")
+            # data now matches the file on disk
+            self._package_json_cache = data
 
-        # 2. Append initialization snippets to detected entry points
+        # 2. Append initialization snippets to detected entry points, one
+        # backup, read and append per file
+        points_by_file = defaultdict(list)
         for point in getattr(suggestion, "initialization_points", []):
-            file_path = point.file_path
+            points_by_file[point.file_path].append(point)
+
+        for file_path, points in points_by_file.items():
             self._backup_file(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            existing = ""
-            if file_path.exists():
-                try:
-                    existing = file_path.read_text(encoding="utf-8")
-                except Exception:
-                    existing = ""
+            try:
+                existing = file_path.read_text(encoding="utf-8")
+            except Exception:
+                # Missing or unreadable: the snippets start a new file
+                existing = ""
+
+            snippets = []
+            for point in points:
+                snippet = point.suggested_code.strip()
+                # Avoid duplicating the exact snippet
+                if snippet in existing or any(snippet in added for added in snippets):
+                    print(f"   • JS/TS init snippet already present in {file_path}")
+                    continue
+                snippets.append(point.suggested_code.rstrip())
 
-            # Avoid duplicating the exact snippet
-            if point.suggested_code.strip() in existing:
-                print(f"   • JS/TS init snippet already present in {file_path}")
+            if not snippets:
                 continue
 
             with file_path.open("a", encoding="utf-8") as f:
                 if existing and not existing.endswith("\n"):
                     f.write("\n")
                 f.write(
-                    "\n\n// DrTrace initialization suggestion\n"
-                    + point.suggested_code.rstrip()
-                    + "\n"
+                    "".join(
+                        "\n\n// DrTrace initialization suggestion\n" + snippet + "\n"
+                        for snippet in snippets
+                    )
                 )
-            print(f"   • Appended JS/TS initialization snippet to {file_path}")
+            for _ in snippets:
+                print(f"   • Appended JS/TS initialization snippet to {file_path}")
 
     # --- Simple verification / reporting ----------------------------------
 
@@ -1032,13 +1169,13 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
         # JS: check package.json has drtrace dependency if file exists
         package_json = self.project_root / "package.json"
         if isinstance(js_suggestion, JsSetupSuggestion) and package_json.exists():
-            import json
-
-            try:
-                data = json.loads(package_json.read_text(encoding="utf-8"))
-            except Exception:
-                print(f"   • ⚠️ Could not verify JS setup in {package_json}")
-            else:
+            data = self._package_json_cache
+            if data is None:
+                try:
+                    data = orjson.loads(package_json.read_bytes())
+                except Exception:
+                    print(f"   • ⚠️ Could not verify JS setup in {package_json}")
+            if data is not None:
                 deps = data.get("dependencies") or {}
                 if "drtrace" in deps:
                     print(f"   • ✅ drtrace dependency present in {package_json}")
@@ -1046,10 +1183,10 @@ config = ConfigSchema.load(Path("_drtrace/config.json"))
                     print(f"   • ⚠️ drtrace dependency not detected in {package_json}")
 
 
-def run_init_project(project_root: Optional[Path] = None) -> int:
+def run_init_project(project_root: Optional[Path] = None, use_defaults: bool = False) -> int:
     """Entry point for init-project command."""
     try:
-        initializer = ProjectInitializer(project_root)
+        initializer = ProjectInitializer(project_root, use_defaults=use_defaults)
         success = initializer.run_interactive()
         return 0 if success else 1
     except KeyboardInterrupt:
@@ -1,15 +1,25 @@
 """Tail command implementation for streaming logs."""
 
 import argparse
+import os
+import re
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterator, List, Optional, TextIO
+
+try:
+    from watchfiles import watch as _watch_files
+except ImportError:  # pragma: no cover - watchfiles ships with uvicorn[standard]
+    _watch_files = None
 
 from drtrace_service.daemon_health import check_daemon_alive
 from drtrace_service.output_formatter import ColorMode, LogFormatter, OutputFormat
 from drtrace_service.storage import get_default_log_path
 
+# "[timestamp] [service] [level] ..." prefix
+_LINE_RE = re.compile(r"^\[.*\] \[([^\]]+)\] \[([^\]]+)\]")
+
 
 class TailFollower:
     """Follows log file with polling."""
@@ -39,9 +49,11 @@ class TailFollower:
             output_format=OutputFormat.PLAIN, color_mode=color_mode
         )
 
-        # Track file position
+        # Track file position; reading only last_pos..tell() means no line
+        # is emitted twice, so no history of seen lines is kept
         self.last_pos = 0
-        self.lines_seen: Set[str] = set()  # For deduplication
+        # Trailing text read without its newline yet; emitted once completed
+        self._pending = ""
 
     def _parse_line(self, line: str) -> Optional[tuple]:
         """Parse log line to extract service and level.
@@ -49,16 +61,17 @@ class TailFollower:
         Returns:
             Tuple of (service, level) or None if parse fails
         """
-        import re
-
-        pattern = r"^\[.*\] \[([^\]]+)\] \[([^\]]+)\]"
-        match = re.match(pattern, line)
+        match = _LINE_RE.match(line)
         if match:
             return (match.group(1), match.group(2))
         return None
 
     def _should_include(self, line: str) -> bool:
         """Check if line should be included based on filters."""
+        # Plain streaming (no filters) needs no parsing at all
+        if self.service_filter is None and self.level_filter is None:
+            return True
+
         parsed = self._parse_line(line)
         if not parsed:
             return True
@@ -73,6 +86,72 @@ class TailFollower:
 
         return True
 
+    def _complete_lines(self, data: str) -> List[str]:
+        """Split newly read text into complete lines.
+
+        An unterminated tail is held in _pending and prefixed to the next
+        read, so a line still being written is never emitted in halves.
+        """
+        complete, newline, self._pending = (self._pending + data).rpartition("\n")
+        return complete.split("\n") if newline else []
+
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a batch of lines to stdout with a single write and flush."""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _wait_for_changes(self) -> Iterator[None]:
+        """Yield whenever the log file may have new data.
+
+        Blocks on filesystem events (inotify/kqueue/ReadDirectoryChangesW via
+        watchfiles) with poll_interval as the timeout, so idle logs cost no
+        CPU and appended lines show up immediately. Falls back to sleeping
+        poll_interval when watchfiles is unavailable or the watch fails.
+        """
+        if _watch_files is not None:
+            timeout_ms = max(1, int(self.poll_interval * 1000))
+            try:
+                for _changes in _watch_files(
+                    self.log_path,
+                    watch_filter=None,
+                    debounce=timeout_ms,
+                    rust_timeout=timeout_ms,
+                    yield_on_timeout=True,
+                ):
+                    yield
+            except KeyboardInterrupt:
+                raise
+            except Exception:
+                pass
+
+        while True:
+            time.sleep(self.poll_interval)
+            yield
+
+    def _open_replacement(self, f: TextIO) -> Optional[TextIO]:
+        """Handle log rotation and truncation of the followed file.
+
+        Returns a new handle when the path now names a different file
+        (rotated), or None to keep reading f. When f was truncated below
+        last_pos, rewinds last_pos so reading starts over from the top.
+        """
+        try:
+            path_stat = os.stat(self.log_path)
+        except OSError:
+            # Rotated away and not recreated yet; keep the old handle
+            return None
+
+        handle_stat = os.fstat(f.fileno())
+        if (path_stat.st_ino, path_stat.st_dev) != (handle_stat.st_ino, handle_stat.st_dev):
+            return open(self.log_path, "r", encoding="utf-8")
+
+        if handle_stat.st_size < self.last_pos:
+            self.last_pos = 0
+            self._pending = ""
+        return None
+
     def tail(self) -> int:
         """Start tailing log file.
 
@@ -80,51 +159,69 @@ class TailFollower:
             Exit code (0 for normal exit, 1 for error)
         """
         try:
-            with open(self.log_path, "r", encoding="utf-8") as f:
-                # Get initial lines (last 10)
-                all_lines = f.readlines()
-                initial_lines = all_lines[-10:] if len(all_lines) > 10 else all_lines
-
-                # Print initial lines
-                for line in initial_lines:
-                    line = line.rstrip("\n")
-                    if self._should_include(line):
-                        print(line)
-
-                # Track position
-                self.last_pos = f.tell()
-
-                # Print status
-                print(f"\n[Tailing local file at {self.log_path}...]", file=sys.stderr)
-                print("[Press Ctrl+C to exit]", file=sys.stderr)
-
-                # Follow new entries
-                try:
-                    while True:
-                        time.sleep(self.poll_interval)
-
-                        with open(self.log_path, "r", encoding="utf-8") as f_follow:
-                            f_follow.seek(self.last_pos)
-                            new_lines = f_follow.readlines()
-
-                            for line in new_lines:
-                                line = line.rstrip("\n")
-                                if line and self._should_include(line):
-                                    # Avoid duplicates
-                                    if line not in self.lines_seen:
-                                        print(line)
-                                        self.lines_seen.add(line)
-
-                            self.last_pos = f_follow.tell()
-
-                except KeyboardInterrupt:
-                    print("\n[Tail interrupted]", file=sys.stderr)
-                    return 0
+            f = open(self.log_path, "r", encoding="utf-8")
+        except (IOError, OSError) as e:
+            print(f"Error: Could not tail log file: {e}", file=sys.stderr)
+            return 1
+
+        try:
+            # Get initial lines (last 10 complete lines)
+            initial_lines = self._complete_lines(f.read())[-10:]
+
+            # Print initial lines
+            self._write_lines([line for line in initial_lines if self._should_include(line)])
+
+            # Track position
+            self.last_pos = f.tell()
+
+            # Print status
+            print(f"\n[Tailing local file at {self.log_path}...]", file=sys.stderr)
+            print("[Press Ctrl+C to exit]", file=sys.stderr)
+
+            # Follow new entries on the same handle; reopen it when the file
+            # is rotated or the handle fails
+            try:
+                for _ in self._wait_for_changes():
+                    lines: List[str] = []
+                    try:
+                        replacement = self._open_replacement(f)
+                        if replacement is not None:
+                            # Drain what was appended before the rotation
+                            f.seek(self.last_pos)
+                            lines.extend(self._complete_lines(f.read()))
+                            if self._pending:
+                                lines.append(self._pending)
+                            f.close()
+                            f = replacement
+                            self.last_pos = 0
+                            self._pending = ""
+                        f.seek(self.last_pos)
+                        data = f.read()
+                    except (IOError, OSError):
+                        f.close()
+                        f = open(self.log_path, "r", encoding="utf-8")
+                        f.seek(self.last_pos)
+                        data = f.read()
+
+                    if data:
+                        self.last_pos = f.tell()
+                        lines.extend(self._complete_lines(data))
+
+                    self._write_lines(
+                        [line for line in lines if line and self._should_include(line)]
+                    )
+
+            except KeyboardInterrupt:
+                print("\n[Tail interrupted]", file=sys.stderr)
+                return 0
 
         except (IOError, OSError) as e:
             print(f"Error: Could not tail log file: {e}", file=sys.stderr)
             return 1
 
+        finally:
+            f.close()
+
 
 def tail_command(args: Optional[List[str]] = None) -> int:
     """Execute tail command.
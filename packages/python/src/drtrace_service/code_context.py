@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import stat
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+import orjson
 
 from .config import load_search_config, load_source_roots
 
@@ -23,6 +32,11 @@ def get_source_roots() -> List[Path]:
   return cfg.roots
 
 
+_RESOLVE_CACHE_MAX = 2048
+_resolve_cache: "OrderedDict[tuple, Tuple[Path, Path, int, int]]" = OrderedDict()
+_resolve_cache_lock = threading.Lock()
+
+
 def resolve_file_path(file_path: str, roots: Optional[List[Path]] = None) -> ResolvedFile:
   """
   Resolve a file_path against configured source roots.
@@ -38,19 +52,56 @@ def resolve_file_path(file_path: str, roots: Optional[List[Path]] = None) -> Res
 
   # Absolute path: check directly
   if candidate.is_absolute():
-    if candidate.is_file():
+    if _stat_regular(candidate) is not None:
       return ResolvedFile(ok=True, path=candidate)
     return ResolvedFile(ok=False, path=None, error="file not found")
 
-  # Relative path: search under roots
+  # Repeated lookups (the same frame inspected again) reuse the earlier hit
+  # after one stat confirming the joined path still reaches the same file,
+  # so a retargeted symlink is resolved again. Misses are not cached, so a
+  # file created later is found.
+  key: tuple = (file_path, tuple(roots))
+  if not all(root.is_absolute() for root in roots):
+    key += (os.getcwd(),)
+  with _resolve_cache_lock:
+    cached = _resolve_cache.get(key)
+    if cached is not None:
+      _resolve_cache.move_to_end(key)
+  if cached is not None:
+    full, resolved, dev, ino = cached
+    st = _stat_regular(full)
+    if st is not None and (st.st_dev, st.st_ino) == (dev, ino):
+      return ResolvedFile(ok=True, path=resolved)
+
+  # Relative path: search under roots. One stat per root; only the hit pays
+  # for resolve().
   for root in roots:
-    full = (root / candidate).resolve()
-    if full.is_file():
-      return ResolvedFile(ok=True, path=full)
-
+    full = root / candidate
+    st = _stat_regular(full)
+    if st is not None:
+      resolved = full.resolve()
+      with _resolve_cache_lock:
+        _resolve_cache[key] = (full, resolved, st.st_dev, st.st_ino)
+        _resolve_cache.move_to_end(key)
+        while len(_resolve_cache) > _RESOLVE_CACHE_MAX:
+          _resolve_cache.popitem(last=False)
+      return ResolvedFile(ok=True, path=resolved)
+
+  if cached is not None:
+    with _resolve_cache_lock:
+      _resolve_cache.pop(key, None)
   return ResolvedFile(ok=False, path=None, error="file not found")
 
 
+def _stat_regular(path: Path) -> Optional[os.stat_result]:
+  """Stat path (following symlinks); None unless it is a regular file."""
+  try:
+    st = os.stat(path)
+  except (OSError, ValueError):
+    return None
+  return st if stat.S_ISREG(st.st_mode) else None
+
+
 @dataclass(frozen=True)
 class FileReadResult:
   ok: bool
@@ -61,28 +112,88 @@ class FileReadResult:
 _logger = logging.getLogger("drtrace_service.code_context")
 
 
-def load_file_contents(file_path: str, roots: Optional[List[Path]] = None) -> FileReadResult:
+@dataclass
+class _CachedSource:
+  mtime_ns: int
+  size: int
+  text: str
+  lines: Optional[List[str]] = None
+
+  def splitlines(self) -> List[str]:
+    """Return text.splitlines(), computed on first use and kept with the entry."""
+    if self.lines is None:
+      self.lines = self.text.splitlines()
+    return self.lines
+
+
+_FILE_CACHE_MAX = 256
+_file_cache: "OrderedDict[Path, _CachedSource]" = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def _read_source_cached(path: Path, st: Optional[os.stat_result] = None) -> _CachedSource:
   """
-  Resolve a file_path and attempt to read its contents as text.
+  Read a file as UTF-8 text, reusing the previous read while it is unchanged.
 
-  Returns a structured result and logs failures without raising.
+  Entries are validated against (st_mtime_ns, st_size), so an edited file is
+  read again. Raises the same errors as Path.read_text.
+  """
+  if st is None:
+    st = path.stat()
+  with _file_cache_lock:
+    entry = _file_cache.get(path)
+    if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+      _file_cache.move_to_end(path)
+      return entry
+
+  entry = _CachedSource(mtime_ns=st.st_mtime_ns, size=st.st_size, text=path.read_text(encoding="utf-8"))
+  with _file_cache_lock:
+    _file_cache[path] = entry
+    _file_cache.move_to_end(path)
+    while len(_file_cache) > _FILE_CACHE_MAX:
+      _file_cache.popitem(last=False)
+  return entry
+
+
+def clear_file_cache() -> None:
+  """Drop all cached file contents and resolved paths."""
+  with _file_cache_lock:
+    _file_cache.clear()
+  with _resolve_cache_lock:
+    _resolve_cache.clear()
+
+
+def _load_source(
+  file_path: str, roots: Optional[List[Path]] = None
+) -> Tuple[FileReadResult, Optional[_CachedSource]]:
+  """
+  Resolve and read file_path, returning the public result plus the cache entry.
   """
   resolved = resolve_file_path(file_path, roots=roots)
   if not resolved.ok or not resolved.path:
     _logger.warning("Failed to resolve file_path '%s': %s", file_path, resolved.error)
-    return FileReadResult(ok=False, content=None, error=resolved.error or "unresolved")
+    return FileReadResult(ok=False, content=None, error=resolved.error or "unresolved"), None
 
   try:
-    text = resolved.path.read_text(encoding="utf-8")
-    return FileReadResult(ok=True, content=text)
+    source = _read_source_cached(resolved.path)
+    return FileReadResult(ok=True, content=source.text), source
   except PermissionError:
     msg = "permission denied"
     _logger.warning("Permission denied reading '%s'", resolved.path)
-    return FileReadResult(ok=False, content=None, error=msg)
+    return FileReadResult(ok=False, content=None, error=msg), None
   except OSError as exc:
     msg = f"unreadable file: {exc}"
     _logger.warning("Error reading '%s': %s", resolved.path, exc)
-    return FileReadResult(ok=False, content=None, error=msg)
+    return FileReadResult(ok=False, content=None, error=msg), None
+
+
+def load_file_contents(file_path: str, roots: Optional[List[Path]] = None) -> FileReadResult:
+  """
+  Resolve a file_path and attempt to read its contents as text.
+
+  Returns a structured result and logs failures without raising.
+  """
+  return _load_source(file_path, roots=roots)[0]
 
 
 @dataclass(frozen=True)
@@ -115,11 +226,12 @@ def get_code_snippet(
   if line_no < 1:
     return SnippetResult(ok=False, lines=[], error="line_no must be >= 1")
 
-  read = load_file_contents(file_path, roots=roots)
-  if not read.ok or read.content is None:
+  read, source = _load_source(file_path, roots=roots)
+  if not read.ok or source is None:
     return SnippetResult(ok=False, lines=[], error=read.error or "unreadable file")
 
-  all_lines = read.content.splitlines()
+  # Split lines are cached with the file, so repeated snippets skip the split
+  all_lines = source.splitlines()
   total = len(all_lines)
   if line_no > total:
     return SnippetResult(ok=False, lines=[], error="line_no out of range")
@@ -156,6 +268,51 @@ class SearchResult:
   error: Optional[str] = None
 
 
+_STREAM_SEARCH_MIN_BYTES = 16 * 1024 * 1024
+_STREAM_SEARCH_BLOCK = 64 * 1024
+
+
+def _search_large_file(file_path: Path, query: str, case_sensitive: bool) -> List[SearchMatch]:
+  """
+  Search a file block by block with the same line rules as search_in_file.
+
+  The file is decoded as strict UTF-8 with universal newlines, like
+  Path.read_text, and each block is cut after its last str.splitlines()
+  boundary, so line numbers and matches are identical to searching the whole
+  text. Blocks without the query only have their lines counted, and memory
+  stays at one block plus one partial line. Raises UnicodeDecodeError on
+  invalid UTF-8, like the whole-file read.
+  """
+  q = query if case_sensitive else query.lower()
+  matches: List[SearchMatch] = []
+  line_no = 0
+  carry = ""
+  with file_path.open("r", encoding="utf-8") as f:
+    while True:
+      chunk = f.read(_STREAM_SEARCH_BLOCK)
+      if chunk:
+        lines = (carry + chunk).splitlines(keepends=True)
+        # Hold back a trailing line that has not seen its line break yet
+        carry = lines.pop() if lines[-1].splitlines()[0] == lines[-1] else ""
+        if not lines:
+          continue
+        block = "".join(lines)
+      elif carry:
+        block, carry = carry, ""
+      else:
+        break
+
+      haystack = block if case_sensitive else block.lower()
+      if q not in haystack:
+        line_no += len(block.splitlines())
+        continue
+      for folded, line in zip(haystack.splitlines(), block.splitlines()):
+        line_no += 1
+        if q in folded:
+          matches.append(SearchMatch(file_path=file_path, line_no=line_no, line_text=line))
+  return matches
+
+
 def search_in_file(
   file_path: Path,
   query: str,
@@ -168,7 +325,11 @@ def search_in_file(
   Returns all matching lines as SearchMatch entries.
   """
   try:
-    text = file_path.read_text(encoding="utf-8")
+    st = file_path.stat()
+    # Huge files are scanned in blocks rather than decoded and cached whole
+    if query and st.st_size >= _STREAM_SEARCH_MIN_BYTES:
+      return SearchResult(ok=True, matches=_search_large_file(file_path, query, case_sensitive))
+    source = _read_source_cached(file_path, st)
   except (OSError, UnicodeDecodeError) as exc:
     _logger.warning("Error reading '%s' during search: %s", file_path, exc)
     return SearchResult(ok=False, matches=[], error=f"unreadable file: {exc}")
@@ -176,23 +337,42 @@ def search_in_file(
   if not query:
     return SearchResult(ok=True, matches=[])
 
+  # Check the whole text first: most files in a roots-wide search have no
+  # match at all and never need their lines walked
   matches: List[SearchMatch] = []
   if case_sensitive:
-    for idx, line in enumerate(text.splitlines(), start=1):
+    if query not in source.text:
+      return SearchResult(ok=True, matches=[])
+    for idx, line in enumerate(source.splitlines(), start=1):
       if query in line:
         matches.append(SearchMatch(file_path=file_path, line_no=idx, line_text=line))
   else:
     q = query.lower()
-    for idx, line in enumerate(text.splitlines(), start=1):
-      if q in line.lower():
+    # Lowercase the whole file once rather than each line separately
+    lowered = source.text.lower()
+    if q not in lowered:
+      return SearchResult(ok=True, matches=[])
+    for idx, (lowered_line, line) in enumerate(zip(lowered.splitlines(), source.splitlines()), start=1):
+      if q in lowered_line:
         matches.append(SearchMatch(file_path=file_path, line_no=idx, line_text=line))
 
   return SearchResult(ok=True, matches=matches)
 
 
+def _name_suffix(name: str) -> str:
+  """Return the suffix of a file name with the same rules as PurePath.suffix."""
+  i = name.rfind(".")
+  if 0 < i < len(name) - 1:
+    return name[i:]
+  return ""
+
+
 def iter_source_files(roots: Optional[List[Path]] = None, extensions: Optional[Iterable[str]] = None) -> Iterable[Path]:
   """
   Yield source files under configured roots, optionally filtered by file extension.
+
+  Walks the same entries as Path.rglob("*"): hidden files are included and
+  symlinked directories are not descended into.
   """
   if roots is None or extensions is None:
     cfg = load_search_config()
@@ -204,9 +384,98 @@ def iter_source_files(roots: Optional[List[Path]] = None, extensions: Optional[I
   for root in roots:
     if not root.is_dir():
       continue
-    for path in root.rglob("*"):
-      if path.is_file() and (not exts or path.suffix in exts):
-        yield path
+    stack = [str(root)]
+    while stack:
+      try:
+        with os.scandir(stack.pop()) as entries:
+          for entry in entries:
+            try:
+              # DirEntry answers from the readdir data, usually without a stat
+              if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+              elif (not exts or _name_suffix(entry.name) in exts) and entry.is_file():
+                yield Path(entry.path)
+            except OSError:
+              continue
+      except OSError:
+        continue
+
+
+# Files are read and scanned in parallel; reads wait on I/O
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# ripgrep, when installed, handles roots-wide searches; looked up once
+_RG_BIN = shutil.which("rg")
+
+
+def _search_with_ripgrep(
+  query: str,
+  roots: List[Path],
+  extensions: Iterable[str],
+  max_results: int,
+  case_sensitive: bool,
+) -> Optional[SearchResult]:
+  """
+  Search roots with ripgrep, mirroring iter_source_files + search_in_file.
+
+  Hidden and ignored files are searched like the Python walk, the query is
+  a literal string, and results are sorted by path so they are stable.
+  Returns None when rg fails so the caller can fall back to Python.
+  """
+  search_roots = [str(root) for root in roots if root.is_dir()]
+  if not search_roots:
+    return SearchResult(ok=True, matches=[])
+
+  cmd = [
+    _RG_BIN,
+    "--json",
+    "--no-config",
+    "--no-ignore",
+    "--hidden",
+    "--sort=path",
+    "--fixed-strings",
+    f"--max-count={max_results}",
+  ]
+  if not case_sensitive:
+    cmd.append("--ignore-case")
+  for ext in extensions:
+    cmd.append(f"--glob=*{ext}")
+  cmd += ["--regexp", query, "--", *search_roots]
+
+  try:
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+  except OSError as exc:
+    _logger.warning("Could not run ripgrep, using Python search: %s", exc)
+    return None
+
+  matches: List[SearchMatch] = []
+  try:
+    for raw in proc.stdout:
+      event = orjson.loads(raw)
+      if event["type"] != "match":
+        continue
+      data = event["data"]
+      path_text = data["path"].get("text")
+      line_text = data["lines"].get("text")
+      if path_text is None or line_text is None:
+        # Not valid UTF-8; search_in_file would not read it either
+        continue
+      matches.append(
+        SearchMatch(file_path=Path(path_text), line_no=data["line_number"], line_text=line_text.rstrip("\r\n"))
+      )
+      if len(matches) >= max_results:
+        break
+  finally:
+    proc.stdout.close()
+    if proc.poll() is None:
+      proc.kill()
+    proc.wait()
+
+  # 0 and 1 are "matches" and "no matches"; anything else without output
+  # means rg itself failed, so trust the Python search instead
+  if proc.returncode not in (0, 1) and not matches:
+    return None
+  return SearchResult(ok=True, matches=matches)
 
 
 def search_in_roots(
@@ -223,15 +492,35 @@ def search_in_roots(
   if not query:
     return SearchResult(ok=True, matches=[])
 
+  if roots is None or extensions is None:
+    cfg = load_search_config()
+    roots = roots or cfg.roots
+    extensions = extensions or cfg.extensions
+
+  # A newline would split the literal into several rg patterns
+  if _RG_BIN and "\n" not in query:
+    rg_result = _search_with_ripgrep(query, list(roots), list(extensions), max_results, case_sensitive)
+    if rg_result is not None:
+      return rg_result
+
+  paths = list(iter_source_files(roots=roots, extensions=extensions))
   all_matches: List[SearchMatch] = []
-  for path in iter_source_files(roots=roots, extensions=extensions):
-    file_result = search_in_file(path, query, case_sensitive=case_sensitive)
-    if not file_result.ok:
-      # Skip unreadable files but continue searching others.
-      continue
-    all_matches.extend(file_result.matches)
-    if len(all_matches) >= max_results:
-      break
+  with ThreadPoolExecutor(max_workers=max(1, min(_SEARCH_WORKERS, len(paths)))) as pool:
+    futures = [pool.submit(search_in_file, path, query, case_sensitive=case_sensitive) for path in paths]
+    try:
+      # Collect in walk order so results match a sequential search
+      for future in futures:
+        file_result = future.result()
+        if not file_result.ok:
+          # Skip unreadable files but continue searching others.
+          continue
+        all_matches.extend(file_result.matches)
+        if len(all_matches) >= max_results:
+          break
+    finally:
+      # Stop files that have not started once enough matches are in
+      for future in futures:
+        future.cancel()
 
   # Truncate to max_results just in case
   return SearchResult(ok=True, matches=all_matches[:max_results])
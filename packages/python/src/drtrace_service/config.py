@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import FrozenSet, List, Set, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,20 +25,23 @@ def load_source_roots() -> SourceRootsConfig:
   DRTRACE_SOURCE_ROOTS is a os.pathsep-separated list of paths (e.g., "src:lib").
   """
   raw = os.getenv("DRTRACE_SOURCE_ROOTS")
-  if not raw:
+  roots = _parse_source_roots(raw) if raw else ()
+  if not roots:
     return SourceRootsConfig(roots=[Path.cwd()])
 
+  return SourceRootsConfig(roots=list(roots))
+
+
+@lru_cache(maxsize=8)
+def _parse_source_roots(raw: str) -> Tuple[Path, ...]:
+  """Parse a DRTRACE_SOURCE_ROOTS value; memoized per distinct value."""
   roots: List[Path] = []
   for part in raw.split(os.pathsep):
     part = part.strip()
     if not part:
       continue
     roots.append(Path(part).expanduser())
-
-  if not roots:
-    roots.append(Path.cwd())
-
-  return SourceRootsConfig(roots=roots)
+  return tuple(roots)
 
 
 def load_search_config() -> SearchConfig:
@@ -48,21 +52,23 @@ def load_search_config() -> SearchConfig:
   Defaults to {".py"} when unset or invalid.
   """
   roots_cfg = load_source_roots()
-  raw_exts = os.getenv("DRTRACE_SEARCH_EXTS")
+  exts = _parse_search_exts(os.getenv("DRTRACE_SEARCH_EXTS") or "")
+  return SearchConfig(roots=roots_cfg.roots, extensions=set(exts))
 
+
+@lru_cache(maxsize=8)
+def _parse_search_exts(raw: str) -> FrozenSet[str]:
+  """Parse a DRTRACE_SEARCH_EXTS value; memoized per distinct value."""
   exts: Set[str] = set()
-  if raw_exts:
-    for part in raw_exts.split(","):
-      part = part.strip()
-      if not part:
-        continue
-      if not part.startswith("."):
-        part = "." + part
-      exts.add(part)
+  for part in raw.split(","):
+    part = part.strip()
+    if not part:
+      continue
+    if not part.startswith("."):
+      part = "." + part
+    exts.add(part)
 
   if not exts:
     exts = {".py"}
 
-  return SearchConfig(roots=roots_cfg.roots, extensions=exts)
-
-
+  return frozenset(exts)
@@ -17,38 +17,78 @@ Usage:
     >>> print(config["drtrace"]["applicationId"])  # section key
 """
 
-import json
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import orjson
+
+# Read-only default sections; _fresh_defaults() copies them into a new
+# mutable config. All values are scalars, so a shallow dict() is enough.
+_PROJECT_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "name": "my-app",
+    "language": "python",
+    "description": "My application",
+})
+
+_DRTRACE_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "applicationId": "my-app",
+    "daemonUrl": "http://localhost:8001",
+    "enabled": True,
+    "logLevel": "info",
+    "batchSize": 50,
+    "flushIntervalMs": 1000,
+    "retentionDays": 7,
+})
+
+_AGENT_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "enabled": False,
+    "agentFile": None,
+    "framework": None,
+})
+
+
+_ENV_VAR_PREFIX = "DRTRACE_"
+
+# Map environment variable names to config paths
+_ENV_VAR_MAPPINGS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "DRTRACE_APPLICATION_ID": ("drtrace", "applicationId"),
+    "DRTRACE_DAEMON_URL": ("drtrace", "daemonUrl"),
+    "DRTRACE_ENABLED": ("drtrace", "enabled"),
+    "DRTRACE_LOG_LEVEL": ("drtrace", "logLevel"),
+    "DRTRACE_BATCH_SIZE": ("drtrace", "batchSize"),
+    "DRTRACE_FLUSH_INTERVAL_MS": ("drtrace", "flushIntervalMs"),
+    "DRTRACE_RETENTION_DAYS": ("drtrace", "retentionDays"),
+    "DRTRACE_AGENT_ENABLED": ("agent", "enabled"),
+    "DRTRACE_AGENT_FILE": ("agent", "agentFile"),
+    "DRTRACE_AGENT_FRAMEWORK": ("agent", "framework"),
+})
+
+_INT_FIELDS = frozenset({"batchSize", "flushIntervalMs", "retentionDays"})
+
+
+def _fresh_defaults() -> Dict[str, Any]:
+    """Build a new, mutable default configuration dict."""
+    return {
+        "project": dict(_PROJECT_DEFAULTS),
+        "drtrace": dict(_DRTRACE_DEFAULTS),
+        "agent": dict(_AGENT_DEFAULTS),
+        "environment": {},
+    }
+
+
+def _deep_copy(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep copy a JSON-compatible config dict via an orjson round-trip."""
+    return orjson.loads(orjson.dumps(value))
 
 
 class ConfigSchema:
     """Schema validation and defaults for DrTrace configuration."""
 
     # Default configuration values
-    DEFAULTS = {
-        "project": {
-            "name": "my-app",
-            "language": "python",
-            "description": "My application",
-        },
-        "drtrace": {
-            "applicationId": "my-app",
-            "daemonUrl": "http://localhost:8001",
-            "enabled": True,
-            "logLevel": "info",
-            "batchSize": 50,
-            "flushIntervalMs": 1000,
-            "retentionDays": 7,
-        },
-        "agent": {
-            "enabled": False,
-            "agentFile": None,
-            "framework": None,
-        },
-        "environment": {},
-    }
+    DEFAULTS = _fresh_defaults()
 
     # Schema definition: field -> (type, required, description)
     SCHEMA = {
@@ -148,7 +188,7 @@ class ConfigSchema:
     @classmethod
     def get_default(cls) -> Dict[str, Any]:
         """Get default configuration."""
-        return json.loads(json.dumps(cls.DEFAULTS))  # Deep copy
+        return _fresh_defaults()
 
 
 class ConfigLoader:
@@ -223,9 +263,9 @@ class ConfigLoader:
     def _load_json_file(filepath: Path) -> Dict[str, Any]:
         """Load and parse JSON file."""
         try:
-            with open(filepath, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            with open(filepath, "rb") as f:
+                return orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {filepath}: {e}")
         except OSError as e:
             raise ValueError(f"Error reading {filepath}: {e}")
@@ -242,15 +282,21 @@ class ConfigLoader:
         Returns:
             Merged configuration
         """
-        result = json.loads(json.dumps(base))  # Deep copy
+        result = _deep_copy(base)
+        ConfigLoader._merge_into(result, overrides)
+        return result
 
+    @staticmethod
+    def _merge_into(target: Dict[str, Any], overrides: Dict[str, Any]) -> None:
+        """Recursively merge overrides into target, mutating target in place."""
         for key, value in overrides.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = ConfigLoader._merge_configs(result[key], value)
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                ConfigLoader._merge_into(current, value)
+            elif isinstance(value, (dict, list)):
+                target[key] = copy.deepcopy(value)
             else:
-                result[key] = value
-
-        return result
+                target[key] = value
 
     @staticmethod
     def _apply_env_var_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -269,30 +315,25 @@ class ConfigLoader:
         Returns:
             Config with env var overrides applied
         """
-        result = json.loads(json.dumps(config))  # Deep copy
-
-        # Map environment variable names to config paths
-        env_var_mappings = {
-            "DRTRACE_APPLICATION_ID": ("drtrace", "applicationId"),
-            "DRTRACE_DAEMON_URL": ("drtrace", "daemonUrl"),
-            "DRTRACE_ENABLED": ("drtrace", "enabled"),
-            "DRTRACE_LOG_LEVEL": ("drtrace", "logLevel"),
-            "DRTRACE_BATCH_SIZE": ("drtrace", "batchSize"),
-            "DRTRACE_FLUSH_INTERVAL_MS": ("drtrace", "flushIntervalMs"),
-            "DRTRACE_RETENTION_DAYS": ("drtrace", "retentionDays"),
-            "DRTRACE_AGENT_ENABLED": ("agent", "enabled"),
-            "DRTRACE_AGENT_FILE": ("agent", "agentFile"),
-            "DRTRACE_AGENT_FRAMEWORK": ("agent", "framework"),
+        overrides = {
+            key: value for key, value in os.environ.items()
+            if key.startswith(_ENV_VAR_PREFIX)
         }
+        # Only the sections written below are copied; the rest are shared
+        # with the input, which is never mutated here.
+        result = dict(config)
+        if not overrides:
+            return result
 
-        for env_var, (section, field) in env_var_mappings.items():
-            if env_var in os.environ:
-                value = os.environ[env_var]
+        copied_sections = set()
 
+        for env_var, (section, field) in _ENV_VAR_MAPPINGS.items():
+            value = overrides.get(env_var)
+            if value is not None:
                 # Type conversions
-                if field in ["enabled", "ENABLED"]:
+                if field == "enabled":
                     value = value.lower() in ("true", "1", "yes")
-                elif field in ["batchSize", "flushIntervalMs", "retentionDays"]:
+                elif field in _INT_FIELDS:
                     try:
                         value = int(value)
                     except ValueError:
@@ -300,8 +341,9 @@ class ConfigLoader:
                             f"Invalid value for {env_var}: must be an integer"
                         )
 
-                if section not in result:
-                    result[section] = {}
+                if section not in copied_sections:
+                    result[section] = dict(result.get(section) or {})
+                    copied_sections.add(section)
                 result[section][field] = value
 
         return result
@@ -5,6 +5,7 @@ Uses async/await to avoid blocking the main thread.
 """
 
 import asyncio
+import atexit
 import logging
 import os
 import time
@@ -23,6 +24,13 @@ class DaemonHealthChecker:
         self._cache: Optional[bool] = None
         self._cache_time: float = 0.0
         self._cache_duration: float = 2.0  # 2 seconds
+        host, port = self._get_daemon_config()
+        self._url = f"http://{host}:{port}/status"
+        # Reused across checks for keep-alive; an AsyncClient is bound to the
+        # event loop it first ran on, so the sync wrapper keeps its own loop.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _get_daemon_config(self) -> Tuple[str, int]:
         """Get daemon host and port from environment or defaults.
@@ -42,6 +50,50 @@ class DaemonHealthChecker:
         """
         return int(os.getenv("DRTRACE_DAEMON_CHECK_TIMEOUT_MS", "500"))
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it for the running loop if needed.
+
+        A client left over from a different event loop is closed before it
+        is replaced, so its pooled connections are not leaked.
+
+        Returns:
+            AsyncClient usable from the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is not None and not client.is_closed and self._client_loop is loop:
+            return client
+
+        self._client = None
+        self._client_loop = None
+        if client is not None and not client.is_closed:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing stale daemon health client: {type(e).__name__}: {e}")
+
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=1)
+        )
+        self._client_loop = loop
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared client and the private event loop, if any."""
+        client, self._client = self._client, None
+        self._client_loop = None
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            if client is not None and not loop.is_running():
+                loop.run_until_complete(client.aclose())
+        except Exception as e:
+            logger.debug(f"Error closing daemon health client: {type(e).__name__}: {e}")
+        finally:
+            if not loop.is_running():
+                loop.close()
+
     async def _check_daemon_async(self, timeout_ms: int) -> bool:
         """Check daemon health via HTTP GET (async).
 
@@ -51,8 +103,7 @@ class DaemonHealthChecker:
         Returns:
             True if daemon responds with HTTP 200, False otherwise
         """
-        host, port = self._get_daemon_config()
-        url = f"http://{host}:{port}/status"
+        url = self._url
         timeout_seconds = timeout_ms / 1000.0
 
         start_time = time.time()
@@ -60,25 +111,27 @@ class DaemonHealthChecker:
         try:
             logger.debug(f"Checking daemon health: GET {url} (timeout={timeout_ms}ms)")
 
-            async with httpx.AsyncClient() as client:
-                response = await asyncio.wait_for(
-                    client.get(url, timeout=timeout_seconds),
-                    timeout=timeout_seconds
-                )
+            client = await self._get_client()
+            # httpx applies the timeout per phase (connect, read, pool), so
+            # wait_for keeps the whole request within timeout_ms
+            response = await asyncio.wait_for(
+                client.get(url, timeout=timeout_seconds),
+                timeout=timeout_seconds
+            )
 
-                elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((time.time() - start_time) * 1000)
 
-                if response.status_code == 200:
-                    logger.debug(f"Daemon health check: OK (response time: {elapsed_ms}ms)")
-                    return True
-                else:
-                    logger.debug(
-                        f"Daemon health check: FAILED (status={response.status_code}, "
-                        f"time={elapsed_ms}ms)"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.debug(f"Daemon health check: OK (response time: {elapsed_ms}ms)")
+                return True
+            else:
+                logger.debug(
+                    f"Daemon health check: FAILED (status={response.status_code}, "
+                    f"time={elapsed_ms}ms)"
+                )
+                return False
 
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             elapsed_ms = int((time.time() - start_time) * 1000)
             logger.debug(
                 f"Daemon health check: TIMEOUT (exceeded {timeout_ms}ms, "
@@ -105,10 +158,6 @@ class DaemonHealthChecker:
         Returns:
             True if daemon is healthy and responsive, False otherwise
         """
-        # Use default timeout if not provided
-        if timeout_ms is None:
-            timeout_ms = self._get_timeout_ms()
-
         # Check cache
         now = time.time()
         if self._cache is not None and (now - self._cache_time) < self._cache_duration:
@@ -117,26 +166,28 @@ class DaemonHealthChecker:
             )
             return self._cache
 
+        # Use default timeout if not provided
+        if timeout_ms is None:
+            timeout_ms = self._get_timeout_ms()
+
         # Run async check
         try:
             # Create or get event loop for async execution
             try:
-                loop = asyncio.get_running_loop()
+                asyncio.get_running_loop()
                 # If we're already in an async context, create a task
                 raise RuntimeError(
                     "check_daemon_alive() called from async context. "
                     "Use check_daemon_alive_async() instead."
                 )
             except RuntimeError:
-                # No running loop, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(
-                        self._check_daemon_async(timeout_ms)
-                    )
-                finally:
-                    loop.close()
+                # No running loop, reuse this checker's private one so the
+                # client's pooled connection survives between calls
+                if self._loop is None or self._loop.is_closed():
+                    self._loop = asyncio.new_event_loop()
+                result = self._loop.run_until_complete(
+                    self._check_daemon_async(timeout_ms)
+                )
         except Exception as e:
             logger.debug(f"Daemon health check exception: {type(e).__name__}: {e}")
             result = False
@@ -160,10 +211,6 @@ class DaemonHealthChecker:
         Returns:
             True if daemon is healthy and responsive, False otherwise
         """
-        # Use default timeout if not provided
-        if timeout_ms is None:
-            timeout_ms = self._get_timeout_ms()
-
         # Check cache
         now = time.time()
         if self._cache is not None and (now - self._cache_time) < self._cache_duration:
@@ -172,6 +219,10 @@ class DaemonHealthChecker:
             )
             return self._cache
 
+        # Use default timeout if not provided
+        if timeout_ms is None:
+            timeout_ms = self._get_timeout_ms()
+
         # Run async check
         try:
             result = await self._check_daemon_async(timeout_ms)
@@ -188,6 +239,7 @@ class DaemonHealthChecker:
 
 # Global instance for CLI use
 _health_checker = DaemonHealthChecker()
+atexit.register(_health_checker.close)
 
 
 def check_daemon_alive(timeout_ms: Optional[int] = None) -> bool:
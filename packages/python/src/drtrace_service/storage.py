@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import psycopg2
 from psycopg2.extras import Json, execute_batch
@@ -19,6 +19,12 @@ LEVEL_ORDER = {
     "CRITICAL": 4,
 }
 
+# Allowed levels per min_level, precomputed so queries don't rebuild the list
+_LEVELS_AT_OR_ABOVE = {
+    min_level: tuple(level for level, order in LEVEL_ORDER.items() if order >= min_order)
+    for min_level, min_order in LEVEL_ORDER.items()
+}
+
 
 class LogStorage:
   """
@@ -46,6 +52,16 @@ class LogStorage:
   ) -> List[LogRecord]:  # pragma: no cover - integration concern
     raise NotImplementedError
 
+  def iter_time_range(self, start_ts: float, end_ts: float, **filters: Any) -> Iterator[LogRecord]:
+    """
+    Stream the records query_time_range would return, in the same order.
+
+    Accepts the same keyword filters as query_time_range. Backends that can
+    fetch rows incrementally override this; the default simply iterates the
+    materialized result.
+    """
+    return iter(self.query_time_range(start_ts=start_ts, end_ts=end_ts, **filters))
+
   def get_retention_cutoff(self, retention_days: int) -> float:  # pragma: no cover - integration concern
     """
     Compute a unix timestamp cutoff for retention based on retention_days.
@@ -171,6 +187,7 @@ class PostgresLogStorage(LogStorage):
     min_level: Optional[str] = None,
     after_cursor: Optional[Dict[str, Any]] = None,
     limit: int = 100,
+    message_invert: bool = False,
   ) -> List[LogRecord]:  # pragma: no cover - integration concern
     """
     Time-range query over logs table ordered by ts DESC.
@@ -179,112 +196,171 @@ class PostgresLogStorage(LogStorage):
     - Single or multiple module_name and service_name values
     - Case-insensitive message search: ILIKE for substring (Story API-2)
     - Case-insensitive POSIX regex for message (Epic 11.1)
+    - message_invert: keep only rows NOT matching the message filter
     - Minimum level filtering (Story API-3)
     - Cursor-based pagination (Story API-4)
     """
-    dsn = self._dsn
-    conn = psycopg2.connect(dsn)
+    sql, params = _build_time_range_query(
+      start_ts, end_ts, application_id, module_name, service_name,
+      message_contains, message_regex, min_level, after_cursor, limit, message_invert,
+    )
+    conn = psycopg2.connect(self._dsn)
     try:
       with conn, conn.cursor() as cur:
-        params: list[object] = [start_ts, end_ts]
-        where = "ts BETWEEN to_timestamp(%s) AND to_timestamp(%s)"
-
-        if application_id:
-          where += " AND application_id = %s"
-          params.append(application_id)
-
-        if module_name:
-          if isinstance(module_name, list):
-            if module_name:
-              placeholders = ",".join(["%s"] * len(module_name))
-              where += f" AND module_name IN ({placeholders})"
-              params.extend(module_name)
-          else:
-            where += " AND module_name = %s"
-            params.append(module_name)
-
-        if service_name:
-          if isinstance(service_name, list):
-            if service_name:
-              placeholders = ",".join(["%s"] * len(service_name))
-              where += f" AND service_name IN ({placeholders})"
-              params.extend(service_name)
-          else:
-            where += " AND service_name = %s"
-            params.append(service_name)
-
-        # Story API-2: Message text search (case-insensitive)
-        if message_contains:
-          where += " AND message ILIKE %s"
-          params.append(f"%{message_contains}%")
-
-        # Epic 11.1: Message regex search (case-insensitive POSIX regex)
-        if message_regex:
-          where += " AND message ~* %s"
-          params.append(message_regex)
-
-        # Story API-3: Minimum level filter
-        if min_level:
-          min_order = LEVEL_ORDER.get(min_level.upper(), 0)
-          allowed_levels = [level for level, order in LEVEL_ORDER.items() if order >= min_order]
-          if allowed_levels:
-            placeholders = ",".join(["%s"] * len(allowed_levels))
-            where += f" AND UPPER(level) IN ({placeholders})"
-            params.extend(allowed_levels)
-
-        # Story API-4: Cursor-based pagination
-        if after_cursor:
-          cursor_ts = after_cursor.get("ts")
-          if cursor_ts is not None:
-            # Skip records at or before cursor position (ordered by ts DESC)
-            where += " AND ts < to_timestamp(%s)"
-            params.append(cursor_ts)
-
-        cur.execute(
-          f"""
-          SELECT
-            EXTRACT(EPOCH FROM ts) as ts,
-            level,
-            message,
-            application_id,
-            service_name,
-            module_name,
-            file_path,
-            line_no,
-            exception_type,
-            stacktrace,
-            context
-          FROM logs
-          WHERE {where}
-          ORDER BY ts DESC
-          LIMIT %s
-          """,
-          (*params, limit),
-        )
+        cur.execute(sql, params)
         rows = cur.fetchall()
+    finally:
+      conn.close()
 
+    return [_row_to_record(row) for row in rows]
+
+  def iter_time_range(
+    self,
+    start_ts: float,
+    end_ts: float,
+    application_id: Optional[str] = None,
+    module_name: Optional[Union[str, List[str]]] = None,
+    service_name: Optional[Union[str, List[str]]] = None,
+    message_contains: Optional[str] = None,
+    message_regex: Optional[str] = None,
+    min_level: Optional[str] = None,
+    after_cursor: Optional[Dict[str, Any]] = None,
+    limit: int = 100,
+    message_invert: bool = False,
+  ) -> Iterator[LogRecord]:  # pragma: no cover - integration concern
+    """
+    Streaming variant of query_time_range.
+
+    Uses a server-side (named) cursor so rows are fetched in chunks of
+    _STREAM_FETCH_SIZE instead of materializing the full result set.
+    """
+    sql, params = _build_time_range_query(
+      start_ts, end_ts, application_id, module_name, service_name,
+      message_contains, message_regex, min_level, after_cursor, limit, message_invert,
+    )
+    conn = psycopg2.connect(self._dsn)
+    try:
+      with conn, conn.cursor(name="drtrace_iter_time_range") as cur:
+        cur.itersize = _STREAM_FETCH_SIZE
+        cur.execute(sql, params)
+        for row in cur:
+          yield _row_to_record(row)
     finally:
       conn.close()
 
-    records: List[LogRecord] = []
-    for row in rows:
-      ts, level, message, app_id, svc, mod, file_path, line_no, exc_type, stacktrace, context = row
-      records.append(
-        LogRecord(
-          ts=ts,
-          level=level,
-          message=message,
-          application_id=app_id,
-          service_name=svc,
-          module_name=mod,
-          file_path=file_path,
-          line_no=line_no,
-          exception_type=exc_type,
-          stacktrace=stacktrace,
-          context=context or {},
-        )
-      )
-    return records
+
+# Rows fetched per round-trip when streaming query results.
+_STREAM_FETCH_SIZE = 500
+
+
+def _build_time_range_query(
+  start_ts: float,
+  end_ts: float,
+  application_id: Optional[str],
+  module_name: Optional[Union[str, List[str]]],
+  service_name: Optional[Union[str, List[str]]],
+  message_contains: Optional[str],
+  message_regex: Optional[str],
+  min_level: Optional[str],
+  after_cursor: Optional[Dict[str, Any]],
+  limit: int,
+  message_invert: bool = False,
+) -> tuple:
+  """Build the SQL text and parameters shared by query_time_range/iter_time_range."""
+  params: list[object] = [start_ts, end_ts]
+  where = "ts BETWEEN to_timestamp(%s) AND to_timestamp(%s)"
+
+  if application_id:
+    where += " AND application_id = %s"
+    params.append(application_id)
+
+  if module_name:
+    if isinstance(module_name, list):
+      if module_name:
+        placeholders = ",".join(["%s"] * len(module_name))
+        where += f" AND module_name IN ({placeholders})"
+        params.extend(module_name)
+    else:
+      where += " AND module_name = %s"
+      params.append(module_name)
+
+  if service_name:
+    if isinstance(service_name, list):
+      if service_name:
+        placeholders = ",".join(["%s"] * len(service_name))
+        where += f" AND service_name IN ({placeholders})"
+        params.extend(service_name)
+    else:
+      where += " AND service_name = %s"
+      params.append(service_name)
+
+  # Story API-2: Message text search (case-insensitive)
+  if message_contains:
+    where += " AND message NOT ILIKE %s" if message_invert else " AND message ILIKE %s"
+    params.append(f"%{message_contains}%")
+
+  # Epic 11.1: Message regex search (case-insensitive POSIX regex)
+  if message_regex:
+    where += " AND message !~* %s" if message_invert else " AND message ~* %s"
+    params.append(message_regex)
+
+  # Story API-3: Minimum level filter
+  if min_level:
+    # Unknown levels fall back to no level restriction (every level allowed)
+    allowed_levels = _LEVELS_AT_OR_ABOVE.get(min_level) or _LEVELS_AT_OR_ABOVE.get(
+      min_level.upper(), _LEVELS_AT_OR_ABOVE["DEBUG"]
+    )
+    if allowed_levels:
+      placeholders = ",".join(["%s"] * len(allowed_levels))
+      where += f" AND UPPER(level) IN ({placeholders})"
+      params.extend(allowed_levels)
+
+  # Story API-4: Cursor-based pagination
+  if after_cursor:
+    cursor_ts = after_cursor.get("ts")
+    if cursor_ts is not None:
+      # Skip records at or before cursor position (ordered by ts DESC)
+      where += " AND ts < to_timestamp(%s)"
+      params.append(cursor_ts)
+
+  sql = f"""
+    SELECT
+      EXTRACT(EPOCH FROM ts) as ts,
+      level,
+      message,
+      application_id,
+      service_name,
+      module_name,
+      file_path,
+      line_no,
+      exception_type,
+      stacktrace,
+      context
+    FROM logs
+    WHERE {where}
+    ORDER BY ts DESC
+    LIMIT %s
+    """
+  return sql, (*params, limit)
+
+
+def _row_to_record(row: tuple) -> LogRecord:
+  ts, level, message, app_id, svc, mod, file_path, line_no, exc_type, stacktrace, context = row
+  # Rows were validated on ingest and the columns are typed, so skip
+  # re-validation; EXTRACT(EPOCH ...) yields a Decimal, hence float().
+  return LogRecord.model_construct(
+    ts=float(ts),
+    level=level,
+    message=message,
+    application_id=app_id,
+    service_name=svc,
+    module_name=mod,
+    file_path=file_path,
+    line_no=line_no,
+    exception_type=exc_type,
+    stacktrace=stacktrace,
+    context=context or {},
+  )
 
 
 _storage: LogStorage | None = None
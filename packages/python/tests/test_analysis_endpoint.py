@@ -537,6 +537,9 @@ Confidence: High"""
     assert "suggested_fixes" in explanation
     assert "confidence" in explanation
     assert "evidence_references" in explanation
+    assert "has_clear_remediation" in explanation
+    # The unparsed model output is internal and never part of the response
+    assert "raw_response" not in explanation
     # Evidence references should be present if we have error logs
     assert len(explanation["evidence_references"]) > 0
     # Summary and root_cause should have content (even if fallback)
@@ -602,3 +605,32 @@ def test_why_endpoint_validates_min_level(monkeypatch):
     error = resp.json()
     assert error["detail"]["code"] == "INVALID_LEVEL"
 
+
+
+def test_analysis_endpoint_renders_non_ascii_and_datetimes_with_orjson(monkeypatch):
+    """Analysis payloads go through orjson: raw UTF-8 and natively encoded datetimes."""
+    from datetime import datetime, timezone
+
+    client = TestClient(app)
+    storage = AnalysisStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    base_time = time.time()
+    storage.all_records.append(
+        LogRecord(
+            **_make_log(
+                message="naïve ✓",
+                ts=base_time + 1.0,
+                context={"at": datetime(2026, 1, 5, 10, 30, 45, tzinfo=timezone.utc)},
+            )
+        )
+    )
+
+    resp = client.get(
+        f"/analysis/time-range?application_id=test-app&start_ts={base_time}&end_ts={base_time + 10.0}"
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert '"message":"naïve ✓"'.encode("utf-8") in resp.content
+    assert b'"context":{"at":"2026-01-05T10:30:45+00:00"}' in resp.content
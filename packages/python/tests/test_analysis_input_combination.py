@@ -309,3 +309,24 @@ def test_prepare_ai_input_empty_logs_list():
     assert input_data.summary["time_range"]["start_ts"] is None
     assert input_data.summary["time_range"]["end_ts"] is None
 
+
+
+def test_prepare_ai_input_accepts_streaming_iterator():
+    """Logs may be passed as a one-shot iterator; the summary matches the list form."""
+    logs = [
+        _make_log_record(level="ERROR", message="boom", service_name="svc", ts=100.0),
+        _make_log_record(level="INFO", message="ok", module_name="other", ts=50.0),
+    ]
+
+    from_list = prepare_ai_analysis_input(logs)
+    from_iter = prepare_ai_analysis_input(iter(logs))
+
+    assert from_iter.summary == from_list.summary
+    assert [e.log.log_id for e in from_iter.logs] == [e.log.log_id for e in from_list.logs]
+    assert from_iter.summary["total_logs"] == 2
+    assert from_iter.summary["error_logs"] == 1
+    assert from_iter.summary["time_range"] == {"start_ts": 50.0, "end_ts": 100.0}
+    assert from_iter.summary["components"] == {
+        "services": {"svc": 1},
+        "modules": {"test_module": 1, "other": 1},
+    }
@@ -9,6 +9,8 @@ These tests validate the new API features:
 - Epic 11.1: Regex message search (message_regex)
 """
 
+import base64
+import json
 import re
 import time
 from datetime import datetime, timezone
@@ -178,6 +180,30 @@ class TestParseTimeParam:
             parse_time_param("invalid")
         assert "Cannot parse time" in str(excinfo.value)
 
+    def test_iso_8601_with_z_suffix(self):
+        """Test ISO 8601 with a trailing Z is treated as UTC."""
+        result = parse_time_param("2025-12-31T02:44:03Z")
+        expected = datetime(2025, 12, 31, 2, 44, 3, tzinfo=timezone.utc).timestamp()
+        assert result == expected
+
+    def test_invalid_iso_8601_raises(self):
+        """Test a malformed ISO-looking value raises ValueError."""
+        with pytest.raises(ValueError) as excinfo:
+            parse_time_param("2025-13-45T99:00:00")
+        assert "Cannot parse time" in str(excinfo.value)
+
+    def test_absolute_times_are_memoized(self):
+        """Test repeated absolute values are served from the parse cache."""
+        from drtrace_service import api as api_mod
+
+        api_mod._parse_absolute_time.cache_clear()
+        parse_time_param("1767149043")
+        parse_time_param("1767149043")
+        parse_time_param("1767149043", is_end=True)
+        info = api_mod._parse_absolute_time.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+
 
 # ============================================
 # Unit Tests for Cursor Encoding/Decoding
@@ -214,6 +240,18 @@ class TestCursorEncoding:
         assert decoded["ts"] == ts
         assert decoded["id"] == record_id
 
+    def test_decode_legacy_json_cursor(self):
+        """Cursors issued in the older base64 JSON format still decode."""
+        legacy = base64.urlsafe_b64encode(json.dumps({"ts": 1767149043.5, "id": "abc"}).encode()).decode()
+        decoded = decode_cursor(legacy)
+        assert decoded == {"ts": 1767149043.5, "id": "abc"}
+
+    def test_cursor_has_no_padding(self):
+        """Cursors are unpadded so they can be passed in URLs as-is."""
+        cursor = encode_cursor(1767149043.5, "a")
+        assert "=" not in cursor
+        assert decode_cursor(cursor)["id"] == "a"
+
 
 # ============================================
 # API Integration Tests - Time Parsing
@@ -549,6 +587,49 @@ class TestPaginationAPI:
         assert data["next_cursor"] is not None
         assert data["count"] == 100
 
+    def test_large_limit_streams_same_document(self, monkeypatch):
+        """Pages above the streaming threshold produce the same JSON as the list path."""
+        client = TestClient(app)
+        storage = ApiTestStorage()
+        monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+        now = time.time()
+        storage.records = [
+            LogRecord(ts=now - i * 0.1, level="INFO", message=f"Log {i}", application_id="test", module_name="test")
+            for i in range(450)
+        ]
+
+        resp = client.get("/logs/query?since=5m&limit=400&application_id=test")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        data = resp.json()
+        assert list(data) == ["results", "count", "has_more", "next_cursor"]
+        assert data["count"] == 400
+        assert data["has_more"] is True
+        assert data["results"][0]["message"] == "Log 0"
+        assert data["results"][-1]["message"] == "Log 399"
+
+        resp2 = client.get(f"/logs/query?since=5m&limit=400&cursor={data['next_cursor']}&application_id=test")
+        data2 = resp2.json()
+        assert data2["count"] == 50
+        assert data2["has_more"] is False
+        assert data2["next_cursor"] is None
+
+    def test_large_limit_storage_error_is_not_a_truncated_200(self, monkeypatch):
+        """A storage failure on the streaming path returns 500, not a partial body."""
+        client = TestClient(app, raise_server_exceptions=False)
+        storage = ApiTestStorage()
+        monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+        def failing_rows(**kwargs):
+            raise RuntimeError("cursor failed")
+            yield  # pragma: no cover - makes this a generator
+
+        monkeypatch.setattr(storage, "iter_time_range", failing_rows, raising=False)
+
+        resp = client.get("/logs/query?since=5m&limit=400&application_id=test")
+        assert resp.status_code == 500
+
     def test_has_more_false_on_last_page(self, monkeypatch):
         """Test has_more=false on last page."""
         client = TestClient(app)
@@ -3,6 +3,8 @@ Tests for the init-project CLI workflow.
 """
 
 import json
+import os
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
@@ -90,6 +92,35 @@ class TestConfigSchema:
         with pytest.raises(ValueError, match="Invalid environment"):
             ConfigSchema.validate(config)
 
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"drtrace": {"enabled": True, "daemon_host": "localhost", "daemon_port": 8000, "log_level": "INFO"}},
+            {"language": "go"},
+            {"agent": {"framework": "other-framework"}},
+            {"project_name": "x" * 256},
+        ],
+    )
+    def test_validation_accepts_fields_it_does_not_check(self, override):
+        """Test that keys and values outside the checked fields stay accepted."""
+        config = ConfigSchema.get_default_config(project_name="test", application_id="test")
+        config.update(override)
+
+        assert ConfigSchema.validate(config) is True
+
+    def test_schema_is_read_only(self):
+        """Test that the shared SCHEMA cannot be modified in place."""
+        with pytest.raises(TypeError):
+            ConfigSchema.SCHEMA["required"] = []
+
+    def test_default_environments_are_not_shared(self):
+        """Test that each default config gets its own environments list."""
+        first = ConfigSchema.get_default_config(project_name="a", application_id="a")
+        first["environments"].append("ci")
+
+        second = ConfigSchema.get_default_config(project_name="b", application_id="b")
+        assert second["environments"] == ["development"]
+
     def test_save_and_load_config(self):
         """Test saving and loading configuration files."""
         with TemporaryDirectory() as tmpdir:
@@ -107,6 +138,19 @@ class TestConfigSchema:
             assert loaded["project_name"] == original["project_name"]
             assert loaded["application_id"] == original["application_id"]
 
+    def test_saved_config_is_indented_json(self):
+        """Test that saved configs stay human-readable, 2-space indented JSON."""
+        with TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config = ConfigSchema.get_default_config(project_name="tëst", application_id="test")
+
+            ConfigSchema.save(config, config_path)
+
+            content = config_path.read_text(encoding="utf-8")
+            assert content.startswith('{\n  "project_name": "tëst",')
+            assert content.endswith("}\n")
+            assert json.loads(content) == config
+
     def test_load_nonexistent_file_raises(self):
         """Test that loading nonexistent file raises error."""
         with pytest.raises(FileNotFoundError):
@@ -132,6 +176,31 @@ class TestProjectInitializer:
             assert initializer.drtrace_dir == root / "_drtrace"
             assert initializer.config_path == root / "_drtrace" / "config.json"
 
+    def test_prompts_read_piped_stdin_and_default_at_eof(self):
+        """Test that non-tty stdin is read line by line and EOF yields defaults."""
+        import io
+
+        with patch("sys.stdin", io.StringIO("custom-app\n")):
+            initializer = ProjectInitializer(Path("."))
+            with patch("builtins.print"):
+                assert initializer.prompt_text("Project name", default="my-app") == "custom-app"
+                assert initializer.prompt_text("Application ID", default="my-app") == "my-app"
+                assert initializer.prompt_choice("Language:", ["python", "cpp"], default="cpp") == "cpp"
+                assert initializer.prompt_yes_no("Enable?", default=False) is False
+                assert initializer.prompt_multi_select("Envs:", ["development", "ci"]) == []
+
+    @pytest.mark.parametrize(
+        "answer, expected",
+        [("y", True), ("YES", True), ("true", True), ("1", True),
+         ("n", False), ("No", False), ("false", False), ("0", False), ("maybe", None)],
+    )
+    def test_prompt_yes_no_answers(self, answer, expected):
+        """Test accepted yes/no answers; anything else falls back to the default."""
+        initializer = ProjectInitializer(Path("."))
+        initializer._interactive = True
+        with patch("builtins.input", return_value=answer):
+            assert initializer.prompt_yes_no("Enable?", default=True) is (True if expected is None else expected)
+
     def test_create_directory_structure(self):
         """Test directory structure creation."""
         with TemporaryDirectory() as tmpdir:
@@ -162,6 +231,60 @@ class TestProjectInitializer:
                 env_config = json.loads(env_config_path.read_text())
                 assert env_config["project_name"] == "test"
 
+            # Temp files are renamed into place, never left behind
+            assert not list(initializer.drtrace_dir.glob("*.tmp"))
+
+    def test_save_replaces_existing_config_atomically(self):
+        """Test that ConfigSchema.save replaces config.json through a renamed temp file."""
+        with TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.json"
+            config_path.write_bytes(b"{}\n")
+            config = ConfigSchema.get_default_config(project_name="test", application_id="test")
+
+            with patch("drtrace_service.cli.config_schema.os.replace", wraps=os.replace) as mock_replace:
+                ConfigSchema.save(config, config_path)
+
+            mock_replace.assert_called_once_with(Path(tmpdir) / "config.json.tmp", config_path)
+            assert config_path.read_bytes() == ConfigSchema.dumps(config)
+            assert not list(Path(tmpdir).glob("*.tmp"))
+
+    def test_generate_environment_configs_serializes_once(self):
+        """Test that identical environment configs reuse one serialization."""
+        with TemporaryDirectory() as tmpdir:
+            initializer = ProjectInitializer(Path(tmpdir))
+            initializer._create_directory_structure()
+
+            config = ConfigSchema.get_default_config(
+                project_name="test",
+                application_id="test",
+                environments=["development", "staging", "production"]
+            )
+
+            with patch.object(ConfigSchema, "dumps", wraps=ConfigSchema.dumps) as mock_dumps:
+                initializer._generate_environment_configs(config)
+
+            assert mock_dumps.call_count == 1
+            contents = {
+                (initializer.drtrace_dir / f"config.{env}.json").read_bytes()
+                for env in ["development", "staging", "production"]
+            }
+            assert len(contents) == 1
+
+    def test_generate_environment_configs_reuses_caller_json(self):
+        """Test that JSON already rendered for config.json is written as-is."""
+        with TemporaryDirectory() as tmpdir:
+            initializer = ProjectInitializer(Path(tmpdir))
+            initializer._create_directory_structure()
+
+            config = ConfigSchema.get_default_config(project_name="test", application_id="test")
+            config_json = ConfigSchema.dumps(config)
+
+            with patch.object(ConfigSchema, "dumps") as mock_dumps:
+                initializer._generate_environment_configs(config, config_json)
+
+            mock_dumps.assert_not_called()
+            assert (initializer.drtrace_dir / "config.development.json").read_bytes() == config_json
+
     def test_generate_env_example(self):
         """Test .env.example generation."""
         with TemporaryDirectory() as tmpdir:
@@ -264,6 +387,36 @@ class TestProjectInitializer:
                 content = initializer._get_default_log_it_spec()
                 assert "Log-It Agent" in content
 
+    def test_packaged_agents_dir_is_resolved_once(self):
+        """Test that the packaged agents/ lookup runs once per initializer."""
+        with TemporaryDirectory() as tmpdir:
+            packaged = Path(tmpdir) / "site-packages" / "agents"
+            packaged.mkdir(parents=True)
+            (packaged / "log-help.md").write_text("# Packaged Log Help\n", encoding="utf-8")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            with patch('drtrace_service.cli.init_project.resources') as mock_resources:
+                mock_resources.files.return_value.joinpath.return_value.is_dir.return_value = True
+                mock_resources.as_file.return_value.__enter__.return_value = packaged
+                with patch('os.getcwd', return_value=tmpdir):
+                    assert initializer._load_agent_spec("log-help") == "# Packaged Log Help\n"
+                    assert initializer._packaged_agents_dir == packaged
+
+            mock_resources.files.assert_called_once_with("drtrace_service")
+
+    def test_agent_spec_bytes_returns_raw_file_contents(self):
+        """Test that _agent_spec_bytes returns the spec bytes without a decode round trip."""
+        with TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+            agents_dir.mkdir()
+            raw = "# Log Help — café\r\n".encode("utf-8")
+            (agents_dir / "log-help.md").write_bytes(raw)
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            with patch('os.getcwd', return_value=tmpdir):
+                assert initializer._agent_spec_bytes("log-help") == raw
+                assert initializer._load_agent_spec("log-help") == raw.decode("utf-8")
+
     def test_copy_agent_spec_copies_all_agents(self):
         """Test that _copy_agent_spec copies all four agents: log-analysis, log-it, log-init, and log-help."""
         with TemporaryDirectory() as tmpdir:
@@ -487,6 +640,61 @@ class TestInitProjectIntegration:
                         f"log-it.md should be consistent for {language}"
 
 
+class TestCopyAgentsRecursive:
+    """Test _copy_agents_recursive() method."""
+
+    def test_copies_nested_files_byte_for_byte(self):
+        """Test that nested agent files are copied unchanged."""
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "agents"
+            (source / "integration-guides").mkdir(parents=True)
+            (source / "log-it.md").write_bytes("# Log It ✓\r\n".encode("utf-8"))
+            (source / "integration-guides" / "cpp.md").write_bytes(b"# C++\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            target = initializer.drtrace_dir / "agents"
+            copied = initializer._copy_agents_recursive(source, target)
+
+            assert sorted(copied) == [str(Path("integration-guides") / "cpp.md"), "log-it.md"]
+            assert (target / "log-it.md").read_bytes() == "# Log It ✓\r\n".encode("utf-8")
+            assert (target / "integration-guides" / "cpp.md").read_bytes() == b"# C++\n"
+
+
+class TestCopyAgentsFromTraversable:
+    """Test _copy_agents_from_traversable() method."""
+
+    def test_filesystem_traversable_uses_recursive_copy(self):
+        """Test that an on-disk resource directory is copied via the os.walk path."""
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "agents"
+            source.mkdir()
+            (source / "log-it.md").write_text("# Log It\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            target = initializer.drtrace_dir / "agents"
+            with patch.object(initializer, "_copy_agents_recursive", wraps=initializer._copy_agents_recursive) as mock_copy:
+                initializer._copy_agents_from_traversable(source, target)
+
+            mock_copy.assert_called_once_with(source, target)
+            assert (target / "log-it.md").read_text() == "# Log It\n"
+
+    def test_non_filesystem_traversable_is_iterated(self):
+        """Test that other Traversables are copied item by item."""
+        with TemporaryDirectory() as tmpdir:
+            item = MagicMock()
+            item.name = "log-it.md"
+            item.is_file.return_value = True
+            item.read_bytes.return_value = b"# Log It\n"
+            source = MagicMock()
+            source.iterdir.return_value = [item]
+
+            initializer = ProjectInitializer(Path(tmpdir))
+            target = initializer.drtrace_dir / "agents"
+            initializer._copy_agents_from_traversable(source, target)
+
+            assert (target / "log-it.md").read_bytes() == b"# Log It\n"
+
+
 class TestCopyFrameworkGuides:
     """Test _copy_framework_guides() method."""
 
@@ -526,6 +734,70 @@ class TestCopyFrameworkGuides:
             guides_dir = initializer.drtrace_dir / "agents" / "integration-guides"
             assert guides_dir.exists(), "Integration guides directory should exist"
 
+    def test_copy_framework_guides_copies_all_development_guides(self):
+        """Test that every guide in the development agents/ tree is copied."""
+        with TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "repo"
+            source = repo / "agents" / "integration-guides"
+            source.mkdir(parents=True)
+            names = [f"guide-{i}" for i in range(6)]
+            for name in names:
+                (source / f"{name}.md").write_text(f"# {name}\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            initializer._create_directory_structure()
+            with patch('os.getcwd', return_value=str(repo)):
+                with patch('builtins.print') as mock_print:
+                    initializer._copy_framework_guides()
+
+            guides_dir = initializer.drtrace_dir / "agents" / "integration-guides"
+            for name in names:
+                assert (guides_dir / f"{name}.md").read_text() == f"# {name}\n"
+            assert mock_print.call_count == len(names)
+
+    def test_copy_framework_guides_skips_guides_copied_with_agents(self):
+        """Test that guides already copied with the agents/ tree are not copied again."""
+        with TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir) / "repo"
+            source = repo / "agents" / "integration-guides"
+            source.mkdir(parents=True)
+            (source / "cpp-ros.md").write_text("# ROS\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            initializer._create_directory_structure()
+            with patch("builtins.print"):
+                initializer._copy_agents_recursive(repo / "agents", initializer.drtrace_dir / "agents")
+
+            with patch('os.getcwd', return_value=str(repo)):
+                with patch('drtrace_service.cli.init_project.shutil.copyfile') as mock_copy:
+                    initializer._copy_framework_guides()
+
+            mock_copy.assert_not_called()
+            guides_dir = initializer.drtrace_dir / "agents" / "integration-guides"
+            assert (guides_dir / "cpp-ros.md").read_text() == "# ROS\n"
+
+    def test_copy_framework_guides_overrides_guides_from_other_agents_tree(self):
+        """Test that development guides still replace ones copied from the packaged agents/."""
+        with TemporaryDirectory() as tmpdir:
+            packaged = Path(tmpdir) / "packaged" / "agents"
+            (packaged / "integration-guides").mkdir(parents=True)
+            (packaged / "integration-guides" / "cpp-ros.md").write_text("# packaged\n")
+            repo = Path(tmpdir) / "repo"
+            (repo / "agents" / "integration-guides").mkdir(parents=True)
+            (repo / "agents" / "integration-guides" / "cpp-ros.md").write_text("# dev\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            initializer._create_directory_structure()
+            with patch("builtins.print"):
+                initializer._copy_agents_recursive(packaged, initializer.drtrace_dir / "agents")
+
+            with patch('os.getcwd', return_value=str(repo)):
+                with patch("builtins.print"):
+                    initializer._copy_framework_guides()
+
+            guides_dir = initializer.drtrace_dir / "agents" / "integration-guides"
+            assert (guides_dir / "cpp-ros.md").read_text() == "# dev\n"
+
     def test_copy_framework_guides_handles_missing_resources_gracefully(self):
         """Test that _copy_framework_guides handles missing resources gracefully."""
         with TemporaryDirectory() as tmpdir:
@@ -542,3 +814,272 @@ class TestCopyFrameworkGuides:
             # Directory should still be created
             guides_dir = initializer.drtrace_dir / "agents" / "integration-guides"
             assert guides_dir.exists(), "Integration guides directory should exist even if no guides found"
+
+
+class TestCopyCppHeader:
+    """Test _copy_cpp_header() method."""
+
+    def test_copies_header_contents(self):
+        """Test that the header is vendored into third_party/drtrace/."""
+        with TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "drtrace_sink.hpp"
+            source.write_bytes(b"#pragma once\n")
+
+            initializer = ProjectInitializer(Path(tmpdir) / "project")
+            with patch.object(initializer, "_find_cpp_header_source", return_value=source):
+                initializer._copy_cpp_header()
+
+            dest = initializer.project_root / "third_party" / "drtrace" / "drtrace_sink.hpp"
+            assert dest.read_bytes() == b"#pragma once\n"
+
+    def test_npm_root_skipped_without_npm(self):
+        """Test that npm is not spawned when it is not on PATH."""
+        from drtrace_service.cli import init_project
+
+        init_project._npm_root.cache_clear()
+        try:
+            with patch("shutil.which", return_value=None), patch("subprocess.run") as mock_run:
+                assert init_project._npm_root("/tmp") is None
+                mock_run.assert_not_called()
+        finally:
+            init_project._npm_root.cache_clear()
+
+    def test_npm_root_runs_once_per_directory(self):
+        """Test that `npm root` results, including failures, are cached."""
+        from drtrace_service.cli import init_project
+
+        init_project._npm_root.cache_clear()
+        try:
+            with patch("shutil.which", return_value="/usr/bin/npm"), patch("subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(returncode=1, stdout="")
+                assert init_project._npm_root("/tmp") is None
+                assert init_project._npm_root("/tmp") is None
+                assert mock_run.call_count == 1
+        finally:
+            init_project._npm_root.cache_clear()
+
+
+class TestApplySetupSuggestions:
+    """Test applying setup suggestions to project files."""
+
+    def test_python_points_in_one_file_are_applied_together(self):
+        """Test that several points in one file share a backup, read and write."""
+        from drtrace_service.setup_suggestions import IntegrationPoint, PythonSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            main_py = Path(tmpdir) / "main.py"
+            main_py.write_text("import os\nimport sys\n\nmain()\n", encoding="utf-8")
+
+            suggestion = PythonSetupSuggestion(integration_points=[
+                IntegrationPoint(main_py, 3, "setup_logging()", "after imports", "required"),
+                IntegrationPoint(main_py, 1, "# drtrace", "top of file", "optional"),
+            ])
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch.object(initializer, "_backup_file") as mock_backup, \
+                    patch("builtins.print"), \
+                    patch.object(Path, "write_text", autospec=True, side_effect=Path.write_text) as mock_write:
+                initializer._apply_python_setup_suggestions(suggestion)
+
+            mock_backup.assert_called_once_with(main_py)
+            assert mock_write.call_count == 1
+            # Both line numbers refer to the original file
+            assert main_py.read_text(encoding="utf-8").splitlines() == [
+                "", "# drtrace", "", "import os", "import sys", "", "setup_logging()", "", "", "main()",
+            ]
+
+    @pytest.mark.parametrize(
+        "original, line_number, expected",
+        [
+            ("a\nb\n", 2, "a\n\nsetup()\n\nb\n"),
+            ("a\nb\n", 9, "a\nb\n\nsetup()\n\n"),
+            ("a\nb", 9, "a\nb\n\nsetup()\n\n"),
+            ("", 1, "\nsetup()\n\n"),
+        ],
+    )
+    def test_python_point_is_spliced_at_line(self, original, line_number, expected):
+        """Test that setup code is spliced in at the start of the target line."""
+        from drtrace_service.setup_suggestions import IntegrationPoint, PythonSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            main_py = Path(tmpdir) / "main.py"
+            main_py.write_text(original, encoding="utf-8")
+            suggestion = PythonSetupSuggestion(integration_points=[
+                IntegrationPoint(main_py, line_number, "setup()", "entry", "required"),
+            ])
+
+            with patch("builtins.print"):
+                ProjectInitializer(Path(tmpdir))._apply_python_setup_suggestions(suggestion)
+
+            assert main_py.read_text(encoding="utf-8") == expected
+
+    def test_cmake_block_already_present_skips_backup_and_write(self):
+        """Test that an already-applied CMake block causes no backup or rewrite."""
+        from drtrace_service.setup_suggestions import CmakeChange, CppSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            cmake_file = Path(tmpdir) / "CMakeLists.txt"
+            block = "FetchContent_Declare(drtrace)"
+            cmake_file.write_text(f"project(app)\n{block}\n", encoding="utf-8")
+            suggestion = CppSetupSuggestion(cmake_changes=[
+                CmakeChange(cmake_file, "after project()", block, True, "fetch drtrace"),
+            ])
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch.object(initializer, "_backup_file") as mock_backup, \
+                    patch.object(Path, "write_text") as mock_write, \
+                    patch("builtins.print"):
+                initializer._apply_cpp_setup_suggestions(suggestion)
+
+            mock_backup.assert_not_called()
+            mock_write.assert_not_called()
+
+    def test_cmake_changes_for_one_file_are_written_once(self):
+        """Test that several CMake blocks for one file share a backup and write."""
+        from drtrace_service.setup_suggestions import CmakeChange, CppSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            cmake_file = Path(tmpdir) / "CMakeLists.txt"
+            cmake_file.write_text("project(app)\ninclude(FetchContent)\nadd_executable(app main.cpp)\n", encoding="utf-8")
+            suggestion = CppSetupSuggestion(cmake_changes=[
+                CmakeChange(cmake_file, "after include(FetchContent)", "FetchContent_Declare(drtrace)", True, "fetch"),
+                CmakeChange(cmake_file, "after include(FetchContent)", "FetchContent_Declare(drtrace)", True, "dup"),
+                CmakeChange(cmake_file, "after project()", "set(DRTRACE ON)", True, "flag"),
+            ])
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch.object(initializer, "_backup_file") as mock_backup, \
+                    patch.object(Path, "write_text", autospec=True, side_effect=Path.write_text) as mock_write, \
+                    patch("builtins.print"):
+                initializer._apply_cpp_setup_suggestions(suggestion)
+
+            mock_backup.assert_called_once_with(cmake_file)
+            assert mock_write.call_count == 1
+            assert cmake_file.read_text(encoding="utf-8").splitlines() == [
+                "project(app)", "", "set(DRTRACE ON)", "", "include(FetchContent)",
+                "", "FetchContent_Declare(drtrace)", "", "add_executable(app main.cpp)",
+            ]
+
+    def test_js_snippets_in_one_file_are_appended_once(self):
+        """Test that JS/TS snippets for one file are appended in a single write."""
+        from drtrace_service.setup_suggestions import IntegrationPoint, JsSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            index_js = Path(tmpdir) / "src" / "index.js"
+            suggestion = JsSetupSuggestion(
+                package_manager="npm",
+                install_command="npm install drtrace",
+                initialization_points=[
+                    IntegrationPoint(index_js, 1, "init();", "entry", "required"),
+                    IntegrationPoint(index_js, 1, "init();", "entry", "required"),
+                    IntegrationPoint(index_js, 1, "track();", "entry", "optional"),
+                ],
+            )
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch.object(initializer, "_backup_file") as mock_backup, patch("builtins.print"):
+                initializer._apply_js_setup_suggestions(suggestion)
+
+            mock_backup.assert_called_once_with(index_js)
+            content = index_js.read_text(encoding="utf-8")
+            assert content.count("init();") == 1
+            assert content.count("// DrTrace initialization suggestion") == 2
+            assert content.index("init();") < content.index("track();")
+
+    def test_backup_file_copies_each_file_once(self):
+        """Test that repeated backups of one file keep only the first copy."""
+        with TemporaryDirectory() as tmpdir:
+            main_py = Path(tmpdir) / "main.py"
+            main_py.write_text("original\n", encoding="utf-8")
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch("builtins.print"):
+                initializer._backup_file(main_py)
+                main_py.write_text("edited\n", encoding="utf-8")
+                initializer._backup_file(main_py)
+                initializer._backup_file(Path(tmpdir) / "missing.py")
+
+            backups = list(Path(tmpdir).glob("main.py.backup.*"))
+            assert len(backups) == 1
+            assert backups[0].read_text(encoding="utf-8") == "original\n"
+
+    def test_backups_share_one_run_timestamp(self):
+        """Test that all backups in one run use the same UTC timestamp suffix."""
+        with TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "main.py"
+            second = Path(tmpdir) / "app.py"
+            first.write_text("a\n", encoding="utf-8")
+            second.write_text("b\n", encoding="utf-8")
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch("builtins.print"), \
+                    patch("time.gmtime", side_effect=[time.gmtime(0), time.gmtime(3600)]):
+                initializer._backup_file(first)
+                initializer._backup_file(second)
+
+            assert (Path(tmpdir) / "main.py.backup.19700101000000").exists()
+            assert (Path(tmpdir) / "app.py.backup.19700101000000").exists()
+
+    def test_verify_reuses_package_json_parsed_during_apply(self):
+        """Test that verification does not read package.json again after applying."""
+        from drtrace_service.setup_suggestions import JsSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            package_json = Path(tmpdir) / "package.json"
+            package_json.write_text('{"name": "app", "dependencies": {"left-pad": "1.0.0"}}', encoding="utf-8")
+            suggestion = JsSetupSuggestion(package_manager="npm", install_command="npm install drtrace")
+            initializer = ProjectInitializer(Path(tmpdir))
+
+            with patch("builtins.print") as mock_print:
+                initializer._apply_js_setup_suggestions(suggestion)
+                with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+                    initializer._verify_applied_suggestions(None, None, suggestion)
+
+            mock_print.assert_any_call(f"   • ✅ drtrace dependency present in {package_json}")
+            assert json.loads(package_json.read_text(encoding="utf-8"))["dependencies"]["drtrace"] == "^0.2.0"
+
+    def test_package_json_with_drtrace_is_not_backed_up_or_rewritten(self):
+        """Test that an unchanged package.json gets neither a backup nor a write."""
+        from drtrace_service.setup_suggestions import JsSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            package_json = Path(tmpdir) / "package.json"
+            original = b'{"name": "app", "dependencies": {"drtrace": "^0.1.0"}}'
+            package_json.write_bytes(original)
+            suggestion = JsSetupSuggestion(package_manager="npm", install_command="npm install drtrace")
+
+            with patch("builtins.print") as mock_print, \
+                    patch.object(Path, "write_bytes", side_effect=AssertionError("rewritten")):
+                ProjectInitializer(Path(tmpdir))._apply_js_setup_suggestions(suggestion)
+
+            mock_print.assert_called_once_with(f"   • drtrace dependency already present in {package_json}")
+            assert package_json.read_bytes() == original
+            assert list(Path(tmpdir).glob("package.json.backup.*")) == []
+
+    @pytest.mark.parametrize(
+        "original, expected_keys, expected_deps",
+        [
+            ('{"name": "app", "version": "1.0.0", "dependencies": {"zod": "3"}}',
+             ["name", "version", "dependencies"], ["zod", "drtrace"]),
+            ('{"dependencies": {"zod": "3"}, "name": "app"}',
+             ["dependencies", "name"], ["drtrace", "zod"]),
+        ],
+    )
+    def test_package_json_update_keeps_key_order(self, original, expected_keys, expected_deps):
+        """Test that adding drtrace keeps the existing key order unless the file was sorted."""
+        from drtrace_service.setup_suggestions import JsSetupSuggestion
+
+        with TemporaryDirectory() as tmpdir:
+            package_json = Path(tmpdir) / "package.json"
+            package_json.write_text(original, encoding="utf-8")
+            suggestion = JsSetupSuggestion(package_manager="npm", install_command="npm install drtrace")
+
+            with patch("builtins.print"):
+                ProjectInitializer(Path(tmpdir))._apply_js_setup_suggestions(suggestion)
+
+            content = package_json.read_text(encoding="utf-8")
+            data = json.loads(content)
+            assert list(data) == expected_keys
+            assert list(data["dependencies"]) == expected_deps
+            assert data["dependencies"]["drtrace"] == "^0.2.0"
+            assert content.startswith("{\n  \"") and content.endswith("}\n")
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from drtrace_service.code_context import load_file_contents, resolve_file_path  # type: ignore[import]
+from drtrace_service.code_context import load_file_contents, resolve_file_path, search_in_file  # type: ignore[import]
 from drtrace_service.config import load_source_roots  # type: ignore[import]
 
 
@@ -55,6 +55,21 @@ def test_resolve_relative_path_under_root(tmp_path, monkeypatch):
   assert result.path == file_path
 
 
+def test_resolve_relative_root_returns_absolute_path(tmp_path, monkeypatch):
+  (tmp_path / "src" / "pkg").mkdir(parents=True)
+  (tmp_path / "lib").mkdir()
+  file_path = tmp_path / "src" / "pkg" / "mod.py"
+  file_path.write_text("# test")
+  (tmp_path / "lib" / "pkg").write_text("not a directory")
+
+  monkeypatch.chdir(tmp_path)
+
+  result = resolve_file_path("pkg/mod.py", roots=[Path("lib"), Path("src")])
+  assert result.ok
+  assert result.path == file_path
+  assert result.path.is_absolute()
+
+
 def test_resolve_missing_file_returns_clear_error(monkeypatch, tmp_path):
   monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(tmp_path))
 
@@ -110,3 +125,94 @@ def test_load_file_contents_permission_error_logs_and_reports(caplog, tmp_path,
 
 
 
+
+
+def test_load_file_contents_reuses_unchanged_file(tmp_path, monkeypatch):
+  root = tmp_path / "src"
+  root.mkdir()
+  file_path = root / "mod.py"
+  file_path.write_text("x = 1\n")
+
+  monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(root))
+
+  reads = []
+  original_read_text = Path.read_text
+
+  def counting_read_text(self, *args, **kwargs):
+    reads.append(self)
+    return original_read_text(self, *args, **kwargs)
+
+  monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+  assert load_file_contents("mod.py").content == "x = 1\n"
+  assert load_file_contents("mod.py").content == "x = 1\n"
+  assert search_in_file(file_path, "x").matches[0].line_no == 1
+  assert reads == [file_path]
+
+  # A changed size (or mtime) invalidates the cached text
+  file_path.write_text("x = 12\n")
+  assert load_file_contents("mod.py").content == "x = 12\n"
+  assert len(reads) == 2
+
+
+def test_resolve_file_path_reuses_hit_and_never_caches_misses(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  roots = [tmp_path / f"root{i}" for i in range(4)]
+  for root in roots:
+    root.mkdir()
+  target = roots[-1] / "mod.py"
+  target.write_text("# test")
+
+  checked = []
+  original = code_context._stat_regular
+
+  def counting(path):
+    checked.append(path)
+    return original(path)
+
+  monkeypatch.setattr(code_context, "_stat_regular", counting)
+
+  assert resolve_file_path("mod.py", roots=roots).path == target
+  assert len(checked) == 4
+  assert resolve_file_path("mod.py", roots=roots).path == target
+  assert len(checked) == 5
+
+  # A file that appears after a miss is found on the next lookup
+  assert not resolve_file_path("new.py", roots=roots).ok
+  (roots[0] / "new.py").write_text("# new")
+  assert resolve_file_path("new.py", roots=roots).path == roots[0] / "new.py"
+
+  # A cached hit that disappears falls back to a full search
+  target.unlink()
+  assert not resolve_file_path("mod.py", roots=roots).ok
+
+
+def test_resolve_file_path_resolves_symlinks(tmp_path):
+  real_root = tmp_path / "real"
+  real_root.mkdir()
+  (real_root / "a.py").write_text("# a")
+  (real_root / "b.py").write_text("# b")
+  link_root = tmp_path / "link"
+  link_root.symlink_to(real_root, target_is_directory=True)
+  (real_root / "cur.py").symlink_to(real_root / "a.py")
+
+  result = resolve_file_path("cur.py", roots=[link_root])
+  assert result.path == (link_root / "cur.py").resolve() == real_root / "a.py"
+  assert resolve_file_path("cur.py", roots=[link_root]).path == real_root / "a.py"
+
+  # Retargeting the symlink is picked up despite the cached hit
+  (real_root / "cur.py").unlink()
+  (real_root / "cur.py").symlink_to(real_root / "b.py")
+  assert resolve_file_path("cur.py", roots=[link_root]).path == real_root / "b.py"
+
+
+def test_source_roots_parsing_follows_env_changes(monkeypatch, tmp_path):
+  monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(tmp_path / "a"))
+  first = load_source_roots()
+  first.roots.append(tmp_path / "mutated")
+
+  assert load_source_roots().roots == [tmp_path / "a"]
+
+  monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(tmp_path / "b"))
+  assert load_source_roots().roots == [tmp_path / "b"]
@@ -1,5 +1,8 @@
+import shutil
 from pathlib import Path
 
+import pytest
+
 from drtrace_service.code_context import search_in_file, search_in_roots  # type: ignore[import]
 from drtrace_service.config import load_search_config  # type: ignore[import]
 
@@ -36,6 +39,84 @@ def test_search_in_file_no_matches(tmp_path):
   assert result.matches == []
 
 
+def test_search_in_file_case_handling(tmp_path):
+  file_path = _make_file(tmp_path, "mod3.py", "class Foo:\n    FOO = 1\nfoo = Foo()\n")
+
+  insensitive = search_in_file(file_path, "foo")
+  assert [(m.line_no, m.line_text) for m in insensitive.matches] == [
+    (1, "class Foo:"),
+    (2, "    FOO = 1"),
+    (3, "foo = Foo()"),
+  ]
+
+  sensitive = search_in_file(file_path, "FOO", case_sensitive=True)
+  assert [m.line_no for m in sensitive.matches] == [2]
+
+
+def test_search_in_file_streams_large_files(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  lines = [f"line {i} {'FOO' if i % 7 == 0 else 'bar'} café" for i in range(1, 60)]
+  file_path = tmp_path / "big.py"
+  file_path.write_bytes(("\r\n".join(lines[:30]) + "\n" + "\n".join(lines[30:])).encode("utf-8"))
+
+  expected = search_in_file(file_path, "foo")
+  expected_sensitive = search_in_file(file_path, "bar café", case_sensitive=True)
+
+  # Tiny blocks force lines to straddle reads
+  monkeypatch.setattr(code_context, "_STREAM_SEARCH_MIN_BYTES", 1)
+  monkeypatch.setattr(code_context, "_STREAM_SEARCH_BLOCK", 7)
+  monkeypatch.setattr(code_context, "_read_source_cached", None)
+
+  streamed = search_in_file(file_path, "foo")
+  streamed_sensitive = search_in_file(file_path, "bar café", case_sensitive=True)
+
+  assert streamed.ok
+  assert streamed.matches == expected.matches
+  assert [m.line_no for m in streamed.matches] == [7, 14, 21, 28, 35, 42, 49, 56]
+  assert streamed_sensitive.matches == expected_sensitive.matches
+  assert streamed_sensitive.matches[-1].line_text == "line 59 bar café"
+
+
+@pytest.mark.parametrize("block", [1, 2, 5, 64])
+def test_search_in_file_streaming_matches_whole_file_line_rules(tmp_path, monkeypatch, block):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  # CRLF, lone CR, form feed, vertical tab and U+2028 all end lines for the
+  # whole-file search; a trailing lone CR and non-ASCII casing are included.
+  content = "foo 1\r\nbar\rFoo 2\x0cfoo 3\x0bBAR\u2028ÉCOLE foo\r\n\r\nlast foo\r"
+  file_path = tmp_path / "mixed.py"
+  file_path.write_bytes(content.encode("utf-8"))
+
+  queries = [("foo", False), ("Foo", True), ("école", False), ("bar", False)]
+  expected = [search_in_file(file_path, q, case_sensitive=cs).matches for q, cs in queries]
+
+  monkeypatch.setattr(code_context, "_STREAM_SEARCH_MIN_BYTES", 1)
+  monkeypatch.setattr(code_context, "_STREAM_SEARCH_BLOCK", block)
+  monkeypatch.setattr(code_context, "_read_source_cached", None)
+
+  streamed = [search_in_file(file_path, q, case_sensitive=cs).matches for q, cs in queries]
+  assert streamed == expected
+  assert [(m.line_no, m.line_text) for m in streamed[0]] == [
+    (1, "foo 1"), (3, "Foo 2"), (4, "foo 3"), (6, "ÉCOLE foo"), (8, "last foo"),
+  ]
+
+
+def test_search_in_file_streaming_rejects_invalid_utf8(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  file_path = tmp_path / "bad.py"
+  file_path.write_bytes(b"foo = 1\n\xff\xfe foo\n")
+  whole = search_in_file(file_path, "foo")
+
+  monkeypatch.setattr(code_context, "_STREAM_SEARCH_MIN_BYTES", 1)
+  streamed = search_in_file(file_path, "foo")
+
+  assert not whole.ok
+  assert not streamed.ok
+  assert streamed.matches == []
+
+
 def test_search_in_roots_across_multiple_files(tmp_path, monkeypatch):
   root = tmp_path / "src"
   root.mkdir()
@@ -52,6 +133,84 @@ def test_search_in_roots_across_multiple_files(tmp_path, monkeypatch):
   assert paths == {"a.py", "b.py"}
 
 
+def test_search_in_roots_keeps_walk_order_and_limit(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+  from drtrace_service.code_context import iter_source_files  # type: ignore[import]
+
+  root = tmp_path / "src"
+  for i in range(20):
+    _make_file(root, f"pkg{i % 3}/mod{i:02d}.py", "foo = 1\nfoo = 2\n")
+
+  monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(root))
+  monkeypatch.setattr(code_context, "_RG_BIN", None)
+
+  walk_order = [p for p in iter_source_files(roots=[root], extensions=[".py"])]
+  result = search_in_roots("foo", roots=[root], extensions=[".py"], max_results=7)
+
+  assert result.ok
+  assert [(m.file_path, m.line_no) for m in result.matches] == [
+    (path, line_no) for path in walk_order[:4] for line_no in (1, 2)
+  ][:7]
+
+
+def test_search_in_roots_falls_back_when_ripgrep_fails(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  root = tmp_path / "src"
+  _make_file(root, "a.py", "def foo():\n    pass\n")
+
+  monkeypatch.setattr(code_context, "_RG_BIN", str(tmp_path / "missing-rg"))
+
+  result = search_in_roots("FOO", roots=[root], extensions=[".py"])
+  assert result.ok
+  assert [(m.line_no, m.line_text) for m in result.matches] == [(1, "def foo():")]
+
+
+@pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+def test_search_in_roots_ripgrep_matches_python_search(tmp_path, monkeypatch):
+  from drtrace_service import code_context  # type: ignore[import]
+
+  root = tmp_path / "src"
+  _make_file(root, "a.py", "def foo():\n    pass\n")
+  _make_file(root, "pkg/b.py", "Foo = 1\r\n")
+  _make_file(root, ".hidden/b.py", "foo = 2\n")
+  _make_file(root, "node_modules/dep/c.py", "foo = 3\n")
+  _make_file(root, "c.txt", "foo in text\n")
+  _make_file(root, ".gitignore", "*.py\n")
+
+  rg_result = search_in_roots("foo", roots=[root], extensions=[".py"])
+  monkeypatch.setattr(code_context, "_RG_BIN", None)
+  py_result = search_in_roots("foo", roots=[root], extensions=[".py"])
+
+  def key(match):
+    return (str(match.file_path), match.line_no, match.line_text)
+
+  assert sorted(rg_result.matches, key=key) == sorted(py_result.matches, key=key)
+  assert len(py_result.matches) == 4
+
+
+def test_iter_source_files_matches_rglob(tmp_path):
+  from drtrace_service.code_context import iter_source_files  # type: ignore[import]
+
+  root = tmp_path / "src"
+  _make_file(root, "app/main.py", "")
+  _make_file(root, "app/util.pyi", "")
+  _make_file(root, "app/notes.txt", "")
+  _make_file(root, "app/archive.tar.py", "")
+  _make_file(root, "app/.py", "")
+  _make_file(root, ".git/hooks/pre-commit.py", "")
+  _make_file(root, "node_modules/pkg/index.py", "")
+  _make_file(root, "build/lib/app/main.py", "")
+  _make_file(root, "dist/main.py", "")
+
+  exts = {".py", ".pyi"}
+  expected = sorted(p for p in root.rglob("*") if p.is_file() and p.suffix in exts)
+  found = sorted(iter_source_files(roots=[root], extensions=list(exts)))
+  assert found == expected
+  assert root / "build/lib/app/main.py" in found
+  assert root / ".git/hooks/pre-commit.py" in found
+
+
 def test_search_in_roots_no_matches(tmp_path, monkeypatch):
   root = tmp_path / "src"
   root.mkdir()
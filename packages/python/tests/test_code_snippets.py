@@ -91,3 +91,24 @@ def test_get_code_snippet_invalid_line_number(monkeypatch, tmp_path):
   assert result.error == "line_no must be >= 1"
 
 
+
+
+def test_get_code_snippet_reuses_cached_line_split(tmp_path, monkeypatch):
+  from drtrace_service import code_context
+
+  root = tmp_path / "src"
+  root.mkdir()
+  _make_file(root, "mod.py", "\n".join(f"line {i}" for i in range(1, 101)))
+
+  monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(root))
+
+  first = get_code_snippet("mod.py", line_no=10, context_lines=1)
+  source = code_context._read_source_cached((root / "mod.py").resolve())
+  cached_lines = source.lines
+
+  second = get_code_snippet("mod.py", line_no=90, context_lines=1)
+
+  assert [line.text for line in first.lines] == ["line 9", "line 10", "line 11"]
+  assert [line.text for line in second.lines] == ["line 89", "line 90", "line 91"]
+  assert cached_lines is not None
+  assert source.lines is cached_lines
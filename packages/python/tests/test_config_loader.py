@@ -21,6 +21,14 @@ class TestConfigSchema:
         assert validated["drtrace"]["applicationId"] == "my-app"
         assert validated["drtrace"]["enabled"] is True
 
+    def test_get_default_returns_independent_copy(self):
+        """Test that mutating the returned defaults leaves DEFAULTS intact."""
+        defaults = ConfigSchema.get_default()
+        defaults["drtrace"]["applicationId"] = "changed"
+        defaults["environment"]["production"] = {}
+        assert ConfigSchema.DEFAULTS["drtrace"]["applicationId"] == "my-app"
+        assert ConfigSchema.DEFAULTS["environment"] == {}
+
     def test_validate_rejects_missing_required_fields(self):
         """Test validation fails with missing required fields."""
         config = {"project": {}}  # Missing name
@@ -108,6 +116,13 @@ class TestConfigMerging:
         ConfigLoader._merge_configs(base, overrides)
         assert base == base_copy
 
+    def test_merge_configs_does_not_alias_overrides(self):
+        """Test that nested override values are copied into the result."""
+        overrides = {"environment": {"production": {"logLevel": "error"}}}
+        result = ConfigLoader._merge_configs({"environment": {}}, overrides)
+        result["environment"]["production"]["logLevel"] = "debug"
+        assert overrides["environment"]["production"]["logLevel"] == "error"
+
 
 class TestConfigLoading:
     """Tests for full configuration loading workflow."""
@@ -431,6 +446,27 @@ class TestEnvironmentVariableOverrides:
                 del os.environ["DRTRACE_DAEMON_URL"]
 
 
+    def test_env_var_override_does_not_modify_input(self):
+        """Test that env var overrides leave the input config untouched."""
+        config = ConfigSchema.get_default()
+        os.environ["DRTRACE_APPLICATION_ID"] = "from-env"
+        try:
+            result = ConfigLoader._apply_env_var_overrides(config)
+        finally:
+            del os.environ["DRTRACE_APPLICATION_ID"]
+        assert result["drtrace"]["applicationId"] == "from-env"
+        assert config["drtrace"]["applicationId"] == "my-app"
+
+    def test_no_drtrace_env_vars_returns_config_unchanged(self, monkeypatch):
+        """Test that configs pass through when no DRTRACE_* vars are set."""
+        for key in list(os.environ):
+            if key.startswith("DRTRACE_"):
+                monkeypatch.delenv(key)
+        monkeypatch.setenv("OTHER_APPLICATION_ID", "ignored")
+        config = ConfigSchema.get_default()
+        assert ConfigLoader._apply_env_var_overrides(config) == config
+
+
 class TestInvalidConfigurations:
     """Tests for error handling with invalid configurations."""
 
@@ -447,6 +483,16 @@ class TestInvalidConfigurations:
             with pytest.raises(ValueError, match="Invalid JSON"):
                 ConfigLoader.load(project_root=tmpdir)
 
+    def test_load_json_file_reads_utf8(self):
+        """Test that non-ASCII values survive loading from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / "config.json"
+            config_file.write_bytes(
+                json.dumps({"project": {"description": "caf\u00e9"}}, ensure_ascii=False).encode("utf-8")
+            )
+            data = ConfigLoader._load_json_file(config_file)
+            assert data["project"]["description"] == "caf\u00e9"
+
     def test_missing_config_file_uses_defaults(self):
         """Test that missing config file falls back to defaults."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -11,6 +11,7 @@ These tests verify:
 import time
 from typing import Any, Dict, List, Optional
 
+import pytest
 from fastapi.testclient import TestClient
 
 from drtrace_service import ai_model as ai_model_mod  # type: ignore[import]
@@ -20,6 +21,14 @@ from drtrace_service.api import app  # type: ignore[import]
 from drtrace_service.models import LogBatch, LogRecord  # type: ignore[import]
 
 
+@pytest.fixture(autouse=True)
+def _fresh_analysis_cache():
+    """Tests share one process-wide result cache; start each with it empty."""
+    analysis_mod.clear_analysis_cache()
+    yield
+    analysis_mod.clear_analysis_cache()
+
+
 class CrossModuleStorage(storage_mod.LogStorage):  # type: ignore[misc]
     """Storage that supports cross-module queries."""
 
@@ -450,3 +459,437 @@ def test_cross_module_analysis_handles_empty_results(monkeypatch):
     assert result.components == {"services": {}, "modules": {}}
     assert result.logs_by_component == {}
 
+
+
+def test_cross_module_analysis_caches_repeated_queries(monkeypatch):
+    """Identical cross-module queries are served from the result cache."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+    analysis_mod.clear_analysis_cache()
+
+    calls = {"query": 0}
+    original_query = storage.query_time_range
+
+    def counting_query(*args, **kwargs):
+        calls["query"] += 1
+        return original_query(*args, **kwargs)
+
+    monkeypatch.setattr(storage, "query_time_range", counting_query)
+
+    base_time = time.time()
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=base_time + 1.0,
+                    level="ERROR",
+                    message="Error in module_a",
+                    application_id="test-app",
+                    module_name="module_a",
+                    service_name="service_1",
+                    context={},
+                )
+            ],
+        )
+    )
+
+    kwargs = dict(
+        application_id="test-app",
+        start_ts=base_time,
+        end_ts=base_time + 10.0,
+        module_names=["module_a"],
+    )
+    first = analysis_mod.analyze_cross_module_incident(**kwargs)
+    second = analysis_mod.analyze_cross_module_incident(**kwargs)
+
+    assert second == first
+    assert calls["query"] == 1
+
+    # Hits are copies: mutating one result does not change later hits
+    assert second is not first
+    second.logs_by_component.clear()
+    second.components["services"]["injected"] = 1
+    third = analysis_mod.analyze_cross_module_incident(**kwargs)
+    assert third == first
+    assert calls["query"] == 1
+
+    analysis_mod.clear_analysis_cache()
+    analysis_mod.analyze_cross_module_incident(**kwargs)
+    assert calls["query"] == 2
+
+    # A different model backend does not share the cached result
+    monkeypatch.setattr(analysis_mod, "get_ai_model", lambda: ai_model_mod.StubAIModel())
+    analysis_mod.analyze_cross_module_incident(**kwargs)
+    assert calls["query"] == 3
+
+
+def test_cross_module_cache_buckets_relative_windows(monkeypatch):
+    """Windows that shift within one time bucket share a cache entry."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    calls = {"query": 0}
+    original_query = storage.query_time_range
+
+    def counting_query(*args, **kwargs):
+        calls["query"] += 1
+        return original_query(*args, **kwargs)
+
+    monkeypatch.setattr(storage, "query_time_range", counting_query)
+
+    # A 10 minute window is bucketed to the minute
+    minute = (time.time() // 60 - 20) * 60
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=minute + 30.0,
+                    level="ERROR",
+                    message="Error in module_a",
+                    application_id="test-app",
+                    module_name="module_a",
+                    service_name="service_1",
+                    context={},
+                )
+            ],
+        )
+    )
+
+    for offset in (1.0, 5.0):
+        analysis_mod.analyze_cross_module_incident(
+            application_id="test-app", start_ts=minute + offset, end_ts=minute + offset + 600.0
+        )
+    assert calls["query"] == 1
+
+    # The next bucket, or a short window keyed exactly, is queried again
+    analysis_mod.analyze_cross_module_incident(
+        application_id="test-app", start_ts=minute + 61.0, end_ts=minute + 661.0
+    )
+    assert calls["query"] == 2
+    for offset in (1.0, 3.0):
+        analysis_mod.analyze_cross_module_incident(
+            application_id="test-app", start_ts=minute + offset, end_ts=minute + offset + 5.0
+        )
+    assert calls["query"] == 4
+
+
+def test_clear_logs_endpoint_drops_cached_analyses(monkeypatch):
+    """Clearing an application's logs invalidates cached cross-module results."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+    monkeypatch.setattr(storage, "delete_by_application", lambda *args, **kwargs: 0, raising=False)
+    client = TestClient(app)
+
+    analysis_mod._cross_module_cache.set(("stale",), (None, None))
+    resp = client.post("/logs/clear", params={"application_id": "test-app"})
+
+    assert resp.status_code == 200
+    assert len(analysis_mod._cross_module_cache) == 0
+
+
+def test_analysis_result_cache_expires_and_evicts(monkeypatch):
+    """Entries expire after the TTL and the oldest entry is evicted at capacity."""
+    cache = analysis_mod.AnalysisResultCache(max_size=2, ttl_seconds=10.0)
+    now = [1000.0]
+    monkeypatch.setattr(analysis_mod.time, "monotonic", lambda: now[0])
+
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    assert cache.get(("a",)) == 1  # refreshes "a" as most recently used
+    cache.set(("c",), 3)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1
+
+    now[0] += 11.0
+    assert cache.get(("a",)) is None
+    assert cache.get(("c",)) is None
+    assert len(cache) == 0
+
+
+def test_bucketed_time_range_matches_single_query(monkeypatch):
+    """Wide windows are split into buckets without losing, duplicating or reordering logs."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    start_ts = 1_700_000_000.0
+    end_ts = start_ts + 4 * 3600.0
+    # Includes a record exactly on a bucket boundary and one at each window edge.
+    boundary_ts = (start_ts // 3600 + 1) * 3600
+    timestamps = [start_ts, start_ts + 10.0, boundary_ts, boundary_ts + 1.0, start_ts + 7200.5, end_ts]
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(ts=ts, level="ERROR", message=f"log {i}", application_id="test-app", module_name="module_a", context={})
+                for i, ts in enumerate(timestamps)
+            ],
+        )
+    )
+
+    bucketed = analysis_mod.analyze_time_range_bucketed(
+        application_id="test-app", start_ts=start_ts, end_ts=end_ts, limit=100
+    )
+    single = analysis_mod.analyze_time_range(
+        application_id="test-app", start_ts=start_ts, end_ts=end_ts, limit=100
+    )
+    assert [r.ts for r in bucketed] == [r.ts for r in single]
+    assert [r.ts for r in bucketed] == sorted(timestamps, reverse=True)
+
+    limited = analysis_mod.analyze_time_range_bucketed(
+        application_id="test-app", start_ts=start_ts, end_ts=end_ts, limit=2
+    )
+    assert [r.ts for r in limited] == sorted(timestamps, reverse=True)[:2]
+
+
+def test_bucketed_time_range_limit_parity_at_bucket_edges(monkeypatch):
+    """The limit applies to the merged stream, so every limit matches the single query."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    start_ts = 1_700_000_000.0
+    end_ts = start_ts + 6 * 3600.0
+    first_edge = (start_ts // 3600 + 1) * 3600
+    second_edge = first_edge + 3600
+    # Several rows share each bucket edge, so per-bucket limits and edge
+    # de-duplication interact; levels alternate to exercise min_level.
+    timestamps = [
+        start_ts + 5.0, first_edge - 1.0, first_edge, first_edge, first_edge,
+        first_edge + 2.0, second_edge, second_edge, second_edge + 30.0, end_ts - 1.0,
+    ]
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=ts, level="ERROR" if i % 2 else "INFO", message=f"log {i}",
+                    application_id="test-app", module_name="module_a", context={},
+                )
+                for i, ts in enumerate(timestamps)
+            ],
+        )
+    )
+
+    for min_level in (None, "ERROR"):
+        for limit in range(1, len(timestamps) + 2):
+            kwargs = dict(application_id="test-app", start_ts=start_ts, end_ts=end_ts, min_level=min_level, limit=limit)
+            bucketed = analysis_mod.analyze_time_range_bucketed(**kwargs)
+            single = analysis_mod.analyze_time_range(**kwargs)
+            assert [r.message for r in bucketed] == [r.message for r in single], (min_level, limit)
+
+
+def test_bucketed_time_range_stops_fetching_once_limit_is_reached(monkeypatch):
+    """Older buckets are not fetched beyond the prefetch window once the limit is met."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    start_ts = 1_700_000_000.0
+    end_ts = start_ts + 24 * 3600.0
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(ts=start_ts + i * 600.0, level="ERROR", message=f"log {i}",
+                          application_id="test-app", module_name="module_a", context={})
+                for i in range(24 * 6)
+            ],
+        )
+    )
+
+    queried: List[tuple] = []
+    original_query = storage.query_time_range
+
+    def counting_query(start_ts, end_ts, **kwargs):
+        queried.append((start_ts, end_ts))
+        return original_query(start_ts, end_ts, **kwargs)
+
+    monkeypatch.setattr(storage, "query_time_range", counting_query)
+
+    records = analysis_mod.analyze_time_range_bucketed(
+        application_id="test-app", start_ts=start_ts, end_ts=end_ts, limit=3
+    )
+    assert [r.message for r in records] == ["log 143", "log 142", "log 141"]
+    # The clipped newest bucket holds one row, so two buckets are merged; only
+    # the prefetch window beyond them was requested out of 25 buckets.
+    assert len(queried) <= 2 + analysis_mod.BUCKET_PREFETCH
+
+
+def test_cross_module_groups_interleaved_components(monkeypatch):
+    """Log ids are grouped correctly when components interleave in time."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    base_time = time.time()
+    layout = [("service_1", "module_a"), ("service_1", "module_a"), ("service_2", "module_b"), ("service_1", "module_b")]
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=base_time + i,
+                    level="ERROR",
+                    message=f"log {i}",
+                    application_id="test-app",
+                    module_name=mod,
+                    service_name=svc,
+                    context={},
+                )
+                for i, (svc, mod) in enumerate(layout)
+            ],
+        )
+    )
+
+    result = analysis_mod.analyze_cross_module_incident(
+        application_id="test-app",
+        start_ts=base_time,
+        end_ts=base_time + 10.0,
+    )
+
+    by_component = result.logs_by_component
+    assert len(by_component["service:service_1"]) == 3
+    assert len(by_component["service:service_2"]) == 1
+    assert len(by_component["module:module_a"]) == 2
+    assert len(by_component["module:module_b"]) == 2
+    assert set(by_component["module:module_b"]) <= set(by_component["service:service_1"]) | set(by_component["service:service_2"])
+    assert result.components["services"] == {"service_1": 3, "service_2": 1}
+
+
+def test_cross_module_filter_without_matches_is_omitted(monkeypatch):
+    """Requested components that match no logs do not appear in logs_by_component."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    base_time = time.time()
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=base_time + 1.0,
+                    level="ERROR",
+                    message="Error in module_a",
+                    application_id="test-app",
+                    module_name="module_a",
+                    service_name="service_1",
+                    context={},
+                )
+            ],
+        )
+    )
+
+    result = analysis_mod.analyze_cross_module_incident(
+        application_id="test-app",
+        start_ts=base_time,
+        end_ts=base_time + 10.0,
+        module_names=["module_a", "module_missing"],
+    )
+
+    assert "module:module_a" in result.logs_by_component
+    assert "module:module_missing" not in result.logs_by_component
+    assert "module_missing" not in result.components["modules"]
+
+
+def test_cross_module_single_component_query(monkeypatch):
+    """A single service + single module filter maps every log to both components."""
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    base_time = time.time()
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=base_time + i,
+                    level="ERROR",
+                    message=f"log {i}",
+                    application_id="test-app",
+                    module_name=mod,
+                    service_name=svc,
+                    context={},
+                )
+                for i, (svc, mod) in enumerate(
+                    [("service_1", "module_a"), ("service_1", "module_a"), ("service_2", "module_a")]
+                )
+            ],
+        )
+    )
+
+    result = analysis_mod.analyze_cross_module_incident(
+        application_id="test-app",
+        start_ts=base_time,
+        end_ts=base_time + 10.0,
+        service_names=["service_1"],
+        module_names=["module_a"],
+    )
+
+    assert set(result.logs_by_component) == {"service:service_1", "module:module_a"}
+    assert len(result.logs_by_component["service:service_1"]) == 2
+    assert result.logs_by_component["module:module_a"] == result.logs_by_component["service:service_1"]
+    assert result.components["services"] == {"service_1": 2}
+    assert result.components["modules"] == {"module_a": 2}
+
+
+def test_cross_module_analysis_emits_query_telemetry(monkeypatch, caplog):
+    """With the telemetry logger at INFO, each call emits one structured record."""
+    import json
+    import logging
+
+    storage = CrossModuleStorage()
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: storage)
+
+    base_time = time.time()
+    storage.write_batch(
+        LogBatch(
+            application_id="test-app",
+            logs=[
+                LogRecord(
+                    ts=base_time + 1.0,
+                    level="ERROR",
+                    message="Error in module_a",
+                    application_id="test-app",
+                    module_name="module_a",
+                    service_name="service_1",
+                    context={},
+                )
+            ],
+        )
+    )
+
+    with caplog.at_level(logging.INFO, logger="drtrace_service.analysis.telemetry"):
+        analysis_mod.analyze_cross_module_incident(
+            application_id="test-app",
+            start_ts=base_time,
+            end_ts=base_time + 10.0,
+        )
+
+    records = [r for r in caplog.records if r.name == "drtrace_service.analysis.telemetry"]
+    assert len(records) == 1
+    payload = json.loads(records[0].getMessage().split(" ", 1)[1])
+    assert payload["operation"] == "cross_module"
+    assert payload["application_id"] == "test-app"
+    assert payload["cache_hit"] is False
+    assert payload["n_points_scanned"] == 1
+    assert payload["n_components"] == 2
+    assert set(payload["phases_ms"]) == {"storage_scan", "prepare_input", "llm", "breakdown"}
+
+
+def test_query_telemetry_disabled_skips_ids_and_timers(monkeypatch, caplog):
+    """With the telemetry logger off, no request id is generated and no timer is read."""
+    import logging
+
+    caplog.set_level(logging.WARNING, logger="drtrace_service.analysis.telemetry")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("telemetry work while disabled")
+
+    monkeypatch.setattr(analysis_mod.uuid, "uuid4", fail)
+    monkeypatch.setattr(analysis_mod.time, "perf_counter", fail)
+
+    telemetry = analysis_mod.QueryTelemetry("cross_module", application_id="test-app")
+    with telemetry.phase("storage_scan"):
+        pass
+    telemetry.emit(cache_hit=False)
+
+    assert telemetry.enabled is False
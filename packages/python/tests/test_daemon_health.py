@@ -96,6 +96,39 @@ class TestDaemonHealthChecker:
             result = await checker._check_daemon_async(100)  # 100ms timeout
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_check_daemon_async_httpx_timeout(self):
+        """Test that an httpx timeout is reported as an unhealthy daemon."""
+        checker = DaemonHealthChecker()
+
+        with patch("drtrace_service.daemon_health.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get.side_effect = httpx.ReadTimeout("timed out")
+            mock_client.return_value = mock_instance
+
+            result = await checker._check_daemon_async(100)
+            assert result is False
+
+    def test_client_from_previous_loop_is_closed(self):
+        """Test that switching event loops closes the client made on the old one."""
+        checker = DaemonHealthChecker()
+        clients = []
+
+        def make_client(*args, **kwargs):
+            client = AsyncMock()
+            client.is_closed = False
+            client.get.return_value = MagicMock(status_code=200)
+            clients.append(client)
+            return client
+
+        with patch("drtrace_service.daemon_health.httpx.AsyncClient", side_effect=make_client):
+            assert asyncio.run(checker._check_daemon_async(500)) is True
+            assert asyncio.run(checker._check_daemon_async(500)) is True
+
+        assert len(clients) == 2
+        clients[0].aclose.assert_awaited_once()
+        clients[1].aclose.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_check_daemon_async_connection_refused(self):
         """Test daemon health check when connection refused."""
@@ -131,6 +164,36 @@ class TestDaemonHealthChecker:
             result = await checker._check_daemon_async(500)
             assert result is False
 
+    def test_url_resolved_at_init(self):
+        """Test daemon URL is read from env once, when the checker is created."""
+        with patch.dict(
+            os.environ,
+            {"DRTRACE_DAEMON_HOST": "10.0.0.5", "DRTRACE_DAEMON_PORT": "9100"},
+        ):
+            checker = DaemonHealthChecker()
+        assert checker._url == "http://10.0.0.5:9100/status"
+
+    def test_sync_checks_reuse_client(self):
+        """Test sync checks share one AsyncClient and close it on close()."""
+        checker = DaemonHealthChecker()
+
+        with patch("drtrace_service.daemon_health.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.is_closed = False
+            mock_instance.get.return_value = MagicMock(status_code=200)
+            mock_client.return_value = mock_instance
+
+            assert checker.check_daemon_alive(500) is True
+            checker._cache = None
+            assert checker.check_daemon_alive(500) is True
+
+            assert mock_client.call_count == 1
+            assert mock_instance.get.call_count == 2
+
+            checker.close()
+            mock_instance.aclose.assert_awaited_once()
+            assert checker._client is None
+
     def test_check_daemon_alive_sync_healthy(self):
         """Test synchronous check with healthy daemon."""
         checker = DaemonHealthChecker()
@@ -317,6 +380,7 @@ class TestIntegrationWithDaemon:
 
         dh._health_checker._cache = None
         dh._health_checker._cache_time = 0
+        dh._health_checker._client = None
 
         # Force the underlying client to behave like a stopped daemon (connection refused)
         with patch("drtrace_service.daemon_health.httpx.AsyncClient") as mock_client:
@@ -1,14 +1,20 @@
 """Tests for grep command implementation."""
 
 import os
+import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import orjson
+
+import drtrace_service.cli.grep as grep_module
 from drtrace_service.cli.grep import (
     _cache_log,
+    _format_daemon_record,
     _get_cached_log,
+    _log_cache_key,
     _parse_log_line,
     _parse_time_duration,
     _should_include_line,
@@ -126,6 +132,21 @@ class TestShouldIncludeLine:
         assert _should_include_line(line, r"Error: code \d+", False, False, True) is True
         assert _should_include_line(line, r"code 200", False, False, True) is False
 
+    def test_pattern_compiled_once(self):
+        """Repeated lines with the same pattern reuse one compiled regex."""
+        from drtrace_service.cli.grep import _compile_pattern
+
+        _compile_pattern.cache_clear()
+        for i in range(50):
+            _should_include_line(f"[2026-01-05 10:30:45] [api] [INFO] line {i}", r"line \d+", False, False, True)
+        info = _compile_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 49
+
+    def test_invalid_pattern_is_not_a_match(self):
+        """An invalid regex excludes the line instead of raising."""
+        assert _should_include_line("[2026-01-05 10:30:45] [api] [INFO] x", "([a-z", False, False, True) is False
+
     def test_time_filter(self):
         """Test time-based filtering."""
         from datetime import timedelta
@@ -139,33 +160,136 @@ class TestShouldIncludeLine:
             assert _should_include_line(recent, "Recent", False, False, False, timedelta(minutes=10)) is True
             assert _should_include_line(recent, "Recent", False, False, False, timedelta(minutes=4)) is False
 
+    def test_non_matching_line_skips_timestamp_parse(self):
+        """Lines the pattern rules out are rejected without parsing the timestamp."""
+        from datetime import timedelta
+
+        line = "[2026-01-05 10:30:45] [api] [INFO] Recent"
+        with patch('drtrace_service.cli.grep._parse_log_line') as mock_parse:
+            cutoff = datetime(2026, 1, 5, 10, 0, 0)
+            assert _should_include_line(line, "Missing", False, False, False, cutoff=cutoff) is False
+            mock_parse.assert_not_called()
+        assert _should_include_line(line, "Recent", False, False, False, timedelta(days=36500)) is True
+
+    def test_lines_after_cutoff_skip_timestamp_parse(self):
+        """Lines newer than the cutoff are kept without parsing their timestamp."""
+        line = "[2026-01-05 10:30:45] [api] [INFO] Recent"
+        with patch('drtrace_service.cli.grep._parse_log_line') as mock_parse:
+            cutoff = datetime(2026, 1, 5, 10, 30, 44, 500000)
+            assert _should_include_line(line, "Recent", False, False, False, cutoff=cutoff) is True
+            mock_parse.assert_not_called()
+
+    def test_cutoff_within_the_same_second(self):
+        """A line from the cutoff's second is compared exactly."""
+        line = "[2026-01-05 10:30:45] [api] [INFO] Recent"
+        assert _should_include_line(line, "Recent", False, False, False, cutoff=datetime(2026, 1, 5, 10, 30, 45)) is True
+        assert _should_include_line(line, "Recent", False, False, False, cutoff=datetime(2026, 1, 5, 10, 30, 45, 1)) is False
+
+    def test_literal_pattern_matches_like_regex(self):
+        """Plain-substring patterns give the same answer as the regex path."""
+        line = "[2026-01-05 10:30:45] [api] [INFO] GET /health: ok"
+        for pattern in ["GET /health", "health: ok", "missing", "[api]", "a.i"]:
+            expected = re.search(pattern, line) is not None
+            assert _should_include_line(line, pattern, False, False, False) is expected
+
+    def test_since_reads_clock_once_per_run(self):
+        """grep --since computes its cutoff once, not per line."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            for minute in range(20, 35):
+                f.write(f"[2026-01-05 10:{minute}:00] [api] [INFO] tick\n")
+            log_path = f.name
+
+        try:
+            with patch('drtrace_service.cli.grep.get_default_log_path', return_value=Path(log_path)):
+                with patch('drtrace_service.cli.grep.check_daemon_alive', return_value=False):
+                    with patch('drtrace_service.cli.grep.datetime') as mock_dt:
+                        mock_dt.now.return_value = datetime(2026, 1, 5, 10, 35, 0)
+                        mock_dt.strptime = datetime.strptime
+                        with patch('builtins.print') as mock_print:
+                            assert grep_command(["tick", "--since", "10m", "-c"]) == 0
+                            mock_print.assert_called_with(10)
+                        assert mock_dt.now.call_count == 1
+        finally:
+            os.unlink(log_path)
+
+
+class TestFormatDaemonRecord:
+    """Tests for _format_daemon_record."""
+
+    def test_matches_local_time_format(self):
+        """Timestamps render as local time, the same as datetime.fromtimestamp."""
+        record = {"ts": 1767175845.75, "level": "ERROR", "message": "boom", "service_name": "api"}
+        expected_ts = datetime.fromtimestamp(1767175845.75).strftime('%Y-%m-%d %H:%M:%S')
+        assert _format_daemon_record(record, False) == f"[{expected_ts}] [api] [ERROR] boom"
+        assert _format_daemon_record(record, True) == f"1767175845:[{expected_ts}] [api] [ERROR] boom"
+
+
+class TestIterMatchingLines:
+    """Tests for the whole-buffer scan used by plain searches."""
+
+    def test_matches_per_line_search(self):
+        """Buffer scan returns the same lines and numbers as searching each line."""
+        from drtrace_service.cli.grep import _iter_matching_lines
+
+        data = "alpha\n\nbeta gamma\nalpha beta\n\ndelta\n"
+        for pattern in [r"alpha", r"^b", r"a$", r"^$", r"\s", r"a\nb", r"x*", r"(?s)a.*d"]:
+            expected = [
+                (i, line) for i, line in enumerate(data.splitlines(), start=1) if re.search(pattern, line)
+            ]
+            assert list(_iter_matching_lines(re.compile(pattern, re.MULTILINE), data)) == expected, pattern
+
+    def test_literal_scan_matches_substring_search(self):
+        """The str.find path agrees with a per-line substring test."""
+        from drtrace_service.cli.grep import _iter_literal_lines
+
+        data = "Error one\nok\nError two Error\n\nno error\nError"
+        expected = [(i, line) for i, line in enumerate(data.splitlines(), start=1) if "Error" in line]
+        assert list(_iter_literal_lines("Error", data)) == expected
+
+    def test_no_trailing_empty_line(self):
+        """A final newline does not produce an extra empty line."""
+        from drtrace_service.cli.grep import _iter_matching_lines
+
+        assert list(_iter_matching_lines(re.compile(r"^$", re.MULTILINE), "a\nb\n")) == []
+        assert list(_iter_matching_lines(re.compile(r"x*", re.MULTILINE), "")) == []
+
 
 class TestCache:
     """Tests for caching functionality."""
 
-    def test_cache_hit(self):
-        """Test cache hit within TTL."""
-        path = Path("/test/log.log")
-        lines = ["line1", "line2", "line3"]
+    def test_cache_hit(self, tmp_path):
+        """Unchanged file is served from cache."""
+        path = tmp_path / "log.log"
+        path.write_text("line1\nline2\n")
+
+        key = _log_cache_key(path)
+        _cache_log(key, "line1\nline2\n")
+        assert _get_cached_log(_log_cache_key(path)) == "line1\nline2\n"
 
-        _cache_log(path, lines)
-        cached = _get_cached_log(path)
-        assert cached == lines
+    def test_cache_miss_after_file_changes(self, tmp_path):
+        """Writing to the file changes the key, so the old contents are not reused."""
+        path = tmp_path / "log.log"
+        path.write_text("line1\n")
+        _cache_log(_log_cache_key(path), "line1\n")
 
-    def test_cache_miss_after_expiry(self):
-        """Test cache miss after TTL expiry."""
-        path = Path("/test/log.log")
-        lines = ["line1", "line2"]
+        with open(path, "a") as f:
+            f.write("line2\n")
+        assert _get_cached_log(_log_cache_key(path)) is None
 
-        with patch('drtrace_service.cli.grep.time.time') as mock_time:
-            # First call to cache the data at time=0
-            mock_time.return_value = 0
-            _cache_log(path, lines)
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        """The cache holds a bounded number of files."""
+        from drtrace_service.cli import grep as grep_mod
 
-            # Move time forward beyond TTL (30 seconds)
-            mock_time.return_value = 31
-            cached = _get_cached_log(path)
-            assert cached is None
+        keys = [(tmp_path / f"{i}.log", i, i) for i in range(grep_mod._LOG_CACHE_MAX_ENTRIES + 1)]
+        for key in keys[:-1]:
+            _cache_log(key, "x")
+        # Touch the oldest entry so the second-oldest becomes the eviction target
+        assert _get_cached_log(keys[0]) == "x"
+        _cache_log(keys[-1], "x")
+
+        assert len(grep_mod._log_cache) <= grep_mod._LOG_CACHE_MAX_ENTRIES
+        assert _get_cached_log(keys[0]) == "x"
+        assert _get_cached_log(keys[1]) is None
 
 
 class TestGrepCommand:
@@ -315,3 +439,55 @@ class TestGrepCommand:
             with patch('drtrace_service.cli.grep.check_daemon_alive', return_value=False):
                 result = grep_command(["pattern"])
                 assert result == 2  # Error exit code
+
+    def test_invert_match_with_line_numbers(self):
+        """-v -n walks the file line by line and numbers the non-matching lines."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            f.write("[2026-01-05 10:30:45] [api] [ERROR] Error\n")
+            f.write("\n")
+            f.write("[2026-01-05 10:30:46] [api] [INFO] Normal log\n")
+            f.flush()
+            log_path = f.name
+
+        try:
+            with patch('drtrace_service.cli.grep.get_default_log_path', return_value=Path(log_path)):
+                with patch('drtrace_service.cli.grep.check_daemon_alive', return_value=False):
+                    with patch('builtins.print') as mock_print:
+                        result = grep_command(["Error", "-v", "-n"])
+                        assert result == 0
+                        mock_print.assert_called_once_with("2:\n3:[2026-01-05 10:30:46] [api] [INFO] Normal log")
+        finally:
+            os.unlink(log_path)
+
+    def test_daemon_invert_match_is_filtered_server_side(self):
+        """-v is sent to the daemon and its results are printed as returned."""
+        response = MagicMock()
+        response.content = orjson.dumps({
+            "results": [
+                {"ts": 1767175845.0, "level": "INFO", "message": "Normal log", "service_name": "api"},
+            ]
+        })
+        with patch('drtrace_service.cli.grep.check_daemon_alive', return_value=True):
+            with patch('drtrace_service.cli.grep._get_http_client') as mock_client:
+                mock_get = mock_client.return_value.get
+                mock_get.return_value = response
+                with patch('builtins.print') as mock_print:
+                    result = grep_command(["Error", "-v", "-n"])
+                    assert result == 0
+                    params = mock_get.call_args[1]["params"]
+                    assert params["message_contains"] == "Error"
+                    assert params["message_invert"] == "true"
+                    output = mock_print.call_args[0][0]
+                    assert output.startswith("1767175845:[")
+                    assert output.endswith("] [api] [INFO] Normal log")
+
+    def test_daemon_client_is_reused(self):
+        """Daemon queries share one keep-alive client across calls."""
+        with patch('drtrace_service.cli.grep._http_client', None):
+            with patch('drtrace_service.cli.grep.atexit.register') as mock_register:
+                first = grep_module._get_http_client()
+                try:
+                    assert grep_module._get_http_client() is first
+                    mock_register.assert_called_once_with(first.close)
+                finally:
+                    first.close()
@@ -62,3 +62,28 @@ async def test_troubleshoot_unknown_issue(tmp_path: Path):
     assert "could not recognize this issue" in result.lower()
 
 
+
+
+@pytest.mark.asyncio
+async def test_concurrent_current_step_requests_share_one_call(tmp_path: Path, monkeypatch):
+    import asyncio
+
+    from drtrace_service import api
+
+    calls = []
+
+    async def slow_get_current_step(project_root: Path) -> str:
+        calls.append(project_root)
+        await asyncio.sleep(0.01)
+        return "# Setup Guide"
+
+    monkeypatch.setattr(help_agent_interface, "get_current_step", slow_get_current_step)
+
+    results = await asyncio.gather(*(api._coalesced_current_step(str(tmp_path)) for _ in range(5)))
+    assert results == ["# Setup Guide"] * 5
+    assert len(calls) == 1
+    assert api._current_step_inflight == {}
+
+    # Once finished, the next request starts a fresh call
+    await api._coalesced_current_step(str(tmp_path))
+    assert len(calls) == 2
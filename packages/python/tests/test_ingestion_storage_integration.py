@@ -50,3 +50,69 @@ def test_ingest_logs_delegates_to_storage(monkeypatch):
   assert batch.logs[0].message == "hello"
 
 
+def test_ingest_logs_uses_overridden_backend_dependency():
+  from drtrace_service.api import get_backend  # type: ignore[import]
+
+  dummy = DummyStorage()
+  app.dependency_overrides[get_backend] = lambda: dummy
+  try:
+    client = TestClient(app)
+    payload = {
+      "application_id": "app-123",
+      "logs": [{"ts": 1734550000.0, "level": "INFO", "message": "hi", "application_id": "app-123", "module_name": "m"}],
+    }
+    resp = client.post("/logs/ingest", json=payload)
+  finally:
+    app.dependency_overrides.pop(get_backend, None)
+
+  assert resp.status_code == 202
+  assert len(dummy.batches) == 1
+
+
+def test_ingest_logs_summarizes_suspicious_timestamps(monkeypatch, caplog):
+  import logging
+  import time
+
+  client = TestClient(app)
+  dummy = DummyStorage()
+  monkeypatch.setattr(storage_mod, "get_storage", lambda: dummy)
+
+  now = time.time()
+  logs = [
+    {"ts": ts, "level": "INFO", "message": "m", "application_id": "app-123", "module_name": "mod"}
+    for ts in (now + 3600, now + 7200, now - 2 * 86400, now)
+  ]
+
+  with caplog.at_level(logging.WARNING, logger="drtrace_service.api"):
+    resp = client.post("/logs/ingest", json={"application_id": "app-123", "logs": logs})
+
+  assert resp.status_code == 202
+  messages = [r.getMessage() for r in caplog.records]
+  # One aggregated warning per category rather than one per log
+  assert sum("in the future" in m for m in messages) == 1
+  assert any(m.startswith("2 log timestamp(s) in the future") for m in messages)
+  assert any(m.startswith("1 log timestamp(s) in the past") for m in messages)
+  assert not any("identical timestamp" in m for m in messages)
+
+
+def test_ingest_logs_warns_on_identical_timestamps(monkeypatch, caplog):
+  import logging
+  import time
+
+  client = TestClient(app)
+  dummy = DummyStorage()
+  monkeypatch.setattr(storage_mod, "get_storage", lambda: dummy)
+
+  now = time.time()
+  logs = [
+    {"ts": now, "level": "INFO", "message": f"m{i}", "application_id": "app-123", "module_name": "mod"}
+    for i in range(100)
+  ]
+
+  with caplog.at_level(logging.WARNING, logger="drtrace_service.api"):
+    resp = client.post("/logs/ingest", json={"application_id": "app-123", "logs": logs})
+
+  assert resp.json() == {"accepted": 100}
+  messages = [r.getMessage() for r in caplog.records]
+  assert any("All 100 logs in batch have identical timestamp" in m for m in messages)
+  assert not any("in the future" in m or "in the past" in m for m in messages)
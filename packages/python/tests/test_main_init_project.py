@@ -4,6 +4,8 @@ Integration test for init command in __main__.py
 Note: The command was renamed from "init-project" to "init" for brevity.
 """
 
+import json
+from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
@@ -29,7 +31,7 @@ class TestInitProjectCommand:
         """Test that init command can be called."""
         with TemporaryDirectory() as tmpdir:
             # Mock the interactive input to skip prompts
-            with patch("builtins.input") as mock_input:
+            with patch("sys.stdin.isatty", return_value=True), patch("builtins.input") as mock_input:
                 mock_input.side_effect = KeyboardInterrupt()
 
                 with pytest.raises(SystemExit) as exc:
@@ -38,6 +40,24 @@ class TestInitProjectCommand:
                 # Should exit with code 1 due to KeyboardInterrupt
                 assert exc.value.code == 1
 
+    def test_init_defaults_skips_prompts(self):
+        """Test that --defaults initializes without reading any input."""
+        with TemporaryDirectory() as tmpdir:
+            with patch("builtins.input") as mock_input, \
+                    patch("sys.stdin.readline") as mock_readline, \
+                    patch("drtrace_service.cli.init_project.ProjectInitializer._maybe_analyze_and_suggest_setup"):
+                with pytest.raises(SystemExit) as exc:
+                    main(["init", "--project-root", tmpdir, "--defaults"])
+
+                assert exc.value.code == 0
+                mock_input.assert_not_called()
+                mock_readline.assert_not_called()
+
+            config = json.loads((Path(tmpdir) / "_drtrace" / "config.json").read_text())
+            assert config["project_name"] == "my-app"
+            assert config["language"] == "python"
+            assert config["environments"] == ["development"]
+
     def test_usage_message_shows_init(self, capsys):
         """Test that usage message includes init command."""
         with pytest.raises(SystemExit):
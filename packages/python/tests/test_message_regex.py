@@ -72,6 +72,42 @@ class TestMessageRegexValidation:
             assert data["count"] == 0
 
 
+    def test_message_regex_compilation_is_cached(self, client):
+        """Repeated patterns reuse the cached compiled regex."""
+        api._compile_message_regex.cache_clear()
+        with patch("drtrace_service.api.storage.get_storage") as mock_storage:
+            mock_backend = MagicMock()
+            mock_backend.query_time_range.return_value = []
+            mock_storage.return_value = mock_backend
+
+            for _ in range(3):
+                response = client.get(
+                    "/logs/query",
+                    params={"since": "1h", "message_regex": "db|cache"},
+                )
+                assert response.status_code == 200
+
+        info = api._compile_message_regex.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+    @pytest.mark.parametrize("pattern", ["(a+)+", "(.*)*", "(?:\\w+\\s*)+$", "(x*){2,}"])
+    def test_nested_quantifier_pattern_returns_400(self, client, pattern):
+        """Patterns prone to catastrophic backtracking are rejected before querying."""
+        with patch("drtrace_service.api.storage.get_storage") as mock_storage:
+            mock_backend = MagicMock()
+            mock_storage.return_value = mock_backend
+
+            response = client.get(
+                "/logs/query",
+                params={"since": "1h", "message_regex": pattern},
+            )
+            assert response.status_code == 400
+            assert response.json()["detail"]["code"] == "INVALID_PATTERN"
+            mock_backend.query_time_range.assert_not_called()
+
+
 class TestMessageRegexQuery:
     """Test message_regex query execution."""
 
@@ -93,6 +129,38 @@ class TestMessageRegexQuery:
             assert call_kwargs["message_regex"] == "db|cache"
             assert call_kwargs["message_contains"] is None
 
+    def test_literal_message_regex_uses_substring_search(self, client):
+        """A regex without metacharacters is sent to storage as message_contains."""
+        with patch("drtrace_service.api.storage.get_storage") as mock_storage:
+            mock_backend = MagicMock()
+            mock_backend.query_time_range.return_value = []
+            mock_storage.return_value = mock_backend
+
+            client.get(
+                "/logs/query",
+                params={"since": "1h", "message_regex": "connection refused"},
+            )
+
+            call_kwargs = mock_backend.query_time_range.call_args[1]
+            assert call_kwargs["message_contains"] == "connection refused"
+            assert call_kwargs["message_regex"] is None
+
+    def test_message_invert_passed_to_storage(self, client):
+        """message_invert is forwarded so storage negates the message filter."""
+        with patch("drtrace_service.api.storage.get_storage") as mock_storage:
+            mock_backend = MagicMock()
+            mock_backend.query_time_range.return_value = []
+            mock_storage.return_value = mock_backend
+
+            client.get(
+                "/logs/query",
+                params={"since": "1h", "message_contains": "error", "message_invert": "true"},
+            )
+
+            call_kwargs = mock_backend.query_time_range.call_args[1]
+            assert call_kwargs["message_contains"] == "error"
+            assert call_kwargs["message_invert"] is True
+
     def test_message_contains_passed_to_storage(self, client):
         """Should pass message_contains when provided (not regex)."""
         with patch("drtrace_service.api.storage.get_storage") as mock_storage:
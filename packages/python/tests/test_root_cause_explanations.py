@@ -375,3 +375,92 @@ def test_root_cause_explanation_with_all_fields():
     assert explanation.confidence == "high"
     assert explanation.raw_response == "Raw response"
 
+
+
+def test_explain_logs_reuses_explanation_for_identical_records(sample_logs):
+    """Repeating the same analysis does not call the model again; new logs do."""
+    from drtrace_service.analysis import clear_analysis_cache, explain_logs
+
+    mock_model = MockAIModel("Summary: Cached.\nRoot Cause: Cached root cause.")
+    calls = {"count": 0}
+    original_generate = mock_model.generate_explanation
+
+    def counting_generate(prompt: str, **kwargs):
+        calls["count"] += 1
+        return original_generate(prompt, **kwargs)
+
+    mock_model.generate_explanation = counting_generate  # type: ignore[method-assign]
+    original_model = get_ai_model()
+    clear_analysis_cache()
+    try:
+        set_ai_model(mock_model)
+
+        first = explain_logs(sample_logs)
+        second = explain_logs(list(sample_logs))
+        assert second.summary == first.summary
+        assert calls["count"] == 1
+
+        newer = sample_logs + [
+            LogRecord(ts=2000.0, level="ERROR", message="Another failure", application_id="test_app", module_name="m")
+        ]
+        explain_logs(newer)
+        assert calls["count"] == 2
+
+        # Records that differ only in stacktrace build a different prompt.
+        changed = [sample_logs[0].model_copy(update={"stacktrace": "Traceback: other"}), sample_logs[1]]
+        explain_logs(changed)
+        assert calls["count"] == 3
+    finally:
+        set_ai_model(original_model)
+        clear_analysis_cache()
+
+
+def test_explain_logs_cache_is_per_model(sample_logs):
+    """Switching the AI model bypasses explanations cached for the previous one."""
+    from drtrace_service.analysis import clear_analysis_cache, explain_logs
+
+    original_model = get_ai_model()
+    clear_analysis_cache()
+    try:
+        set_ai_model(MockAIModel("Summary: First model."))
+        assert explain_logs(sample_logs).summary == "First model."
+
+        second_model = MockAIModel("Summary: Second model.")
+        set_ai_model(second_model)
+        assert explain_logs(sample_logs).summary == "Second model."
+        assert second_model.last_prompt is not None
+    finally:
+        set_ai_model(original_model)
+        clear_analysis_cache()
+
+
+def test_explain_logs_cache_sees_source_edits(tmp_path, monkeypatch):
+    """Editing the source file behind a log changes the prompt and the explanation call."""
+    from drtrace_service.analysis import clear_analysis_cache, explain_logs
+    from drtrace_service.code_context import clear_file_cache
+
+    source = tmp_path / "app.py"
+    source.write_text("def f():\n    raise ValueError('old')\n")
+    monkeypatch.setenv("DRTRACE_SOURCE_ROOTS", str(tmp_path))
+    records = [
+        LogRecord(ts=1.0, level="ERROR", message="boom", application_id="a", module_name="app",
+                  file_path="app.py", line_no=2, context={}),
+    ]
+
+    model = MockAIModel("Summary: Explained.")
+    original_model = get_ai_model()
+    clear_analysis_cache()
+    try:
+        set_ai_model(model)
+        explain_logs(records)
+        assert "old" in model.last_prompt
+
+        source.write_text("def f():\n    raise ValueError('new code')\n")
+        clear_file_cache()
+        model.last_prompt = None
+        explain_logs(records)
+        assert model.last_prompt is not None
+        assert "new code" in model.last_prompt
+    finally:
+        set_ai_model(original_model)
+        clear_analysis_cache()
@@ -559,3 +559,46 @@ def test_api_analyze_with_query_overrides(temp_queries_dir, monkeypatch):
 
     assert resp.status_code == 200
 
+
+
+def test_api_analyze_with_query_since_formats(temp_queries_dir, monkeypatch):
+    """The since override accepts relative, bare-seconds and ISO 8601 values."""
+    from fastapi.testclient import TestClient
+
+    from drtrace_service import storage as storage_mod
+    from drtrace_service.api import app
+
+    save_query(SavedQuery(name="api-since", application_id="app", query_type="why"))
+
+    seen = []
+
+    class DummyStorage(storage_mod.LogStorage):
+        def write_batch(self, batch):  # type: ignore
+            pass
+
+        def query_time_range(self, start_ts, end_ts, **kwargs):  # type: ignore
+            seen.append((start_ts, end_ts))
+            return []
+
+    monkeypatch.setattr(storage_mod, "get_storage", lambda: DummyStorage())
+    client = TestClient(app)
+
+    now = time.time()
+    for since, expected_start in (
+        ("10m", now - 600),
+        ("120", now - 120),
+        ("2025-12-31T02:44:03Z", 1767149043.0),
+    ):
+        seen.clear()
+        resp = client.get("/analysis/query/api-since", params={"since": since})
+        assert resp.status_code == 200
+        start_ts, end_ts = seen[0]
+        assert abs(start_ts - expected_start) < 5
+        assert abs(end_ts - now) < 5
+
+    seen.clear()
+    for since in ("yesterday", "-5", "-5m", "1.5", "nan"):
+        resp = client.get("/analysis/query/api-since", params={"since": since})
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "INVALID_TIME_FORMAT"
+    assert seen == []
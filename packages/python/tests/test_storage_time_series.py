@@ -119,3 +119,38 @@ def test_time_range_query_endpoint(monkeypatch):
   assert data["results"][0]["message"] == "inside-window"
 
 
+
+
+def test_time_range_query_params_match_placeholders() -> None:
+  sql, params = storage_mod._build_time_range_query(
+    100.0, 200.0, "app-1", ["mod-a", "mod-b"], "svc", None, None, "ERROR", None, 50,
+  )
+
+  where = sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0].strip()
+  assert params == (100.0, 200.0, "app-1", "mod-a", "mod-b", "svc", "ERROR", "CRITICAL", 50)
+  assert where.count("%s") + 1 == len(params)
+
+
+def test_time_range_query_inverts_message_filters() -> None:
+  sql, _ = storage_mod._build_time_range_query(
+    100.0, 200.0, None, None, None, "boom", None, None, None, 10, True,
+  )
+  assert "message NOT ILIKE %s" in sql
+
+  sql, _ = storage_mod._build_time_range_query(
+    100.0, 200.0, None, None, None, None, "db|cache", None, None, 10, True,
+  )
+  assert "message !~* %s" in sql
+
+
+def test_row_to_record_builds_record_from_typed_row() -> None:
+  from decimal import Decimal
+
+  row = (Decimal("1767175845.25"), "ERROR", "boom", "app", None, "mod", "a.py", 12, None, None, None)
+  record = storage_mod._row_to_record(row)
+
+  assert isinstance(record.ts, float)
+  assert record.ts == 1767175845.25
+  assert record.line_no == 12
+  assert record.context == {}
+  assert record.model_dump()["service_name"] is None
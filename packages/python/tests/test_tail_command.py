@@ -50,7 +50,9 @@ class TestTailFollower:
         path = Path("/test/log.log")
         follower = TailFollower(path)
         line = "[2026-01-05 10:30:45] [api] [INFO] Message"
-        assert follower._should_include(line) is True
+        with patch.object(follower, "_parse_line") as mock_parse:
+            assert follower._should_include(line) is True
+        mock_parse.assert_not_called()
 
     def test_should_include_service_match(self):
         """Test include logic with matching service filter."""
@@ -104,6 +106,180 @@ class TestTailFollower:
         finally:
             os.unlink(log_path)
 
+    def test_tail_follows_appended_lines_on_one_handle(self, capsys):
+        """Test that new lines are read from the handle opened for the initial drain."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            f.write("[2026-01-05 10:30:00] [api] [INFO] Line 0\n")
+            log_path = f.name
+
+        calls = []
+
+        def append_then_stop(_interval):
+            calls.append(None)
+            if len(calls) > 2:
+                raise KeyboardInterrupt
+            with open(log_path, "a", encoding="utf-8") as out:
+                out.write(f"[2026-01-05 10:30:0{len(calls)}] [api] [INFO] Line {len(calls)}\n")
+
+        try:
+            follower = TailFollower(Path(log_path))
+            real_open = open
+            with patch("drtrace_service.cli.tail._watch_files", None), \
+                    patch("time.sleep", side_effect=append_then_stop):
+                with patch("builtins.open", side_effect=real_open) as mock_open:
+                    assert follower.tail() == 0
+
+            tail_opens = [c for c in mock_open.call_args_list if c.args[0] == Path(log_path)]
+            assert len(tail_opens) == 1
+            printed = capsys.readouterr().out.splitlines()
+            assert [p.rsplit(" ", 1)[1] for p in printed] == ["0", "1", "2"]
+        finally:
+            os.unlink(log_path)
+
+    def test_tail_wakes_on_file_events(self, capsys):
+        """Test that following blocks on file events instead of sleeping."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            log_path = f.name
+
+        def fake_watch(path, **kwargs):
+            assert path == Path(log_path)
+            assert kwargs["rust_timeout"] == 250
+            with open(log_path, "a", encoding="utf-8") as out:
+                out.write("[2026-01-05 10:30:01] [api] [INFO] Event line\n")
+            yield {("modified", log_path)}
+            raise KeyboardInterrupt
+
+        try:
+            follower = TailFollower(Path(log_path), poll_interval_ms=250)
+            with patch("drtrace_service.cli.tail._watch_files", side_effect=fake_watch), \
+                    patch("time.sleep") as mock_sleep:
+                assert follower.tail() == 0
+
+            mock_sleep.assert_not_called()
+            assert capsys.readouterr().out == "[2026-01-05 10:30:01] [api] [INFO] Event line\n"
+        finally:
+            os.unlink(log_path)
+
+    def test_tail_prints_repeated_lines(self, capsys):
+        """Test that identical lines appended later are printed each time."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            log_path = f.name
+
+        line = "[2026-01-05 10:30:01] [api] [WARN] Retrying"
+
+        def fake_watch(path, **kwargs):
+            for _ in range(2):
+                with open(log_path, "a", encoding="utf-8") as out:
+                    out.write(line + "\n")
+                yield set()
+            raise KeyboardInterrupt
+
+        try:
+            follower = TailFollower(Path(log_path))
+            with patch("drtrace_service.cli.tail._watch_files", side_effect=fake_watch):
+                assert follower.tail() == 0
+
+            assert capsys.readouterr().out.splitlines() == [line, line]
+            assert not hasattr(follower, "lines_seen")
+        finally:
+            os.unlink(log_path)
+
+    def test_tail_writes_each_batch_once(self):
+        """Test that initial lines and each poll batch are written in one call."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
+            for i in range(3):
+                f.write(f"[2026-01-05 10:30:0{i}] [api] [INFO] Line {i}\n")
+            log_path = f.name
+
+        def fake_watch(path, **kwargs):
+            with open(log_path, "a", encoding="utf-8") as out:
+                out.write("[2026-01-05 10:30:03] [api] [INFO] Line 3\n")
+                out.write("[2026-01-05 10:30:04] [api] [INFO] Line 4\n")
+            yield set()
+            yield set()
+            raise KeyboardInterrupt
+
+        try:
+            follower = TailFollower(Path(log_path))
+            with patch("drtrace_service.cli.tail._watch_files", side_effect=fake_watch), \
+                    patch("sys.stdout") as mock_stdout:
+                assert follower.tail() == 0
+
+            writes = [c.args[0] for c in mock_stdout.write.call_args_list]
+            assert len(writes) == 2
+            assert writes[0].count("\n") == 3
+            assert writes[1].endswith("Line 3\n[2026-01-05 10:30:04] [api] [INFO] Line 4\n")
+            assert mock_stdout.flush.call_count == 2
+        finally:
+            os.unlink(log_path)
+
+    def test_tail_follows_rotated_file(self, capsys):
+        """Test that tail drains the old file and switches to the new one after rotation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "app.log"
+            log_path.write_text("[2026-01-05 10:30:00] [api] [INFO] Line 0\n", encoding="utf-8")
+
+            def fake_watch(path, **kwargs):
+                with open(log_path, "a", encoding="utf-8") as out:
+                    out.write("[2026-01-05 10:30:01] [api] [INFO] Line 1\n")
+                os.rename(log_path, Path(tmpdir) / "app.log.1")
+                log_path.write_text("[2026-01-05 10:30:02] [api] [INFO] Line 2\n", encoding="utf-8")
+                yield set()
+                with open(log_path, "a", encoding="utf-8") as out:
+                    out.write("[2026-01-05 10:30:03] [api] [INFO] Line 3\n")
+                yield set()
+                raise KeyboardInterrupt
+
+            follower = TailFollower(log_path)
+            with patch("drtrace_service.cli.tail._watch_files", side_effect=fake_watch):
+                assert follower.tail() == 0
+
+            printed = capsys.readouterr().out.splitlines()
+            assert [p.rsplit(" ", 1)[1] for p in printed] == ["0", "1", "2", "3"]
+
+    def test_tail_restarts_after_truncation(self, capsys):
+        """Test that a truncated file is read again from the start."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "app.log"
+            log_path.write_text(
+                "[2026-01-05 10:30:00] [api] [INFO] Old line that is long\n", encoding="utf-8"
+            )
+
+            def fake_watch(path, **kwargs):
+                log_path.write_text("[2026-01-05 10:30:01] [api] [INFO] New\n", encoding="utf-8")
+                yield set()
+                raise KeyboardInterrupt
+
+            follower = TailFollower(log_path)
+            with patch("drtrace_service.cli.tail._watch_files", side_effect=fake_watch):
+                assert follower.tail() == 0
+
+            printed = capsys.readouterr().out.splitlines()
+            assert printed == [
+                "[2026-01-05 10:30:00] [api] [INFO] Old line that is long",
+                "[2026-01-05 10:30:01] [api] [INFO] New",
+            ]
+
+    def test_complete_lines_holds_back_partial_line(self):
+        """Test that a line without its newline is emitted only once completed."""
+        follower = TailFollower(Path("/test/log.log"))
+        assert follower._complete_lines("[a] [api] [INFO] one\n[a] [api] [IN") == ["[a] [api] [INFO] one"]
+        assert follower._complete_lines("FO] two") == []
+        assert follower._complete_lines("\n") == ["[a] [api] [INFO] two"]
+        assert follower._pending == ""
+
+    def test_wait_for_changes_falls_back_to_polling(self):
+        """Test that a failing watcher falls back to sleeping poll_interval."""
+        follower = TailFollower(Path("/test/log.log"), poll_interval_ms=100)
+        with patch("drtrace_service.cli.tail._watch_files", side_effect=OSError("no watches left")), \
+                patch("time.sleep") as mock_sleep:
+            waiter = follower._wait_for_changes()
+            next(waiter)
+            next(waiter)
+
+        assert mock_sleep.call_count == 2
+        mock_sleep.assert_called_with(0.1)
+
     def test_tail_log_file_not_found(self):
         """Test tail when log file doesn't exist."""
         path = Path("/nonexistent/log.log")
@@ -18,15 +18,24 @@ CREATE TABLE IF NOT EXISTS logs (
   stacktrace TEXT,
   context JSONB NOT NULL DEFAULT '{}'::jsonb
 );
-
-CREATE INDEX IF NOT EXISTS idx_logs_app_ts
-  ON logs (application_id, ts DESC);
-CREATE INDEX IF NOT EXISTS idx_logs_service_ts
-  ON logs (service_name, ts DESC);
-CREATE INDEX IF NOT EXISTS idx_logs_module_ts
-  ON logs (module_name, ts DESC);
 """
 
+# Index DDL runs one statement at a time in autocommit mode: CONCURRENTLY
+# cannot run inside a transaction block, and building concurrently keeps
+# writes to an existing logs table unblocked. If a concurrent build fails it
+# leaves an INVALID index that IF NOT EXISTS skips; drop it and rerun.
+INDEX_DDL = (
+  # Covering index for application-scoped time-range analysis: the level,
+  # service and module filters are evaluated from the index before any heap
+  # fetch. Supersedes the plain (application_id, ts DESC) index, which is
+  # dropped only after this one exists.
+  "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logs_app_ts_filters"
+  " ON logs (application_id, ts DESC) INCLUDE (level, service_name, module_name)",
+  "DROP INDEX CONCURRENTLY IF EXISTS idx_logs_app_ts",
+  "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logs_service_ts ON logs (service_name, ts DESC)",
+  "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_logs_module_ts ON logs (module_name, ts DESC)",
+)
+
 
 def main() -> None:
   dsn = os.getenv(
@@ -37,6 +46,10 @@ def main() -> None:
   try:
     with conn, conn.cursor() as cur:
       cur.execute(DDL)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+      for statement in INDEX_DDL:
+        cur.execute(statement)
   finally:
     conn.close()
 